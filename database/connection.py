@@ -1,8 +1,9 @@
 """PostgreSQL connection manager with pooling, retry logic, and data validation.
 
-Provides DatabaseManager for all DB operations: inserts (v1 + v2 schemas),
-queries, season clearing, and transfer detection. Records are validated
-before insertion, and metrics are split by prefix into JSONB columns.
+Provides DatabaseManager for all DB operations: inserts (v1 + v2 schemas,
+COPY-based bulk writes for v2), queries, season clearing, and transfer
+detection. Records are validated before insertion, and metrics are split
+by prefix into JSONB columns.
 """
 
 import os
@@ -10,8 +11,11 @@ import pandas as pd
 import numpy as np
 from sqlalchemy import create_engine, text
 from dotenv import load_dotenv
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Optional, Set
+import io
+import csv
 import json
+import hashlib
 import time
 import logging
 from functools import wraps
@@ -100,12 +104,101 @@ class DatabaseConfig:
         self.pool_recycle = int(os.getenv('DB_POOL_RECYCLE', '3600'))
         self.connect_timeout = int(os.getenv('DB_CONNECT_TIMEOUT', '10'))
 
+        # Rows buffered per COPY round trip by BulkWriterV2
+        self.copy_chunk_size = int(os.getenv('DB_COPY_CHUNK_SIZE', '500'))
+
     @property
     def connection_string(self) -> str:
         """Build SQLAlchemy PostgreSQL connection string."""
         return f"postgresql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
 
 
+# Column order used by COPY for each footballdecoded_v2 table (id/created_at/updated_at use defaults)
+V2_COPY_COLUMNS = {
+    'players': [
+        'unique_player_id', 'player_name', 'normalized_name',
+        'league', 'season', 'team', 'nationality', 'position',
+        'age', 'birth_year', 'fotmob_metrics', 'understat_metrics',
+        'transfermarkt_metrics', 'fotmob_id', 'fotmob_name',
+        'understat_id', 'understat_name', 'transfermarkt_id',
+        'data_quality_score', 'processing_warnings',
+    ],
+    'teams': [
+        'unique_team_id', 'team_name', 'normalized_name', 'league', 'season',
+        'fotmob_metrics', 'understat_metrics', 'understat_advanced',
+        'fotmob_id', 'fotmob_name', 'understat_name',
+        'data_quality_score', 'processing_warnings',
+    ],
+    'understat_team_matches': [
+        'unique_team_id', 'team_name', 'league', 'season', 'match_id',
+        'match_date', 'opponent', 'is_home', 'goals', 'goals_against',
+        'xg', 'xg_against', 'np_xg', 'np_xg_against', 'ppda', 'ppda_against',
+        'deep_completions', 'deep_completions_against', 'points',
+        'expected_points', 'np_xg_difference', 'result',
+        'forecast_win', 'forecast_draw', 'forecast_loss',
+    ],
+    'understat_shots': [
+        'league', 'season', 'match_id', 'shot_id', 'team', 'player',
+        'player_id', 'assist_player', 'minute', 'xg', 'location_x',
+        'location_y', 'body_part', 'situation', 'result',
+    ],
+}
+
+# Upsert conflict targets: columns + predicate column of each idx_v2_*_unique partial index
+V2_UNIQUE_KEYS = {
+    'players': (['unique_player_id', 'league', 'season', 'team'], 'unique_player_id'),
+    'teams': (['unique_team_id', 'league', 'season'], 'unique_team_id'),
+    'understat_team_matches': (['unique_team_id', 'match_id'], 'unique_team_id'),
+    'understat_shots': (['match_id', 'shot_id'], 'shot_id'),
+}
+
+V2_WRITE_MODES = ('append', 'upsert')
+
+COPY_NULL = r'\N'
+
+
+def _copy_value(value) -> str:
+    """Render a Python/numpy value as a COPY csv field (COPY_NULL for missing)."""
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, (list, tuple)):
+        return _pg_array(value)
+    if isinstance(value, (bool, np.bool_)):
+        return 't' if value else 'f'
+    if isinstance(value, np.integer):
+        return str(int(value))
+    if isinstance(value, (float, np.floating)):
+        if np.isnan(value):
+            return COPY_NULL
+        # Integral floats (e.g. IDs that went through a NaN column) must load into INTEGER columns
+        return str(int(value)) if float(value).is_integer() else repr(float(value))
+    if isinstance(value, pd.Timestamp):
+        return COPY_NULL if pd.isna(value) else value.isoformat()
+    if value is pd.NaT or value is pd.NA:
+        return COPY_NULL
+    return str(value)
+
+
+def v2_row_key(table: str, row: Dict[str, Any]) -> Optional[tuple]:
+    """Unique-key tuple of a prepared v2 row (None if its key predicate column is NULL)."""
+    key_columns, predicate = V2_UNIQUE_KEYS[table]
+    if row.get(predicate) is None:
+        return None
+    return tuple(_copy_value(row.get(col)) for col in key_columns)
+
+
+def _pg_array(values) -> str:
+    """Render a sequence as a PostgreSQL array literal (for TEXT[] columns)."""
+    items = []
+    for v in values:
+        if v is None:
+            items.append('NULL')
+        else:
+            escaped = str(v).replace('\\', '\\\\').replace('"', '\\"')
+            items.append(f'"{escaped}"')
+    return '{' + ','.join(items) + '}'
+
+
 class DatabaseManager:
     """Manages PostgreSQL connections, inserts, and queries for both v1 and v2 schemas."""
 
@@ -444,32 +537,77 @@ class DatabaseManager:
     # --- V2 methods (footballdecoded_v2 schema) ---
     # Flat dicts are split by prefix (fotmob_*, understat_*, transfermarkt_*) into JSONB columns.
 
+    def _player_v2_row(self, player_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Split a flat player dict into scalar columns + serialized fotmob/understat/transfermarkt JSONB."""
+        validated_data = validate_data_structure(player_data, 'player')
+
+        basic_fields = [
+            'unique_player_id', 'player_name', 'normalized_name',
+            'league', 'season', 'team', 'nationality', 'position',
+            'age', 'birth_year', 'fotmob_id', 'fotmob_name',
+            'understat_id', 'understat_name', 'transfermarkt_id',
+            'data_quality_score', 'processing_warnings',
+        ]
+
+        basic_data = {k: v for k, v in validated_data.items() if k in basic_fields}
+
+        fotmob_metrics = {k: v for k, v in validated_data.items() if k.startswith('fotmob_') and k not in basic_fields}
+        understat_metrics = {k: v for k, v in validated_data.items() if k.startswith('understat_') and k not in basic_fields}
+        transfermarkt_metrics = {k: v for k, v in validated_data.items() if k.startswith('transfermarkt_') and k not in basic_fields}
+
+        basic_data['fotmob_metrics'] = json.dumps(self._serialize_for_json(fotmob_metrics)) if fotmob_metrics else None
+        basic_data['understat_metrics'] = json.dumps(self._serialize_for_json(understat_metrics)) if understat_metrics else None
+        basic_data['transfermarkt_metrics'] = json.dumps(self._serialize_for_json(transfermarkt_metrics)) if transfermarkt_metrics else None
+        return basic_data
+
+    def _team_v2_row(self, team_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Split a flat team dict into scalar columns + serialized fotmob/understat/understat_advanced JSONB.
+
+        understat_adv_* keys go into a separate understat_advanced column (~200 keys).
+        """
+        validated_data = validate_data_structure(team_data, 'team')
+
+        basic_fields = [
+            'unique_team_id', 'team_name', 'normalized_name',
+            'league', 'season', 'fotmob_id', 'fotmob_name',
+            'understat_name', 'data_quality_score', 'processing_warnings',
+        ]
+
+        basic_data = {k: v for k, v in validated_data.items() if k in basic_fields}
+
+        fotmob_metrics = {k: v for k, v in validated_data.items() if k.startswith('fotmob_') and k not in basic_fields}
+        understat_metrics = {k: v for k, v in validated_data.items()
+                             if k.startswith('understat_') and not k.startswith('understat_adv_') and k not in basic_fields}
+        understat_advanced = {k: v for k, v in validated_data.items() if k.startswith('understat_adv_')}
+
+        basic_data['fotmob_metrics'] = json.dumps(self._serialize_for_json(fotmob_metrics)) if fotmob_metrics else None
+        basic_data['understat_metrics'] = json.dumps(self._serialize_for_json(understat_metrics)) if understat_metrics else None
+        basic_data['understat_advanced'] = json.dumps(self._serialize_for_json(understat_advanced)) if understat_advanced else None
+        return basic_data
+
+    def prepare_v2_row(self, table: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn a loader record into the column dict stored in footballdecoded_v2.{table}.
+
+        Players and teams are validated and their metrics serialized to JSONB text
+        here, once; match and shot records are already flat.
+        """
+        if table == 'players':
+            return self._player_v2_row(record)
+        if table == 'teams':
+            return self._team_v2_row(record)
+        if table in V2_COPY_COLUMNS:
+            return record
+        raise ValueError(f"Invalid v2 table: {table}")
+
     @retry_on_failure(max_retries=2, delay=0.5)
     def insert_player_v2(self, player_data: Dict[str, Any]) -> bool:
         """Insert player into footballdecoded_v2.players.
 
         Splits flat dict into scalar columns + fotmob/understat/transfermarkt JSONB.
+        For whole-league loads use bulk_writer_v2('players').
         """
         try:
-            validated_data = validate_data_structure(player_data, 'player')
-
-            basic_fields = [
-                'unique_player_id', 'player_name', 'normalized_name',
-                'league', 'season', 'team', 'nationality', 'position',
-                'age', 'birth_year', 'fotmob_id', 'fotmob_name',
-                'understat_id', 'understat_name', 'transfermarkt_id',
-                'data_quality_score', 'processing_warnings',
-            ]
-
-            basic_data = {k: v for k, v in validated_data.items() if k in basic_fields}
-
-            fotmob_metrics = {k: v for k, v in validated_data.items() if k.startswith('fotmob_') and k not in basic_fields}
-            understat_metrics = {k: v for k, v in validated_data.items() if k.startswith('understat_') and k not in basic_fields}
-            transfermarkt_metrics = {k: v for k, v in validated_data.items() if k.startswith('transfermarkt_') and k not in basic_fields}
-
-            basic_data['fotmob_metrics'] = json.dumps(self._serialize_for_json(fotmob_metrics)) if fotmob_metrics else None
-            basic_data['understat_metrics'] = json.dumps(self._serialize_for_json(understat_metrics)) if understat_metrics else None
-            basic_data['transfermarkt_metrics'] = json.dumps(self._serialize_for_json(transfermarkt_metrics)) if transfermarkt_metrics else None
+            basic_data = self._player_v2_row(player_data)
 
             df = pd.DataFrame([basic_data])
             df.to_sql('players', self.engine, schema='footballdecoded_v2',
@@ -485,27 +623,10 @@ class DatabaseManager:
         """Insert team into footballdecoded_v2.teams.
 
         Splits flat dict into scalar columns + fotmob/understat/understat_advanced JSONB.
-        understat_adv_* keys go into a separate understat_advanced column (~200 keys).
+        For whole-league loads use bulk_writer_v2('teams').
         """
         try:
-            validated_data = validate_data_structure(team_data, 'team')
-
-            basic_fields = [
-                'unique_team_id', 'team_name', 'normalized_name',
-                'league', 'season', 'fotmob_id', 'fotmob_name',
-                'understat_name', 'data_quality_score', 'processing_warnings',
-            ]
-
-            basic_data = {k: v for k, v in validated_data.items() if k in basic_fields}
-
-            fotmob_metrics = {k: v for k, v in validated_data.items() if k.startswith('fotmob_') and k not in basic_fields}
-            understat_metrics = {k: v for k, v in validated_data.items()
-                                 if k.startswith('understat_') and not k.startswith('understat_adv_') and k not in basic_fields}
-            understat_advanced = {k: v for k, v in validated_data.items() if k.startswith('understat_adv_')}
-
-            basic_data['fotmob_metrics'] = json.dumps(self._serialize_for_json(fotmob_metrics)) if fotmob_metrics else None
-            basic_data['understat_metrics'] = json.dumps(self._serialize_for_json(understat_metrics)) if understat_metrics else None
-            basic_data['understat_advanced'] = json.dumps(self._serialize_for_json(understat_advanced)) if understat_advanced else None
+            basic_data = self._team_v2_row(team_data)
 
             df = pd.DataFrame([basic_data])
             df.to_sql('teams', self.engine, schema='footballdecoded_v2',
@@ -528,19 +649,168 @@ class DatabaseManager:
             logger.error(f"Failed to insert v2 team match: {e}")
             raise
 
-    @retry_on_failure(max_retries=2, delay=0.5)
-    def insert_shots_v2(self, shots_df: pd.DataFrame) -> bool:
-        """Bulk insert shot events into footballdecoded_v2.understat_shots."""
+    def insert_shots_v2(self, shots_df: pd.DataFrame, mode: str = 'append') -> bool:
+        """Bulk insert shot events into footballdecoded_v2.understat_shots (single COPY)."""
         try:
             if shots_df.empty:
                 return True
-            shots_df.to_sql('understat_shots', self.engine, schema='footballdecoded_v2',
-                            if_exists='append', index=False, method='multi')
+            self.copy_rows_v2('understat_shots', shots_df.to_dict('records'), mode)
             return True
         except Exception as e:
             logger.error(f"Failed to insert v2 shots: {e}")
             raise
 
+    @retry_on_failure(max_retries=2, delay=0.5)
+    def copy_rows_v2(self, table: str, rows: List[Dict[str, Any]], mode: str = 'append') -> int:
+        """Write prepared rows to footballdecoded_v2.{table} with one COPY FROM STDIN.
+
+        Rows are dicts keyed by column (see prepare_v2_row); columns missing from
+        a row are loaded as NULL. Each row also stores content_hash (MD5 of its
+        values). Runs in a single transaction.
+
+        mode='append' COPYs straight into the table. mode='upsert' COPYs into a
+        temp staging table and merges it with INSERT ... ON CONFLICT on the
+        idx_v2_*_unique index, updating only rows whose content_hash changed.
+        Upserts never remove rows; see delete_stale_v2 for dropping rows that
+        are no longer upstream once a whole season has been merged.
+
+        Returns number of rows inserted or updated.
+        """
+        return self._copy_rows_v2(table, rows, mode)
+
+    def _copy_rows_v2(self, table: str, rows: List[Dict[str, Any]], mode: str) -> int:
+        """Single attempt of copy_rows_v2 (no retry)."""
+        if mode not in V2_WRITE_MODES:
+            raise ValueError(f"Invalid write mode: {mode}")
+        if not rows:
+            return 0
+
+        columns = V2_COPY_COLUMNS[table]
+        if mode == 'upsert':
+            rows = self._dedupe_v2_rows(table, rows)
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        for row in rows:
+            fields = [_copy_value(row.get(col)) for col in columns]
+            content_hash = hashlib.md5('\x1f'.join(fields).encode('utf-8')).hexdigest()
+            writer.writerow(fields + [content_hash])
+        buffer.seek(0)
+
+        column_list = ', '.join(columns + ['content_hash'])
+        target = f"footballdecoded_v2.{table}"
+        copy_options = f"FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"
+
+        raw_conn = self.engine.raw_connection()
+        try:
+            cursor = raw_conn.cursor()
+            try:
+                if mode == 'append':
+                    cursor.copy_expert(f"COPY {target} ({column_list}) {copy_options}", buffer)
+                    changed = len(rows)
+                else:
+                    stage = f"_stage_{table}"
+                    cursor.execute(f"CREATE TEMP TABLE {stage} ON COMMIT DROP AS "
+                                   f"SELECT {column_list} FROM {target} WITH NO DATA")
+                    cursor.copy_expert(f"COPY {stage} ({column_list}) {copy_options}", buffer)
+                    cursor.execute(self._merge_v2_sql(table, stage, column_list))
+                    changed = cursor.rowcount
+            finally:
+                cursor.close()
+            raw_conn.commit()
+        except Exception as e:
+            raw_conn.rollback()
+            logger.error(f"COPY into {target} failed ({len(rows)} rows, {mode}): {e}")
+            raise
+        finally:
+            raw_conn.close()
+
+        logger.debug(f"{mode}: {changed}/{len(rows)} rows changed in {target}")
+        return changed
+
+    def _dedupe_v2_rows(self, table: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Keep the last row per unique key (ON CONFLICT cannot touch a row twice per statement)."""
+        keyed = {}
+        unkeyed = []
+        for row in rows:
+            key = v2_row_key(table, row)
+            if key is None:
+                unkeyed.append(row)
+            else:
+                keyed[key] = row
+        return list(keyed.values()) + unkeyed
+
+    def _merge_v2_sql(self, table: str, stage: str, column_list: str) -> str:
+        """INSERT ... ON CONFLICT statement merging the staging table into footballdecoded_v2.{table}."""
+        key_columns, predicate = V2_UNIQUE_KEYS[table]
+        updates = ', '.join(f"{col} = EXCLUDED.{col}"
+                            for col in V2_COPY_COLUMNS[table] + ['content_hash']
+                            if col not in key_columns)
+        return (
+            f"INSERT INTO footballdecoded_v2.{table} AS t ({column_list}) "
+            f"SELECT {column_list} FROM {stage} "
+            f"ON CONFLICT ({', '.join(key_columns)}) WHERE {predicate} IS NOT NULL "
+            f"DO UPDATE SET {updates} "
+            f"WHERE t.content_hash IS DISTINCT FROM EXCLUDED.content_hash"
+        )
+
+    @retry_on_failure(max_retries=2, delay=1.0)
+    def delete_stale_v2(self, table: str, league: str, season: str, keys: Iterable[tuple]) -> int:
+        """Delete a league+season's keyed rows whose unique key is not in keys.
+
+        Run after a full season has been upserted, with the v2_row_key of every
+        row written, to drop rows that disappeared upstream or changed key
+        (e.g. a player who moved team). Rows with a NULL key predicate are kept.
+
+        Returns number of rows deleted.
+        """
+        key_columns, predicate = V2_UNIQUE_KEYS[table]
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerows(keys)
+        buffer.seek(0)
+
+        target = f"footballdecoded_v2.{table}"
+        keep = f"_keep_{table}"
+        column_list = ', '.join(key_columns)
+        # Predicate column is never NULL in keys; the others may be, so compare NULL-safely
+        matches = ' AND '.join(
+            f"k.{col} = t.{col}" if col == predicate else f"k.{col} IS NOT DISTINCT FROM t.{col}"
+            for col in key_columns
+        )
+
+        raw_conn = self.engine.raw_connection()
+        try:
+            cursor = raw_conn.cursor()
+            try:
+                cursor.execute(f"CREATE TEMP TABLE {keep} ON COMMIT DROP AS "
+                               f"SELECT {column_list} FROM {target} WITH NO DATA")
+                cursor.copy_expert(f"COPY {keep} ({column_list}) FROM STDIN "
+                                   f"WITH (FORMAT csv, NULL '{COPY_NULL}')", buffer)
+                cursor.execute(
+                    f"DELETE FROM {target} t WHERE t.league = %s AND t.season = %s "
+                    f"AND t.{predicate} IS NOT NULL "
+                    f"AND NOT EXISTS (SELECT 1 FROM {keep} k WHERE {matches})",
+                    (league, season),
+                )
+                deleted = cursor.rowcount
+            finally:
+                cursor.close()
+            raw_conn.commit()
+        except Exception as e:
+            raw_conn.rollback()
+            logger.error(f"Stale row cleanup in {target} failed for {league} {season}: {e}")
+            raise
+        finally:
+            raw_conn.close()
+
+        logger.info(f"Deleted {deleted} stale {table} rows for {league} {season}")
+        return deleted
+
+    def bulk_writer_v2(self, table: str, chunk_size: int = None, mode: str = 'append') -> 'BulkWriterV2':
+        """Create a BulkWriterV2 that buffers records and COPYs them into footballdecoded_v2.{table}."""
+        return BulkWriterV2(self, table, chunk_size or self.config.copy_chunk_size, mode)
+
     @retry_on_failure(max_retries=2, delay=1.0)
     def clear_season_data_v2(self, league: str, season: str, entity_type: str) -> int:
         """Delete all v2 records for a specific league+season.
@@ -570,6 +840,103 @@ class DatabaseManager:
             self.engine.dispose()
 
 
+class BulkWriterV2:
+    """Buffers v2 records and flushes them with COPY in chunks of chunk_size rows.
+
+    Records are validated/serialized on add(). A chunk that fails to write is
+    split in halves and retried, so only the offending rows are lost; they are
+    logged and counted in `failed` (their positions in the last flushed chunk
+    are kept in `last_failed`) instead of aborting the load. Use as a context manager
+    (or call flush()) so the last partial chunk is written. With mode='upsert'
+    only new or modified rows are written; `changed` counts them, and `keys`
+    holds the unique key of every row written (for delete_stale_v2).
+    """
+
+    def __init__(self, db: DatabaseManager, table: str, chunk_size: int = 500, mode: str = 'append'):
+        if table not in V2_COPY_COLUMNS:
+            raise ValueError(f"Invalid v2 table: {table}")
+        if mode not in V2_WRITE_MODES:
+            raise ValueError(f"Invalid write mode: {mode}")
+        self.db = db
+        self.table = table
+        self.chunk_size = max(1, int(chunk_size))
+        self.mode = mode
+        self.rows: List[Dict[str, Any]] = []
+        self.written = 0
+        self.changed = 0
+        self.failed = 0
+        self.last_failed: List[int] = []
+        self.keys: Set[tuple] = set()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __enter__(self) -> 'BulkWriterV2':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        return False
+
+    def add(self, record: Dict[str, Any]) -> int:
+        """Buffer one record; flushes when the chunk is full. Returns rows flushed (0 if buffered).
+
+        Raises ValueError if the record fails validation (nothing is buffered).
+        """
+        self.rows.append(self.db.prepare_v2_row(self.table, record))
+        if len(self.rows) >= self.chunk_size:
+            return self.flush()
+        return 0
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Buffer many records. Returns rows flushed along the way."""
+        return sum(self.add(record) for record in records)
+
+    def flush(self) -> int:
+        """COPY all buffered rows. Returns number of rows written."""
+        self.last_failed = []
+        if not self.rows:
+            return 0
+        rows, self.rows = self.rows, []
+        try:
+            self.changed += self.db.copy_rows_v2(self.table, rows, self.mode)
+        except Exception as e:
+            logger.warning(f"Bulk write of {len(rows)} rows to {self.table} failed, splitting chunk: {e}")
+            self._bisect(rows, 0)
+            if self.last_failed:
+                logger.error(f"Bulk write to {self.table} lost {len(self.last_failed)} rows")
+            written = len(rows) - len(self.last_failed)
+            self.written += written
+            return written
+        self._track(rows)
+        self.written += len(rows)
+        return len(rows)
+
+    def _track(self, rows: List[Dict[str, Any]]):
+        """Remember the unique keys of written rows."""
+        for row in rows:
+            key = v2_row_key(self.table, row)
+            if key is not None:
+                self.keys.add(key)
+
+    def _bisect(self, rows: List[Dict[str, Any]], offset: int):
+        """Write rows in halves until the failing ones are isolated (single attempts, no retry)."""
+        mid = len(rows) // 2
+        for start, part in ((0, rows[:mid]), (mid, rows[mid:])):
+            if not part:
+                continue
+            try:
+                self.changed += self.db._copy_rows_v2(self.table, part, self.mode)
+                self._track(part)
+            except Exception as e:
+                if len(part) > 1:
+                    self._bisect(part, offset + start)
+                else:
+                    self.failed += 1
+                    self.last_failed.append(offset + start)
+                    logger.debug(f"Rejected {self.table} row: {e}")
+
+
 def get_db_manager() -> DatabaseManager:
     """Create a connected DatabaseManager instance (convenience function)."""
     db = DatabaseManager()
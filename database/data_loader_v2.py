@@ -23,11 +23,12 @@ import hashlib
 import pickle
 import unicodedata
 import logging
+import queue
+import threading
 import warnings
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
 from pathlib import Path
 
 import numpy as np
@@ -46,12 +47,12 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from scrappers import FotMob, Understat
 from scrappers._config import LEAGUE_DICT
 from wrappers import (
-    understat_get_player, understat_get_team,
+    understat_get_team, understat_get_league_players, UnderstatPlayerMatcher,
     understat_get_team_advanced,
-    transfermarkt_get_player,
+    transfermarkt_get_player, transfermarkt_prefetch_players,
     fotmob_get_league_players, fotmob_get_league_teams,
 )
-from database.connection import DatabaseManager, get_db_manager
+from database.connection import DatabaseManager, get_db_manager, v2_row_key
 
 UNDERSTAT_LEAGUES = {
     'ENG-Premier League', 'ESP-La Liga', 'ITA-Serie A',
@@ -86,6 +87,9 @@ LOAD_CONFIG = {
     'line_width': 80,
     'parallel_workers': 3,
     'checkpoint_interval': 25,
+    'copy_chunk_size': 500,
+    'flush_interval': 60,  # seconds before a partial chunk is written (bounds checkpoint lag)
+    'write_mode': 'upsert',  # 'upsert': merge on unique keys, skip unchanged rows, drop stale rows; 'replace': clear season + append
     'checkpoint_dir': '.checkpoints_v2',
     'min_delay': 0.5,
     'max_delay': 3.0,
@@ -146,7 +150,7 @@ class AdaptiveRateLimit:
         self.min_delay = LOAD_CONFIG['min_delay']
         self.max_delay = LOAD_CONFIG['max_delay']
         self.response_times = []
-        self.lock = Lock()
+        self.lock = threading.Lock()
         self.consecutive_failures = 0
 
     def record(self, response_time: float, success: bool):
@@ -382,17 +386,197 @@ def _parse_season(season: str, league: str) -> str:
     return sc.parse(season)
 
 
+def _write_mode() -> str:
+    """DB write mode for the configured load mode ('replace' clears first, then appends)."""
+    return 'append' if LOAD_CONFIG['write_mode'] == 'replace' else 'upsert'
+
+
+def _prepare_season(db: DatabaseManager, competition: str, parsed_season: str, table: str) -> None:
+    """Clear the season's rows in 'replace' mode; upserts merge into them (see _prune_season)."""
+    if LOAD_CONFIG['write_mode'] != 'replace':
+        return
+    try:
+        db.clear_season_data_v2(competition, parsed_season, table)
+    except Exception as e:
+        logger.warning(f"Could not clear existing {table} data: {e}")
+
+
+def _prune_season(db: DatabaseManager, competition: str, parsed_season: str, table: str,
+                  keys: Set[tuple], stats: Dict[str, int], resumed: bool = False) -> None:
+    """After an upsert load, delete the season's rows that were not written this run.
+
+    Skipped unless the run covered the whole season cleanly (no failures, not
+    resumed from a checkpoint), so a partial load never deletes valid rows;
+    stale rows then survive until the next clean run.
+    """
+    if LOAD_CONFIG['write_mode'] == 'replace':
+        return
+    if resumed or stats.get('failed') or not keys:
+        logger.info(f"Keeping possibly stale {table} rows for {competition} {parsed_season} (incomplete load)")
+        return
+    try:
+        db.delete_stale_v2(table, competition, parsed_season, keys)
+    except Exception as e:
+        logger.warning(f"Could not delete stale {table} data: {e}")
+
+
+def _apply_write_failures(stats: Dict[str, int], writer) -> None:
+    """Move rows lost in failed COPY chunks from 'successful' to 'failed'."""
+    stats['successful'] -= writer.failed
+    stats['failed'] += writer.failed
+    logger.info(f"{writer.table}: {writer.written} rows written, {writer.changed} new or changed")
+
+
+class BatchedWriterThread:
+    """Feeds records into a BulkWriterV2 from a background thread.
+
+    Chunks are written when full or once flush_interval seconds have passed
+    since the last write. After every write the keys of the records it
+    covered are reported on `flushed` as (keys, ok) batches, with the rows
+    the writer lost reported separately as ok=False, so the producer can
+    checkpoint only rows that are actually in the DB.
+    """
+
+    def __init__(self, writer, flush_interval: float):
+        """Start the writer thread."""
+        self.writer = writer
+        self.flush_interval = flush_interval
+        self.inbox = queue.Queue()
+        self.flushed = queue.Queue()
+        self._pending = []
+        self._last_flush = time.time()
+        self._thread = threading.Thread(target=self._run, name=f"v2-writer-{writer.table}", daemon=True)
+        self._thread.start()
+
+    def put(self, key: Any, record: Dict[str, Any]):
+        """Queue a record for writing; key is reported back once it is flushed."""
+        self.inbox.put((key, record))
+
+    def close(self):
+        """Write everything still buffered and stop the thread."""
+        self.inbox.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            timeout = max(0.0, self._last_flush + self.flush_interval - time.time())
+            try:
+                item = self.inbox.get(timeout=timeout)
+            except queue.Empty:
+                self._flush()
+                continue
+            if item is None:
+                self._flush()
+                return
+
+            key, record = item
+            try:
+                self.writer.add(record)
+            except Exception as e:
+                logger.debug(f"Rejected {self.writer.table} record {key}: {e}")
+                self.flushed.put(([key], False))
+                continue
+            self._pending.append(key)
+            if len(self.writer) == 0:
+                # add() filled the chunk and wrote it
+                self._report()
+            elif time.time() - self._last_flush >= self.flush_interval:
+                self._flush()
+
+    def _flush(self):
+        self.writer.flush()
+        self._report()
+
+    def _report(self):
+        """Report the pending keys of the chunk just written, split by outcome."""
+        self._last_flush = time.time()
+        if self._pending:
+            lost = set(self.writer.last_failed)
+            written = [k for i, k in enumerate(self._pending) if i not in lost]
+            failed = [k for i, k in enumerate(self._pending) if i in lost]
+            if written:
+                self.flushed.put((written, True))
+            if failed:
+                self.flushed.put((failed, False))
+            self._pending = []
+
+
+def _merge_understat(record: Dict[str, Any], us_data: Dict[str, Any], team_name: str):
+    """Copy Understat identity + understat_* metrics into a player record."""
+    record['understat_name'] = us_data.get('official_player_name', record['player_name'])
+    record['understat_id'] = us_data.get('understat_player_id')
+    if team_name == 'Unknown' and us_data.get('team'):
+        record['team'] = us_data['team']
+    for k, v in us_data.items():
+        if k.startswith('understat_') and v is not None and not (isinstance(v, float) and np.isnan(v)):
+            record[k] = v
+
+
+def _understat_league_join(names: pd.Series, teams: pd.Series,
+                           competition: str, season: str) -> Dict[int, Dict[str, Any]]:
+    """Match FotMob players to the league's Understat table in one pass.
+
+    Uses UnderstatPlayerMatcher (exact -> token -> fuzzy, team-disambiguated).
+    Returns {row position: Understat data} for matched rows only.
+    """
+    us_df = understat_get_league_players(competition, season)
+    if us_df is None or us_df.empty:
+        return {}
+
+    matcher = UnderstatPlayerMatcher(us_df)
+    mapping = matcher.match(names.tolist(), teams.where(teams != 'Unknown', None).tolist())
+    matched = mapping[mapping['understat_row'] >= 0]
+    if matched.empty:
+        return {}
+
+    us_rows = matcher.players.iloc[matched['understat_row'].to_numpy()]
+    rows = us_rows.astype(object).where(us_rows.notna(), None).to_dict('records')
+    logger.debug(f"Understat match types: {matched['match_type'].value_counts().to_dict()}")
+    return dict(zip(matched.index.tolist(), rows))
+
+
+def _enrich_player(record: Dict[str, Any], competition: str, season: str) -> Dict[str, Any]:
+    """Worker task: Transfermarkt enrich + IDs."""
+    player_name = record['player_name']
+
+    birth_year = record.get('birth_year')
+    try:
+        tm_data = transfermarkt_get_player(player_name, competition, season, birth_year=birth_year)
+        if tm_data:
+            record['transfermarkt_id'] = str(tm_data.get('transfermarkt_player_id', ''))
+            # Transfermarkt positions are more granular than FotMob
+            tm_position = tm_data.get('transfermarkt_position_specific')
+            if tm_position:
+                record['position'] = tm_position
+            for k, v in tm_data.items():
+                record[k] = v
+    except Exception as e:
+        logger.debug(f"Transfermarkt enrich failed for {player_name}: {e}")
+
+    record['normalized_name'] = DataNormalizer().normalize_name(player_name)
+    record['unique_player_id'] = IDGenerator.player_id(
+        player_name, record.get('birth_year'), record.get('nationality')
+    )
+    record['data_quality_score'] = 1.0
+    record['processing_warnings'] = []
+    return record
+
+
 def load_players(competition: str, season: str, log: LogManager, db: DatabaseManager) -> Dict[str, int]:
-    """Load players: FotMob bulk -> Understat merge (Big 5) -> Transfermarkt enrich -> DB."""
-    normalizer = DataNormalizer()
-    rate_limiter = AdaptiveRateLimit()
+    """Load players: FotMob bulk -> Understat league join (Big 5) -> Transfermarkt enrich -> DB.
+
+    Stages: the Understat merge is one matcher pass over the league table; Transfermarkt
+    search and profile pages are prefetched in bulk, then lookups run on
+    LOAD_CONFIG['parallel_workers'] threads (paced by the shared Transfermarkt rate
+    limiter); records are written by a BatchedWriterThread.
+    Checkpoints only list players whose rows were flushed, and the resume index
+    never moves past a player whose row failed to write, so out-of-order
+    completion or a lost chunk never marks an unwritten player as done.
+    """
     parsed_season = _parse_season(season, competition)
     stats = {'total': 0, 'successful': 0, 'failed': 0}
 
-    try:
-        db.clear_season_data_v2(competition, parsed_season, 'players')
-    except Exception as e:
-        logger.warning(f"Could not clear existing player data: {e}")
+    _prepare_season(db, competition, parsed_season, 'players')
 
     try:
         players_df = fotmob_get_league_players(competition, season)
@@ -419,104 +603,132 @@ def load_players(competition: str, season: str, log: LogManager, db: DatabaseMan
 
     checkpoint = CheckpointManager(competition, season, 'players')
     prev = checkpoint.load_progress()
-    processed = prev['processed'] if prev else []
+    processed = list(prev['processed']) if prev else []
     start_idx = prev['current_index'] if prev else 0
     if prev:
         stats.update(prev['stats'])
+    done_names = set(processed)
 
-    start_time = time.time()
-
+    # Stage 1: FotMob base records
+    records: Dict[int, Dict[str, Any]] = {}
+    settled = set()  # row positions that need no further work (written, failed or skipped)
+    skip_cols = {'name', 'league', 'season', 'fotmob_id', 'fotmob_team_id'}
     for i, (_, row) in enumerate(players_df.iterrows()):
-        if i < start_idx:
-            continue
-
         player_name = row.get('name', '')
-        if not player_name or player_name in processed:
+        if i < start_idx or not player_name or player_name in done_names:
+            settled.add(i)
             continue
 
-        t0 = time.time()
-
+        fotmob_team_id = row.get('fotmob_team_id')
+        team_name = 'Unknown'
+        if fotmob_team_id is not None and pd.notna(fotmob_team_id):
+            team_name = team_id_to_name.get(int(fotmob_team_id), 'Unknown')
+
+        record = {
+            'player_name': player_name,
+            'league': competition,
+            'season': parsed_season,
+            'team': team_name,
+            'fotmob_name': player_name,
+            'fotmob_id': int(row['fotmob_id']) if pd.notna(row.get('fotmob_id')) else None,
+        }
+        for col in row.index:
+            if col in skip_cols:
+                continue
+            val = row[col]
+            if pd.notna(val):
+                record[col] = val if not hasattr(val, 'item') else val.item()
+        records[i] = record
+
+    # Stage 2: Understat merge as one league-wide match
+    understat_matched = set()
+    if _has_understat(competition) and records:
+        positions = sorted(records)
         try:
-            fotmob_team_id = row.get('fotmob_team_id')
-            team_name = 'Unknown'
-            if fotmob_team_id is not None and pd.notna(fotmob_team_id):
-                team_name = team_id_to_name.get(int(fotmob_team_id), 'Unknown')
-
-            record = {
-                'player_name': player_name,
-                'league': competition,
-                'season': parsed_season,
-                'team': team_name,
-                'fotmob_name': player_name,
-                'fotmob_id': int(row['fotmob_id']) if pd.notna(row.get('fotmob_id')) else None,
-            }
-
-            skip_cols = {'name', 'league', 'season', 'fotmob_id', 'fotmob_team_id'}
-            for col in row.index:
-                if col in skip_cols:
-                    continue
-                val = row[col]
-                if pd.notna(val):
-                    record[col] = val if not hasattr(val, 'item') else val.item()
-
-            if _has_understat(competition):
-                try:
-                    us_data = understat_get_player(player_name, competition, season,
-                                                    team_name=team_name if team_name != 'Unknown' else None)
-                    if us_data:
-                        record['understat_name'] = us_data.get('official_player_name', player_name)
-                        record['understat_id'] = us_data.get('understat_player_id')
-                        if team_name == 'Unknown' and us_data.get('team'):
-                            record['team'] = us_data['team']
-                        for k, v in us_data.items():
-                            if k.startswith('understat_'):
-                                record[k] = v
-                except Exception as e:
-                    logger.debug(f"Understat merge failed for {player_name}: {e}")
-
-            birth_year = record.get('birth_year')
-            try:
-                tm_data = transfermarkt_get_player(player_name, competition, season, birth_year=birth_year)
-                if tm_data:
-                    record['transfermarkt_id'] = str(tm_data.get('transfermarkt_player_id', ''))
-                    # Transfermarkt positions are more granular than FotMob
-                    tm_position = tm_data.get('transfermarkt_position_specific')
-                    if tm_position:
-                        record['position'] = tm_position
-                    for k, v in tm_data.items():
-                        record[k] = v
-            except Exception as e:
-                logger.debug(f"Transfermarkt enrich failed for {player_name}: {e}")
-
-            record['normalized_name'] = normalizer.normalize_name(player_name)
-            record['unique_player_id'] = IDGenerator.player_id(
-                player_name, record.get('birth_year'), record.get('nationality')
+            joined = _understat_league_join(
+                pd.Series([records[p]['player_name'] for p in positions]),
+                pd.Series([records[p]['team'] for p in positions]),
+                competition, season,
             )
-            record['data_quality_score'] = 1.0
-            record['processing_warnings'] = []
-
-            db.insert_player_v2(record)
-            stats['successful'] += 1
-            processed.append(player_name)
-            rate_limiter.record(time.time() - t0, True)
-            state = f"OK ({time.time() - t0:.1f}s)"
-
         except Exception as e:
-            stats['failed'] += 1
-            rate_limiter.record(time.time() - t0, False)
-            state = f"FAIL: {str(e)[:30]}"
-            logger.debug(f"Failed to process player {player_name}: {e}")
-
-        elapsed = time.time() - start_time
-        done = i - start_idx + 1
-        eta = int((stats['total'] - i - 1) * (elapsed / max(done, 1)))
-        log.progress(i + 1, stats['total'], player_name, stats['failed'], 'Player', state, eta)
+            logger.warning(f"Understat league join failed for {competition} {season}: {e}")
+            joined = {}
+        for j, us_data in joined.items():
+            pos = positions[j]
+            _merge_understat(records[pos], us_data, records[pos]['team'])
+            understat_matched.add(pos)
+        logger.info(f"Understat join matched {len(understat_matched)}/{len(records)} players")
+
+    # Stage 3: bulk Transfermarkt fetch, so the per-player enrich below reads from cache
+    if records:
+        try:
+            resolved = transfermarkt_prefetch_players(
+                [(r['player_name'], r.get('birth_year')) for r in records.values()], season
+            )
+            logger.info(f"Transfermarkt prefetch resolved {resolved}/{len(records)} players")
+        except Exception as e:
+            logger.warning(f"Transfermarkt prefetch failed for {competition} {season}: {e}")
 
-        if len(processed) % LOAD_CONFIG['checkpoint_interval'] == 0:
-            checkpoint.save_progress(processed, stats, i + 1)
+    # Stage 4 + 5: parallel Transfermarkt enrich, batched writes on a separate thread
+    writer = BatchedWriterThread(
+        db.bulk_writer_v2('players', LOAD_CONFIG['copy_chunk_size'], _write_mode()),
+        LOAD_CONFIG['flush_interval'],
+    )
 
-        rate_limiter.wait()
+    def settle_flushed():
+        saved = False
+        while True:
+            try:
+                keys, ok = writer.flushed.get_nowait()
+            except queue.Empty:
+                break
+            for pos, name in keys:
+                if ok:
+                    settled.add(pos)
+                    processed.append(name)
+                else:
+                    # Left unsettled: the watermark stops here so a resume retries it
+                    stats['successful'] -= 1
+                    stats['failed'] += 1
+            saved = True
+        if saved:
+            # Resume index = first row not yet settled; later rows are covered by `processed`
+            watermark = 0
+            while watermark in settled:
+                watermark += 1
+            checkpoint.save_progress(processed, stats, watermark)
 
+    start_time = time.time()
+    done = 0
+    with ThreadPoolExecutor(max_workers=LOAD_CONFIG['parallel_workers']) as executor:
+        futures = {
+            executor.submit(_enrich_player, record, competition, season): pos
+            for pos, record in records.items()
+        }
+        for future in as_completed(futures):
+            pos = futures[future]
+            player_name = records[pos]['player_name']
+            try:
+                writer.put((pos, player_name), future.result())
+                stats['successful'] += 1
+                state = "OK"
+            except Exception as e:
+                stats['failed'] += 1
+                settled.add(pos)
+                state = f"FAIL: {str(e)[:30]}"
+                logger.debug(f"Failed to process player {player_name}: {e}")
+
+            done += 1
+            elapsed = time.time() - start_time
+            eta = int((len(records) - done) * (elapsed / done))
+            log.progress(stats['total'] - len(records) + done, stats['total'], player_name,
+                         stats['failed'], 'Player', state, eta)
+            settle_flushed()
+
+    writer.close()
+    settle_flushed()
+    logger.info(f"players: {writer.writer.written} rows written, {writer.writer.changed} new or changed")
+    _prune_season(db, competition, parsed_season, 'players', writer.writer.keys, stats, resumed=bool(prev))
     log.progress_complete(stats['total'])
     checkpoint.clear()
     return stats
@@ -529,10 +741,7 @@ def load_teams(competition: str, season: str, log: LogManager, db: DatabaseManag
     parsed_season = _parse_season(season, competition)
     stats = {'total': 0, 'successful': 0, 'failed': 0}
 
-    try:
-        db.clear_season_data_v2(competition, parsed_season, 'teams')
-    except Exception as e:
-        logger.warning(f"Could not clear existing team data: {e}")
+    _prepare_season(db, competition, parsed_season, 'teams')
 
     try:
         teams_df = fotmob_get_league_teams(competition, season)
@@ -548,6 +757,7 @@ def load_teams(competition: str, season: str, log: LogManager, db: DatabaseManag
     log.phase_start(f"Teams ({competition})", len(teams_df))
 
     start_time = time.time()
+    writer = db.bulk_writer_v2('teams', LOAD_CONFIG['copy_chunk_size'], _write_mode())
 
     for i, (_, row) in enumerate(teams_df.iterrows()):
         team_name = row.get('name', '')
@@ -598,7 +808,7 @@ def load_teams(competition: str, season: str, log: LogManager, db: DatabaseManag
             record['data_quality_score'] = 1.0
             record['processing_warnings'] = []
 
-            db.insert_team_v2(record)
+            writer.add(record)
             stats['successful'] += 1
             rate_limiter.record(time.time() - t0, True)
             state = f"OK ({time.time() - t0:.1f}s)"
@@ -615,6 +825,9 @@ def load_teams(competition: str, season: str, log: LogManager, db: DatabaseManag
         log.progress(done, stats['total'], team_name, stats['failed'], 'Team', state, eta)
         rate_limiter.wait()
 
+    writer.flush()
+    _apply_write_failures(stats, writer)
+    _prune_season(db, competition, parsed_season, 'teams', writer.keys, stats)
     log.progress_complete(stats['total'])
     return stats
 
@@ -629,10 +842,7 @@ def load_understat_matches(competition: str, season: str, log: LogManager, db: D
     parsed_season = _parse_season(season, competition)
     stats = {'successful': 0, 'failed': 0}
 
-    try:
-        db.clear_season_data_v2(competition, parsed_season, 'understat_team_matches')
-    except Exception:
-        pass
+    _prepare_season(db, competition, parsed_season, 'understat_team_matches')
 
     try:
         us = Understat(leagues=[competition], seasons=[season])
@@ -646,6 +856,7 @@ def load_understat_matches(competition: str, season: str, log: LogManager, db: D
 
     match_stats = match_stats.reset_index()
     print(f"Loading {len(match_stats)} match records...")
+    writer = db.bulk_writer_v2('understat_team_matches', LOAD_CONFIG['copy_chunk_size'], _write_mode())
 
     for _, row in match_stats.iterrows():
         try:
@@ -681,7 +892,7 @@ def load_understat_matches(competition: str, season: str, log: LogManager, db: D
             ag = home_record.get('goals_against') or 0
             home_record['result'] = 'W' if hg > ag else ('D' if hg == ag else 'L')
 
-            db.insert_team_match_v2(home_record)
+            writer.add(home_record)
             stats['successful'] += 1
 
             away_record = {
@@ -711,13 +922,16 @@ def load_understat_matches(competition: str, season: str, log: LogManager, db: D
             hg2 = away_record.get('goals_against') or 0
             away_record['result'] = 'W' if ag2 > hg2 else ('D' if ag2 == hg2 else 'L')
 
-            db.insert_team_match_v2(away_record)
+            writer.add(away_record)
             stats['successful'] += 1
 
         except Exception as e:
             stats['failed'] += 1
             logger.debug(f"Failed to insert match record: {e}")
 
+    writer.flush()
+    _apply_write_failures(stats, writer)
+    _prune_season(db, competition, parsed_season, 'understat_team_matches', writer.keys, stats)
     print(f"  Loaded {stats['successful']} match records ({stats['failed']} failed)")
     return stats
 
@@ -730,10 +944,7 @@ def load_understat_shots(competition: str, season: str, log: LogManager, db: Dat
     parsed_season = _parse_season(season, competition)
     stats = {'successful': 0, 'failed': 0}
 
-    try:
-        db.clear_season_data_v2(competition, parsed_season, 'understat_shots')
-    except Exception:
-        pass
+    _prepare_season(db, competition, parsed_season, 'understat_shots')
 
     try:
         us = Understat(leagues=[competition], seasons=[season])
@@ -774,11 +985,14 @@ def load_understat_shots(competition: str, season: str, log: LogManager, db: Dat
     if insert_records:
         try:
             insert_df = pd.DataFrame(insert_records)
-            db.insert_shots_v2(insert_df)
+            db.insert_shots_v2(insert_df, _write_mode())
             stats['successful'] = len(insert_records)
         except Exception as e:
             logger.error(f"Failed to bulk insert shots: {e}")
             stats['failed'] = len(insert_records)
+        else:
+            keys = {v2_row_key('understat_shots', r) for r in insert_df.to_dict('records')} - {None}
+            _prune_season(db, competition, parsed_season, 'understat_shots', keys, stats)
 
     print(f"  Loaded {stats['successful']} shots ({stats['failed']} failed)")
     return stats
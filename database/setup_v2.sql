@@ -50,6 +50,7 @@ CREATE TABLE IF NOT EXISTS footballdecoded_v2.players (
     transfermarkt_id VARCHAR(20),                   -- Transfermarkt player ID
     data_quality_score DECIMAL(3,2) DEFAULT 1.00,   -- 0.00-1.00 quality indicator
     processing_warnings TEXT[],                     -- Array of issues found during load
+    content_hash CHAR(32),                          -- MD5 of loaded values (upsert skips unchanged rows)
     created_at TIMESTAMP DEFAULT NOW(),
     updated_at TIMESTAMP DEFAULT NOW()
 );
@@ -77,6 +78,7 @@ CREATE TABLE IF NOT EXISTS footballdecoded_v2.teams (
     understat_name VARCHAR(200),
     data_quality_score DECIMAL(3,2) DEFAULT 1.00,
     processing_warnings TEXT[],
+    content_hash CHAR(32),
     created_at TIMESTAMP DEFAULT NOW(),
     updated_at TIMESTAMP DEFAULT NOW()
 );
@@ -114,6 +116,7 @@ CREATE TABLE IF NOT EXISTS footballdecoded_v2.understat_team_matches (
     forecast_win DECIMAL(4,3),                      -- Pre-match win probability
     forecast_draw DECIMAL(4,3),
     forecast_loss DECIMAL(4,3),
+    content_hash CHAR(32),
     created_at TIMESTAMP DEFAULT NOW()
 );
 
@@ -139,11 +142,21 @@ CREATE TABLE IF NOT EXISTS footballdecoded_v2.understat_shots (
     body_part VARCHAR(20),                          -- Right Foot, Left Foot, Other
     situation VARCHAR(30),                          -- Open Play, Set Piece, From Corner...
     result VARCHAR(30),                             -- Goal, Saved Shot, Blocked Shot...
+    content_hash CHAR(32),
     created_at TIMESTAMP DEFAULT NOW()
 );
 
 -- ====================================================================
--- UNIQUE INDEXES (prevent duplicate records)
+-- MIGRATIONS (columns added after the first release)
+-- ====================================================================
+
+ALTER TABLE footballdecoded_v2.players ADD COLUMN IF NOT EXISTS content_hash CHAR(32);
+ALTER TABLE footballdecoded_v2.teams ADD COLUMN IF NOT EXISTS content_hash CHAR(32);
+ALTER TABLE footballdecoded_v2.understat_team_matches ADD COLUMN IF NOT EXISTS content_hash CHAR(32);
+ALTER TABLE footballdecoded_v2.understat_shots ADD COLUMN IF NOT EXISTS content_hash CHAR(32);
+
+-- ====================================================================
+-- UNIQUE INDEXES (prevent duplicate records, upsert conflict targets)
 -- ====================================================================
 
 -- One player per team per league per season
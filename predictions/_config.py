@@ -133,6 +133,18 @@ VENUES: Dict[str, Dict] = {
 
 HOST_COUNTRIES = {"United States", "Mexico", "Canada"}
 
+# Alternative spellings of team names across sources (alias -> name used here).
+# Resolved in both directions by features.RankingsIndex.
+TEAM_NAME_ALIASES: Dict[str, str] = {
+    "USA": "United States",
+    "Korea Republic": "South Korea",
+    "Côte d'Ivoire": "Ivory Coast",
+    "Cote d'Ivoire": "Ivory Coast",
+    "Congo DR": "DR Congo",
+    "IR Iran": "Iran",
+    "Türkiye": "Turkey",
+}
+
 # --------------------------------------------------------------------------
 # Historical tournament data for backtesting
 # --------------------------------------------------------------------------
@@ -169,6 +181,7 @@ BACKTEST_TOURNAMENTS = {
 DC_DECAY_RATE = 0.0065       # Exponential decay (half-life ~107 matches, ~2 years)
 DC_MAX_GOALS = 8             # Max goals per team in score matrix
 DC_RHO_INIT = -0.13          # Initial rho correction for low scores
+DC_OPTIMIZER = "L-BFGS-B"    # Or "trust-ncg" (Newton with sparse Hessian)
 
 # Ensemble weights (Dixon-Coles vs GBM)
 ENSEMBLE_W_DC = 0.65
@@ -185,8 +198,11 @@ GBM_PARAMS = {
 }
 
 # Monte Carlo
-MC_SIMULATIONS = 100_000
+MC_SIMULATIONS = 100_000     # Fixed run size, or upper bound when MC_TOLERANCE is set
 MC_SEED = 42
+MC_BATCH_SIZE = 10_000       # Simulations per convergence check
+MC_TOLERANCE = 0.0025        # Stop once every p_champion/p_final 95% CI half-width is below this
+MC_CONFIDENCE_Z = 1.96       # z-score for the CI half-width (95%)
 
 # Extra time / penalties (based on WC 2006-2022 knockout data)
 ET_PROB = 0.65               # P(decided in extra time | draw after 90 min)
@@ -51,17 +51,15 @@ def collect_rankings_by_year(
     -------
     Dict mapping year -> rankings DataFrame.
     """
-    from wrappers.elo_data import get_rankings
-
-    rankings = {}
-    for year in range(start_year, end_year + 1):
-        try:
-            df = get_rankings(year=year)
-            if not df.empty:
-                rankings[year] = df
-                logger.debug("Rankings for %d: %d teams", year, len(df))
-        except Exception as e:
-            logger.warning("Could not fetch rankings for %d: %s", year, e)
+    from wrappers.elo_data import get_rankings_range
+
+    try:
+        rankings = get_rankings_range(start_year, end_year)
+    except Exception as e:
+        logger.warning("Could not fetch rankings for %d-%d: %s", start_year, end_year, e)
+        rankings = {}
+    for year, df in rankings.items():
+        logger.debug("Rankings for %d: %d teams", year, len(df))
 
     logger.info("Collected rankings for %d years", len(rankings))
     return rankings
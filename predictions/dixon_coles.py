@@ -2,7 +2,8 @@
 
 Estimates attack/defense strength parameters per team via maximum likelihood,
 with time-weighted decay and rho correction for low-scoring results.
-Uses scipy.optimize.minimize (L-BFGS-B) -- no extra ML dependencies needed.
+Uses scipy.optimize.minimize (L-BFGS-B, or trust-region Newton) with an
+analytic gradient and sparse Hessian -- no extra ML dependencies needed.
 
 References:
     Dixon & Coles (1997): "Modelling Association Football Scores and
@@ -10,17 +11,20 @@ References:
 """
 
 import logging
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from scipy import sparse
 from scipy.optimize import minimize
-from scipy.stats import poisson
 
-from ._config import DC_DECAY_RATE, DC_MAX_GOALS, DC_RHO_INIT
+from ._config import DC_DECAY_RATE, DC_MAX_GOALS, DC_OPTIMIZER, DC_RHO_INIT
 
 logger = logging.getLogger(__name__)
 
+# Columns kept from the training frame so update() can append new results
+_TRAIN_COLUMNS = ["team1", "team2", "team1_score", "team2_score", "date", "venue"]
+
 
 class DixonColesModel:
     """Bivariate Poisson model with time-weighted decay and rho correction.
@@ -31,20 +35,32 @@ class DixonColesModel:
         Exponential decay rate for older matches (default from config).
     max_goals : int
         Maximum goals per team in the score probability matrix.
+    optimizer : str
+        "L-BFGS-B" (quasi-Newton with analytic gradient) or "trust-ncg"
+        (trust-region Newton using the sparse analytic Hessian).
     """
 
     def __init__(
         self,
         decay_rate: float = DC_DECAY_RATE,
         max_goals: int = DC_MAX_GOALS,
+        optimizer: str = DC_OPTIMIZER,
     ):
+        if optimizer not in ("L-BFGS-B", "trust-ncg"):
+            raise ValueError(f"Unsupported optimizer: {optimizer}")
         self.decay_rate = decay_rate
         self.max_goals = max_goals
+        self.optimizer = optimizer
         self.params: Optional[Dict[str, float]] = None
         self.teams: list = []
+        self._train_df = pd.DataFrame()
         self._fitted = False
 
-    def fit(self, matches_df: pd.DataFrame) -> "DixonColesModel":
+    def fit(
+        self,
+        matches_df: pd.DataFrame,
+        warm_start: Optional["DixonColesModel"] = None,
+    ) -> "DixonColesModel":
         """Fit attack/defense parameters on historical match results.
 
         Parameters
@@ -52,6 +68,9 @@ class DixonColesModel:
         matches_df : pd.DataFrame
             Must contain: team1, team2, team1_score, team2_score, date.
             Optionally: venue ('Home' or 'Neutral').
+        warm_start : DixonColesModel, optional
+            Fitted model whose parameters seed the optimizer. Teams it has
+            not seen start at average strength.
 
         Returns
         -------
@@ -94,15 +113,40 @@ class DixonColesModel:
         x0[n_teams:2*n_teams] = 0.0  # log(defense) ~ 0 -> defense ~ 1
         x0[-2] = 0.2              # home advantage
         x0[-1] = DC_RHO_INIT      # rho
-
-        # Optimize
-        result = minimize(
-            self._neg_log_likelihood,
-            x0,
-            args=(home_idx, away_idx, home_goals, away_goals, weights, is_home, n_teams),
-            method="L-BFGS-B",
-            options={"maxiter": 500, "disp": False},
-        )
+        if warm_start is not None and warm_start._fitted:
+            x0 = self._warm_start_params(warm_start, n_teams)
+
+        # Optimize with the exact gradient (and sparse Hessian for trust-ncg)
+        args = (home_idx, away_idx, home_goals, away_goals, weights, is_home, n_teams)
+        if self.optimizer == "trust-ncg":
+            # Build the sparse Hessian once per iterate; CG only needs H @ p
+            hess_cache = {}
+
+            def hessp(x, p, *hess_args):
+                key = x.tobytes()
+                if hess_cache.get("key") != key:
+                    hess_cache["key"] = key
+                    hess_cache["hess"] = self._neg_log_likelihood_hess(x, *hess_args)
+                return hess_cache["hess"] @ p
+
+            result = minimize(
+                self._neg_log_likelihood_and_grad,
+                x0,
+                args=args,
+                jac=True,
+                hessp=hessp,
+                method="trust-ncg",
+                options={"maxiter": 200, "gtol": 1e-6, "disp": False},
+            )
+        else:
+            result = minimize(
+                self._neg_log_likelihood_and_grad,
+                x0,
+                args=args,
+                jac=True,
+                method="L-BFGS-B",
+                options={"maxiter": 500, "disp": False},
+            )
 
         if not result.success:
             logger.warning("Dixon-Coles optimization did not converge: %s", result.message)
@@ -126,12 +170,47 @@ class DixonColesModel:
             "rho": rho,
         }
         self._fitted = True
+        self._train_df = df[[c for c in _TRAIN_COLUMNS if c in df.columns]].reset_index(drop=True)
         logger.info(
-            "Dixon-Coles fitted: %d teams, %d matches, home_adv=%.3f, rho=%.3f",
-            n_teams, len(df), home_adv, rho,
+            "Dixon-Coles fitted: %d teams, %d matches, home_adv=%.3f, rho=%.3f (%d iterations%s)",
+            n_teams, len(df), home_adv, rho, result.nit,
+            ", warm start" if warm_start is not None else "",
         )
         return self
 
+    def update(self, new_matches_df: pd.DataFrame) -> "DixonColesModel":
+        """Refit after appending new results, warm-started from current fit.
+
+        New matches are merged with the stored training set (duplicates
+        dropped), time-decay weights are recomputed against the new most
+        recent date, and the optimizer starts from the current parameters,
+        so a small batch of fresh fixtures converges in a few iterations.
+
+        Parameters
+        ----------
+        new_matches_df : pd.DataFrame
+            Same columns as fit(). Teams not seen before are added.
+
+        Returns
+        -------
+        self
+        """
+        self._check_fitted()
+        if getattr(self, "_train_df", pd.DataFrame()).empty:
+            raise RuntimeError("No stored training matches (model fitted by an older version). Call fit() instead.")
+        new_df = new_matches_df.copy()
+        if "date" in new_df.columns:
+            new_df["date"] = pd.to_datetime(new_df["date"], errors="coerce")
+        combined = pd.concat([self._train_df, new_df], ignore_index=True)
+        key_cols = [c for c in ("date", "team1", "team2") if c in combined.columns]
+        combined = combined.drop_duplicates(subset=key_cols, keep="last")
+
+        previous = DixonColesModel(self.decay_rate, self.max_goals, self.optimizer)
+        previous.params = self.params
+        previous.teams = self.teams
+        previous._fitted = True
+        return self.fit(combined, warm_start=previous)
+
     def predict_score_matrix(
         self,
         team_a: str,
@@ -155,67 +234,45 @@ class DixonColesModel:
             Shape (max_goals+1, max_goals+1) probability matrix.
         """
         self._check_fitted()
-        att_a = self.params["attack"].get(team_a, 1.0)
-        def_a = self.params["defense"].get(team_a, 1.0)
-        att_b = self.params["attack"].get(team_b, 1.0)
-        def_b = self.params["defense"].get(team_b, 1.0)
-        rho = self.params["rho"]
-        home_adv = 0.0 if neutral else self.params["home_advantage"]
-
-        # Expected goals
-        lambda_a = att_a * def_b * np.exp(home_adv)
-        lambda_b = att_b * def_a
-
-        # Independent Poisson probabilities
-        g = self.max_goals + 1
-        prob_a = poisson.pmf(np.arange(g), lambda_a)
-        prob_b = poisson.pmf(np.arange(g), lambda_b)
-        matrix = np.outer(prob_a, prob_b)
-
-        # Rho correction for low scores (0-0, 1-0, 0-1, 1-1)
-        matrix[0, 0] *= 1.0 - lambda_a * lambda_b * rho
-        matrix[1, 0] *= 1.0 + lambda_b * rho
-        matrix[0, 1] *= 1.0 + lambda_a * rho
-        matrix[1, 1] *= 1.0 - rho
-
-        # Renormalize
-        matrix = np.maximum(matrix, 0.0)
-        matrix /= matrix.sum()
-
-        return matrix
+        lambda_a, lambda_b = self._expected_goals([team_a], [team_b], neutral)
+        return self._score_matrices(lambda_a, lambda_b)[0]
 
     def predict_outcome(
         self,
-        team_a: str,
-        team_b: str,
-        neutral: bool = True,
-    ) -> Dict[str, float]:
+        team_a: Union[str, Sequence[str]],
+        team_b: Union[str, Sequence[str]],
+        neutral: Union[bool, Sequence[bool]] = True,
+    ) -> Dict[str, Union[float, np.ndarray]]:
         """Predict match outcome probabilities.
 
+        Accepts a single fixture (two team names) or arrays of team names
+        for many fixtures at once; ``neutral`` may be a scalar or an array
+        of the same length.
+
         Returns
         -------
         Dict with keys: p_win_a, p_draw, p_win_b, lambda_a, lambda_b.
+        Values are floats for a single fixture, arrays of shape (n,) otherwise.
         """
-        matrix = self.predict_score_matrix(team_a, team_b, neutral=neutral)
-        g = self.max_goals + 1
-
-        p_win_a = sum(matrix[i, j] for i in range(g) for j in range(i))
-        p_draw = sum(matrix[i, i] for i in range(g))
-        p_win_b = sum(matrix[i, j] for i in range(g) for j in range(i + 1, g))
-
-        att_a = self.params["attack"].get(team_a, 1.0)
-        def_a = self.params["defense"].get(team_a, 1.0)
-        att_b = self.params["attack"].get(team_b, 1.0)
-        def_b = self.params["defense"].get(team_b, 1.0)
-        home_adv = 0.0 if neutral else self.params["home_advantage"]
-
-        return {
-            "p_win_a": float(p_win_a),
-            "p_draw": float(p_draw),
-            "p_win_b": float(p_win_b),
-            "lambda_a": float(att_a * def_b * np.exp(home_adv)),
-            "lambda_b": float(att_b * def_a),
+        self._check_fitted()
+        single = isinstance(team_a, str)
+        teams_a = [team_a] if single else list(team_a)
+        teams_b = [team_b] if single else list(team_b)
+
+        lambda_a, lambda_b = self._expected_goals(teams_a, teams_b, neutral)
+        matrix = self._score_matrices(lambda_a, lambda_b)
+
+        # Home win below the diagonal (i > j), draw on it, away win above
+        out = {
+            "p_win_a": np.tril(matrix, -1).sum(axis=(1, 2)),
+            "p_draw": np.trace(matrix, axis1=1, axis2=2),
+            "p_win_b": np.triu(matrix, 1).sum(axis=(1, 2)),
+            "lambda_a": lambda_a,
+            "lambda_b": lambda_b,
         }
+        if single:
+            return {key: float(val[0]) for key, val in out.items()}
+        return out
 
     def get_team_strengths(self) -> pd.DataFrame:
         """Return attack/defense parameters for all teams.
@@ -242,53 +299,234 @@ class DixonColesModel:
     # Internal
     # ------------------------------------------------------------------
 
+    def _expected_goals(
+        self,
+        teams_a: Sequence[str],
+        teams_b: Sequence[str],
+        neutral: Union[bool, Sequence[bool]] = True,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Expected goals (lambda_a, lambda_b) per fixture; unknown teams = 1.0."""
+        attack = self.params["attack"]
+        defense = self.params["defense"]
+        att_a = np.array([attack.get(t, 1.0) for t in teams_a], dtype=float)
+        def_a = np.array([defense.get(t, 1.0) for t in teams_a], dtype=float)
+        att_b = np.array([attack.get(t, 1.0) for t in teams_b], dtype=float)
+        def_b = np.array([defense.get(t, 1.0) for t in teams_b], dtype=float)
+        home_adv = np.where(np.asarray(neutral, dtype=bool), 0.0, self.params["home_advantage"])
+
+        return att_a * def_b * np.exp(home_adv), att_b * def_a
+
+    def _score_matrices(self, lambda_a: np.ndarray, lambda_b: np.ndarray) -> np.ndarray:
+        """Rho-corrected score matrices, shape (n, max_goals+1, max_goals+1)."""
+        rho = self.params["rho"]
+        g = self.max_goals + 1
+        goals = np.arange(g)
+        log_fact = np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, g)))])
+
+        # Independent Poisson PMFs in log space, one row per fixture
+        prob_a = np.exp(goals * np.log(lambda_a)[:, None] - lambda_a[:, None] - log_fact)
+        prob_b = np.exp(goals * np.log(lambda_b)[:, None] - lambda_b[:, None] - log_fact)
+        matrix = prob_a[:, :, None] * prob_b[:, None, :]
+
+        # Rho correction for low scores (0-0, 1-0, 0-1, 1-1)
+        matrix[:, 0, 0] *= 1.0 - lambda_a * lambda_b * rho
+        matrix[:, 1, 0] *= 1.0 + lambda_b * rho
+        matrix[:, 0, 1] *= 1.0 + lambda_a * rho
+        matrix[:, 1, 1] *= 1.0 - rho
+
+        # Renormalize
+        matrix = np.maximum(matrix, 0.0)
+        matrix /= matrix.sum(axis=(1, 2), keepdims=True)
+
+        return matrix
+
+    def _warm_start_params(self, previous: "DixonColesModel", n_teams: int) -> np.ndarray:
+        """Initial parameter vector from a previous fit, aligned to self.teams."""
+        prev_attack = previous.params["attack"]
+        prev_defense = previous.params["defense"]
+        # Unseen teams: average attack (1.0 after normalization), mean defense
+        mean_log_def = float(np.mean(np.log(list(prev_defense.values())))) if prev_defense else 0.0
+
+        x0 = np.zeros(2 * n_teams + 2)
+        for i, team in enumerate(self.teams):
+            x0[i] = np.log(prev_attack[team]) if team in prev_attack else 0.0
+            x0[n_teams + i] = np.log(prev_defense[team]) if team in prev_defense else mean_log_def
+        x0[-2] = previous.params["home_advantage"]
+        x0[-1] = previous.params["rho"]
+
+        n_new = sum(1 for t in self.teams if t not in prev_attack)
+        if n_new:
+            logger.info("Warm start: %d new teams initialized at average strength", n_new)
+        return x0
+
     @staticmethod
-    def _neg_log_likelihood(
+    def _match_terms(
         params: np.ndarray,
         home_idx: np.ndarray,
         away_idx: np.ndarray,
         home_goals: np.ndarray,
         away_goals: np.ndarray,
-        weights: np.ndarray,
         is_home: np.ndarray,
         n_teams: int,
-    ) -> float:
-        """Negative log-likelihood for Dixon-Coles model."""
-        attack = np.exp(params[:n_teams])
-        defense = np.exp(params[n_teams:2*n_teams])
+    ) -> Dict[str, np.ndarray]:
+        """Per-match lambdas, tau and tau derivatives.
+
+        Derivatives are taken w.r.t. u = log(lambda_h), v = log(lambda_a) and
+        rho; every parameter enters u and v linearly, so the chain rule to
+        team parameters is a scatter over home_idx / away_idx.
+        """
+        attack = params[:n_teams]
+        defense = params[n_teams:2*n_teams]
         home_adv = params[-2]
         rho = params[-1]
 
-        # Expected goals per match
-        lambda_h = attack[home_idx] * defense[away_idx] * np.exp(home_adv * is_home)
-        lambda_a = attack[away_idx] * defense[home_idx]
+        lambda_h = np.maximum(np.exp(attack[home_idx] + defense[away_idx] + home_adv * is_home), 1e-10)
+        lambda_a = np.maximum(np.exp(attack[away_idx] + defense[home_idx]), 1e-10)
+
+        zeros = np.zeros_like(lambda_h)
+        tau = np.ones_like(lambda_h)
+        tau_u, tau_v, tau_r = zeros.copy(), zeros.copy(), zeros.copy()
+        tau_uu, tau_vv, tau_uv = zeros.copy(), zeros.copy(), zeros.copy()
+        tau_ur, tau_vr = zeros.copy(), zeros.copy()
+
+        m00 = (home_goals == 0) & (away_goals == 0)
+        m10 = (home_goals == 1) & (away_goals == 0)
+        m01 = (home_goals == 0) & (away_goals == 1)
+        m11 = (home_goals == 1) & (away_goals == 1)
+
+        # 0-0: tau = 1 - lambda_h * lambda_a * rho
+        prod = lambda_h[m00] * lambda_a[m00]
+        tau[m00] = 1.0 - prod * rho
+        for d in (tau_u, tau_v, tau_uu, tau_vv, tau_uv):
+            d[m00] = -prod * rho
+        tau_r[m00] = -prod
+        tau_ur[m00] = -prod
+        tau_vr[m00] = -prod
+        # 1-0: tau = 1 + lambda_a * rho
+        tau[m10] = 1.0 + lambda_a[m10] * rho
+        tau_v[m10] = lambda_a[m10] * rho
+        tau_vv[m10] = lambda_a[m10] * rho
+        tau_r[m10] = lambda_a[m10]
+        tau_vr[m10] = lambda_a[m10]
+        # 0-1: tau = 1 + lambda_h * rho
+        tau[m01] = 1.0 + lambda_h[m01] * rho
+        tau_u[m01] = lambda_h[m01] * rho
+        tau_uu[m01] = lambda_h[m01] * rho
+        tau_r[m01] = lambda_h[m01]
+        tau_ur[m01] = lambda_h[m01]
+        # 1-1: tau = 1 - rho
+        tau[m11] = 1.0 - rho
+        tau_r[m11] = -1.0
+
+        # Clamped tau is locally constant: no gradient / curvature through it
+        clamped = tau < 1e-10
+        tau = np.maximum(tau, 1e-10)
+        for d in (tau_u, tau_v, tau_r, tau_uu, tau_vv, tau_uv, tau_ur, tau_vr):
+            d[clamped] = 0.0
+
+        return {
+            "lambda_h": lambda_h, "lambda_a": lambda_a, "tau": tau,
+            "tau_u": tau_u, "tau_v": tau_v, "tau_r": tau_r,
+            "tau_uu": tau_uu, "tau_vv": tau_vv, "tau_uv": tau_uv,
+            "tau_ur": tau_ur, "tau_vr": tau_vr,
+        }
 
-        # Avoid log(0)
-        lambda_h = np.maximum(lambda_h, 1e-10)
-        lambda_a = np.maximum(lambda_a, 1e-10)
+    @classmethod
+    def _neg_log_likelihood_and_grad(
+        cls,
+        params: np.ndarray,
+        home_idx: np.ndarray,
+        away_idx: np.ndarray,
+        home_goals: np.ndarray,
+        away_goals: np.ndarray,
+        weights: np.ndarray,
+        is_home: np.ndarray,
+        n_teams: int,
+    ) -> Tuple[float, np.ndarray]:
+        """Negative log-likelihood and its exact gradient."""
+        t = cls._match_terms(params, home_idx, away_idx, home_goals, away_goals, is_home, n_teams)
+        lambda_h, lambda_a, tau = t["lambda_h"], t["lambda_a"], t["tau"]
 
-        # Poisson log-likelihood
         ll = (
             home_goals * np.log(lambda_h) - lambda_h
             + away_goals * np.log(lambda_a) - lambda_a
+            + np.log(tau)
         )
 
-        # Rho correction for low scores
-        tau = np.ones_like(ll)
-        mask_00 = (home_goals == 0) & (away_goals == 0)
-        mask_10 = (home_goals == 1) & (away_goals == 0)
-        mask_01 = (home_goals == 0) & (away_goals == 1)
-        mask_11 = (home_goals == 1) & (away_goals == 1)
+        # d(ll)/du, d(ll)/dv, d(ll)/drho per match (weighted)
+        g_u = weights * (home_goals - lambda_h + t["tau_u"] / tau)
+        g_v = weights * (away_goals - lambda_a + t["tau_v"] / tau)
+        g_r = weights * t["tau_r"] / tau
 
-        tau[mask_00] = 1.0 - lambda_h[mask_00] * lambda_a[mask_00] * rho
-        tau[mask_10] = 1.0 + lambda_a[mask_10] * rho
-        tau[mask_01] = 1.0 + lambda_h[mask_01] * rho
-        tau[mask_11] = 1.0 - rho
+        grad = np.empty_like(params)
+        grad[:n_teams] = (
+            np.bincount(home_idx, g_u, minlength=n_teams)
+            + np.bincount(away_idx, g_v, minlength=n_teams)
+        )
+        grad[n_teams:2*n_teams] = (
+            np.bincount(away_idx, g_u, minlength=n_teams)
+            + np.bincount(home_idx, g_v, minlength=n_teams)
+        )
+        grad[-2] = np.sum(g_u * is_home)
+        grad[-1] = np.sum(g_r)
 
-        tau = np.maximum(tau, 1e-10)
-        ll += np.log(tau)
+        return -np.sum(weights * ll), -grad
+
+    @classmethod
+    def _neg_log_likelihood_hess(
+        cls,
+        params: np.ndarray,
+        home_idx: np.ndarray,
+        away_idx: np.ndarray,
+        home_goals: np.ndarray,
+        away_goals: np.ndarray,
+        weights: np.ndarray,
+        is_home: np.ndarray,
+        n_teams: int,
+    ) -> sparse.csr_matrix:
+        """Exact Hessian of the negative log-likelihood as a sparse matrix.
+
+        Team-by-team blocks are non-zero only for teams that met, so the
+        matrix has O(n_matches) entries instead of (2n+2)^2.
+        """
+        t = cls._match_terms(params, home_idx, away_idx, home_goals, away_goals, is_home, n_teams)
+        tau = t["tau"]
+
+        # Per-match second derivatives of ll w.r.t. (u, v, rho)
+        h = {
+            ("u", "u"): -t["lambda_h"] + t["tau_uu"] / tau - t["tau_u"] ** 2 / tau ** 2,
+            ("v", "v"): -t["lambda_a"] + t["tau_vv"] / tau - t["tau_v"] ** 2 / tau ** 2,
+            ("u", "v"): t["tau_uv"] / tau - t["tau_u"] * t["tau_v"] / tau ** 2,
+            ("u", "r"): t["tau_ur"] / tau - t["tau_u"] * t["tau_r"] / tau ** 2,
+            ("v", "r"): t["tau_vr"] / tau - t["tau_v"] * t["tau_r"] / tau ** 2,
+            ("r", "r"): -t["tau_r"] ** 2 / tau ** 2,
+        }
+
+        # Parameter columns (and coefficients) feeding u, v and rho per match
+        ones = np.ones_like(weights)
+        home_col = np.full(len(weights), 2 * n_teams)
+        rho_col = np.full(len(weights), 2 * n_teams + 1)
+        jac = {
+            "u": [(home_idx, ones), (n_teams + away_idx, ones), (home_col, is_home)],
+            "v": [(away_idx, ones), (n_teams + home_idx, ones)],
+            "r": [(rho_col, ones)],
+        }
 
-        return -np.sum(weights * ll)
+        rows, cols, vals = [], [], []
+        for (x, y), h_xy in h.items():
+            w_h = -weights * h_xy
+            for col_x, c_x in jac[x]:
+                for col_y, c_y in jac[y]:
+                    v = w_h * c_x * c_y
+                    rows.extend([col_x, col_y] if x != y else [col_x])
+                    cols.extend([col_y, col_x] if x != y else [col_y])
+                    vals.extend([v, v] if x != y else [v])
+
+        n_params = len(params)
+        return sparse.coo_matrix(
+            (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(n_params, n_params),
+        ).tocsr()
 
     def _check_fitted(self):
         if not self._fitted:
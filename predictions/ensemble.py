@@ -7,15 +7,23 @@ calibrated weighted average optimized on log-loss.
 import logging
 import pickle
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from scipy.optimize import minimize_scalar
 from sklearn.ensemble import GradientBoostingClassifier
 
-from ._config import ALL_FEATURES, ENSEMBLE_W_DC, ENSEMBLE_W_GBM, GBM_PARAMS
+from ._config import (
+    ALL_FEATURES,
+    ENSEMBLE_W_DC,
+    ENSEMBLE_W_GBM,
+    ET_PROB,
+    GBM_PARAMS,
+    PK_HOME_EDGE,
+)
 from .dixon_coles import DixonColesModel
-from .features import build_match_features
+from .features import build_fixture_features, build_match_features, get_rankings_index
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +40,12 @@ class MatchPredictor:
         Weight for Dixon-Coles predictions.
     w_gbm : float
         Weight for GBM predictions.
+
+    Attributes
+    ----------
+    stage_weights : dict
+        Optional {stage: (w_dc, w_gbm)} overrides, set by
+        optimize_weights(per_stage=True). Stages not listed use w_dc/w_gbm.
     """
 
     def __init__(
@@ -41,6 +55,7 @@ class MatchPredictor:
     ):
         self.w_dc = w_dc
         self.w_gbm = w_gbm
+        self.stage_weights: Dict[int, Tuple[float, float]] = {}
         self.dc_model = DixonColesModel()
         self.gbm_model: Optional[GradientBoostingClassifier] = None
         self._fitted = False
@@ -50,6 +65,7 @@ class MatchPredictor:
         matches_df: pd.DataFrame,
         X_train: pd.DataFrame,
         y_train: pd.Series,
+        warm_start: Optional["MatchPredictor"] = None,
     ) -> "MatchPredictor":
         """Fit both models.
 
@@ -62,6 +78,9 @@ class MatchPredictor:
             Feature matrix for GBM (from features.build_training_matrix).
         y_train : pd.Series
             Target: 2=win_a, 1=draw, 0=win_b.
+        warm_start : MatchPredictor, optional
+            Previously fitted predictor (e.g. the prior backtest fold) whose
+            Dixon-Coles parameters seed the optimizer.
 
         Returns
         -------
@@ -69,7 +88,10 @@ class MatchPredictor:
         """
         # Layer 1: Dixon-Coles
         logger.info("Fitting Dixon-Coles model...")
-        self.dc_model.fit(matches_df)
+        self.dc_model.fit(
+            matches_df,
+            warm_start=warm_start.dc_model if warm_start is not None else None,
+        )
 
         # Layer 3: GBM
         logger.info("Fitting GBM classifier...")
@@ -138,18 +160,11 @@ class MatchPredictor:
             must_win_b=must_win_b,
         )
         X = pd.DataFrame([feat])[ALL_FEATURES].fillna(0.0)
-        # GBM classes: [0, 1, 2] -> [win_b, draw, win_a]
-        p_gbm_raw = self.gbm_model.predict_proba(X)[0]
-        # Reorder to [p_win_a, p_draw, p_win_b]
-        class_order = list(self.gbm_model.classes_)
-        p_gbm = np.array([
-            p_gbm_raw[class_order.index(2)] if 2 in class_order else 0.0,
-            p_gbm_raw[class_order.index(1)] if 1 in class_order else 0.0,
-            p_gbm_raw[class_order.index(0)] if 0 in class_order else 0.0,
-        ])
+        p_gbm = self._gbm_proba(X)[0]
 
         # Ensemble
-        p_final = self.w_dc * p_dc + self.w_gbm * p_gbm
+        w_dc, w_gbm = self._stage_weights(stage)
+        p_final = w_dc * p_dc + w_gbm * p_gbm
         p_final = np.maximum(p_final, 1e-6)
         p_final /= p_final.sum()
 
@@ -179,8 +194,6 @@ class MatchPredictor:
         Dict with: p_advance_a, p_advance_b (after ET/PKs),
                    p_90min (win/draw/loss in regulation).
         """
-        from ._config import ET_PROB, PK_HOME_EDGE
-
         p90 = self.predict(
             team_a, team_b,
             rankings_df=rankings_df,
@@ -193,27 +206,13 @@ class MatchPredictor:
         p_draw_90 = p90["p_draw"]
         p_win_b_90 = p90["p_win_b"]
 
-        # Extra time: draw probability distributed proportionally
-        if p_win_a_90 + p_win_b_90 > 0:
-            ratio_a = p_win_a_90 / (p_win_a_90 + p_win_b_90)
-        else:
-            ratio_a = 0.5
-
-        p_et_a = p_draw_90 * ET_PROB * ratio_a
-        p_et_b = p_draw_90 * ET_PROB * (1 - ratio_a)
-
-        # Penalties: remaining draw probability
-        p_pk = p_draw_90 * (1 - ET_PROB)
-        # Slight edge to higher-ELO team
-        elo_a = rankings_df.loc[team_a, "elo_rating"] if team_a in rankings_df.index else 1500
-        elo_b = rankings_df.loc[team_b, "elo_rating"] if team_b in rankings_df.index else 1500
-        pk_edge_a = PK_HOME_EDGE if elo_a >= elo_b else (1 - PK_HOME_EDGE)
+        # Slight penalty edge to higher-ELO team
+        index = get_rankings_index(rankings_df)
+        elo_a = index.get(team_a, "elo_rating", 1500)
+        elo_b = index.get(team_b, "elo_rating", 1500)
 
-        p_pk_a = p_pk * pk_edge_a
-        p_pk_b = p_pk * (1 - pk_edge_a)
-
-        p_advance_a = p_win_a_90 + p_et_a + p_pk_a
-        p_advance_b = p_win_b_90 + p_et_b + p_pk_b
+        p_advance_a = _advance_probability(p_win_a_90, p_draw_90, p_win_b_90, elo_a, elo_b)
+        p_advance_b = 1.0 - p_advance_a
 
         return {
             "p_advance_a": float(p_advance_a),
@@ -225,6 +224,160 @@ class MatchPredictor:
             },
         }
 
+    def predict_fixtures(
+        self,
+        teams_a: Sequence[str],
+        teams_b: Sequence[str],
+        rankings_df: pd.DataFrame,
+        squad_features: Dict[str, Dict[str, float]],
+        neutral: bool = True,
+        stage: int = 0,
+    ) -> np.ndarray:
+        """Predict outcome probabilities for a list of fixtures at once.
+
+        Batched equivalent of predict() with default match context: one
+        Dixon-Coles call and one GBM inference for the whole list.
+
+        Parameters
+        ----------
+        teams_a, teams_b : sequence of str
+            Team names, one pair per fixture.
+        rankings_df : pd.DataFrame
+            ELO rankings.
+        squad_features : dict
+            Squad features for all teams.
+        neutral : bool
+            Neutral venue (default True for World Cup).
+        stage : int
+            Tournament stage for every fixture.
+
+        Returns
+        -------
+        np.ndarray
+            Shape (n, 3): [p_win_a, p_draw, p_win_b] per fixture.
+        """
+        self._check_fitted()
+        teams_a, teams_b = list(teams_a), list(teams_b)
+        if not teams_a:
+            return np.empty((0, 3))
+
+        p_dc, p_gbm = self._component_probabilities(
+            teams_a, teams_b, rankings_df, squad_features, neutral=neutral, stage=stage,
+        )
+        w_dc, w_gbm = self._stage_weights(stage)
+        p_final = w_dc * p_dc + w_gbm * p_gbm
+        p_final = np.maximum(p_final, 1e-6)
+        return p_final / p_final.sum(axis=1, keepdims=True)
+
+    def predict_matrix(
+        self,
+        teams: List[str],
+        rankings_df: pd.DataFrame,
+        squad_features: Dict[str, Dict[str, float]],
+        stages: Sequence[int] = (0,),
+        neutral: bool = True,
+        return_lambdas: bool = False,
+    ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        """Predict outcome probabilities for every ordered team pair at once.
+
+        Builds one feature frame covering all (stage, team_a, team_b)
+        combinations and runs a single batched GBM inference, instead of
+        one predict() call per fixture.
+
+        Parameters
+        ----------
+        teams : list of str
+            Team names; tensor axes follow this order.
+        rankings_df : pd.DataFrame
+            Current ELO rankings.
+        squad_features : dict
+            Squad features for all teams.
+        stages : sequence of int
+            Tournament stages (0=group, 1=R32, ..., 5=Final).
+        neutral : bool
+            Neutral venue (default True for World Cup).
+        return_lambdas : bool
+            Also return Dixon-Coles expected goals.
+
+        Returns
+        -------
+        probs : np.ndarray
+            Shape (len(stages), n, n, 3): [p_win_a, p_draw, p_win_b] for
+            team i (a) vs team j (b). Diagonal entries are NaN.
+        lambdas : np.ndarray
+            Shape (n, n, 2): [lambda_a, lambda_b]. Only if return_lambdas.
+        """
+        self._check_fitted()
+        n = len(teams)
+        stages = list(stages)
+        idx_a, idx_b = np.nonzero(~np.eye(n, dtype=bool))
+
+        # Dixon-Coles is stage-independent: one batched call over ordered pairs
+        dc_pred = self.dc_model.predict_outcome(
+            [teams[i] for i in idx_a], [teams[j] for j in idx_b], neutral=neutral,
+        )
+        p_dc = np.column_stack([dc_pred["p_win_a"], dc_pred["p_draw"], dc_pred["p_win_b"]])
+        lam = np.column_stack([dc_pred["lambda_a"], dc_pred["lambda_b"]])
+
+        # Feature rows for every ordered pair, tiled across stages
+        base = build_fixture_features(
+            [teams[i] for i in idx_a], [teams[j] for j in idx_b],
+            rankings_df=rankings_df,
+            squad_features=squad_features,
+        )
+        X = pd.concat([base] * len(stages), ignore_index=True)
+        X["tournament_stage"] = np.repeat(stages, len(base))
+
+        p_gbm = self._gbm_proba(X).reshape(len(stages), len(base), 3)
+
+        # Ensemble (weights may differ per stage)
+        w = np.array([self._stage_weights(stage) for stage in stages])
+        p_final = w[:, 0, None, None] * p_dc[None, :, :] + w[:, 1, None, None] * p_gbm
+        p_final = np.maximum(p_final, 1e-6)
+        p_final /= p_final.sum(axis=2, keepdims=True)
+
+        probs = np.full((len(stages), n, n, 3), np.nan)
+        probs[:, idx_a, idx_b, :] = p_final
+        if not return_lambdas:
+            return probs
+
+        lambdas = np.full((n, n, 2), np.nan)
+        lambdas[idx_a, idx_b, :] = lam
+        return probs, lambdas
+
+    def predict_knockout_matrix(
+        self,
+        teams: List[str],
+        rankings_df: pd.DataFrame,
+        squad_features: Dict[str, Dict[str, float]],
+        stages: Sequence[int] = (1, 2, 3, 4, 5),
+        probs: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Pairwise P(advance) after extra time / penalties for every stage.
+
+        Parameters
+        ----------
+        teams, rankings_df, squad_features, stages :
+            As in predict_matrix().
+        probs : np.ndarray, optional
+            Precomputed predict_matrix() output for the same teams and
+            stages, to avoid a second inference pass.
+
+        Returns
+        -------
+        np.ndarray
+            Shape (len(stages), n, n): P(team i advances vs team j).
+        """
+        if probs is None:
+            probs = self.predict_matrix(teams, rankings_df, squad_features, stages=stages)
+
+        elo = get_rankings_index(rankings_df).values(teams, "elo_rating", 1500)
+
+        return _advance_probability(
+            probs[..., 0], probs[..., 1], probs[..., 2],
+            elo[:, None], elo[None, :],
+        )
+
     def optimize_weights(
         self,
         matches_df: pd.DataFrame,
@@ -232,51 +385,84 @@ class MatchPredictor:
         y_val: pd.Series,
         rankings_df: pd.DataFrame,
         squad_features: Dict[str, Dict[str, float]],
+        method: str = "grid",
+        bounds: Tuple[float, float] = (0.0, 1.0),
+        per_stage: bool = False,
     ) -> Tuple[float, float]:
         """Optimize ensemble weights on validation data.
 
-        Grid search over w_dc in [0.3, 0.4, ..., 0.9] minimizing log-loss.
+        Dixon-Coles and GBM probabilities are computed once for the whole
+        validation set; the log-loss of every candidate blend is then pure
+        array arithmetic.
+
+        Parameters
+        ----------
+        matches_df : pd.DataFrame
+            Validation matches (team1, team2), aligned with X_val / y_val.
+        X_val : pd.DataFrame
+            Validation features; its tournament_stage column gives the
+            stage of each match (0 if absent).
+        y_val : pd.Series
+            Target: 2=win_a, 1=draw, 0=win_b.
+        rankings_df, squad_features :
+            As in predict().
+        method : str
+            "grid": w_dc in [0.30, 0.35, ..., 0.90], all evaluated in one
+            broadcast. "bounded": continuous search within ``bounds``
+            (scipy minimize_scalar).
+        bounds : tuple of float
+            w_dc search interval for method="bounded".
+        per_stage : bool
+            Also fit a separate weight for each stage present in X_val
+            (stored in stage_weights).
 
         Returns
         -------
         Tuple of (optimal_w_dc, optimal_w_gbm).
         """
-        from sklearn.metrics import log_loss
-
-        best_w = self.w_dc
-        best_ll = float("inf")
-
-        for w_dc in np.arange(0.3, 0.95, 0.05):
-            w_gbm = 1.0 - w_dc
-            self.w_dc = w_dc
-            self.w_gbm = w_gbm
-
-            # Predict on validation set
-            probs = []
-            for i, (_, match) in enumerate(matches_df.iterrows()):
-                if i >= len(X_val):
-                    break
-                team_a = match["team1"]
-                team_b = match["team2"]
-                pred = self.predict(
-                    team_a, team_b,
-                    rankings_df=rankings_df,
-                    squad_features=squad_features,
-                )
-                probs.append([pred["p_win_a"], pred["p_draw"], pred["p_win_b"]])
-
-            if probs:
-                probs_arr = np.array(probs)
-                # Convert y_val to one-hot for log_loss
-                y_arr = y_val.values[:len(probs)]
-                ll = log_loss(y_arr, probs_arr, labels=[2, 1, 0])
-                if ll < best_ll:
-                    best_ll = ll
-                    best_w = w_dc
+        if method not in ("grid", "bounded"):
+            raise ValueError(f"Unknown method: {method!r} (expected 'grid' or 'bounded')")
+
+        n = min(len(matches_df), len(X_val), len(y_val))
+        if n == 0:
+            return (self.w_dc, self.w_gbm)
+        fixtures = matches_df.iloc[:n]
+        y = np.asarray(y_val)[:n].astype(int)
+        if "tournament_stage" in X_val.columns:
+            stages = X_val["tournament_stage"].to_numpy()[:n].astype(int)
+        else:
+            stages = np.zeros(n, dtype=int)
+
+        # One inference pass: component probabilities for every match
+        p_dc, p_gbm = self._component_probabilities(
+            fixtures["team1"], fixtures["team2"], rankings_df, squad_features, stage=stages,
+        )
 
+        def best_weight(mask: np.ndarray) -> Tuple[float, float]:
+            pd_, pg_, y_ = p_dc[mask], p_gbm[mask], y[mask]
+            if method == "grid":
+                grid = np.round(np.arange(0.3, 0.95, 0.05), 2)
+                losses = _blend_log_loss(pd_, pg_, y_, grid)
+                k = int(np.argmin(losses))
+                return float(grid[k]), float(losses[k])
+            res = minimize_scalar(
+                lambda w: _blend_log_loss(pd_, pg_, y_, [w])[0],
+                bounds=bounds, method="bounded",
+            )
+            return float(res.x), float(res.fun)
+
+        best_w, best_ll = best_weight(np.ones(n, dtype=bool))
         self.w_dc = best_w
         self.w_gbm = 1.0 - best_w
         logger.info("Optimized weights: w_dc=%.2f, w_gbm=%.2f (log_loss=%.4f)", best_w, 1.0 - best_w, best_ll)
+
+        self.stage_weights = {}
+        if per_stage:
+            for stage in np.unique(stages):
+                w, ll = best_weight(stages == stage)
+                self.stage_weights[int(stage)] = (w, 1.0 - w)
+                logger.info("  Stage %d: w_dc=%.2f (log_loss=%.4f, n=%d)", stage, w, ll, int((stages == stage).sum()))
+
         return (self.w_dc, self.w_gbm)
 
     def save(self, filepath: str):
@@ -294,6 +480,76 @@ class MatchPredictor:
         logger.info("Model loaded from %s", filepath)
         return model
 
+    def _component_probabilities(
+        self,
+        teams_a: Sequence[str],
+        teams_b: Sequence[str],
+        rankings_df: pd.DataFrame,
+        squad_features: Dict[str, Dict[str, float]],
+        neutral: bool = True,
+        stage: Union[int, np.ndarray] = 0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Unblended (n, 3) Dixon-Coles and GBM probabilities for fixtures."""
+        teams_a, teams_b = list(teams_a), list(teams_b)
+        dc_pred = self.dc_model.predict_outcome(teams_a, teams_b, neutral=neutral)
+        p_dc = np.column_stack([dc_pred["p_win_a"], dc_pred["p_draw"], dc_pred["p_win_b"]])
+
+        X = build_fixture_features(teams_a, teams_b, rankings_df, squad_features)
+        X["tournament_stage"] = stage
+        return p_dc, self._gbm_proba(X)
+
+    def _stage_weights(self, stage: int) -> Tuple[float, float]:
+        """(w_dc, w_gbm) for a tournament stage."""
+        # getattr: models pickled before stage_weights existed
+        return getattr(self, "stage_weights", {}).get(stage, (self.w_dc, self.w_gbm))
+
+    def _gbm_proba(self, X: pd.DataFrame) -> np.ndarray:
+        """GBM probabilities reordered to [p_win_a, p_draw, p_win_b] columns."""
+        # GBM classes: [0, 1, 2] -> [win_b, draw, win_a]
+        p_raw = self.gbm_model.predict_proba(X)
+        class_order = list(self.gbm_model.classes_)
+        p_gbm = np.zeros((len(X), 3))
+        for col, cls in enumerate([2, 1, 0]):
+            if cls in class_order:
+                p_gbm[:, col] = p_raw[:, class_order.index(cls)]
+        return p_gbm
+
     def _check_fitted(self):
         if not self._fitted:
             raise RuntimeError("Model not fitted. Call fit() first.")
+
+
+def _blend_log_loss(
+    p_dc: np.ndarray,
+    p_gbm: np.ndarray,
+    y: np.ndarray,
+    weights: Sequence[float],
+) -> np.ndarray:
+    """Log-loss of the blended prediction for each candidate w_dc at once.
+
+    Blends exactly as predict() does (w_gbm = 1 - w_dc, floor 1e-6,
+    renormalize). Outcomes use 2=win_a, 1=draw, 0=win_b.
+    """
+    w = np.asarray(weights, dtype=float)[:, None, None]
+    p = w * p_dc[None] + (1.0 - w) * p_gbm[None]
+    p = np.maximum(p, 1e-6)
+    p /= p.sum(axis=2, keepdims=True)
+    p_actual = p[:, np.arange(len(y)), 2 - y]
+    return -np.log(p_actual).mean(axis=1)
+
+
+def _advance_probability(p_win_a, p_draw, p_win_b, elo_a, elo_b):
+    """P(team a advances) after extra time and penalties.
+
+    Extra time splits the draw mass in proportion to the 90-minute win
+    probabilities; penalties give a slight edge to the higher-ELO team.
+    Works on scalars or broadcastable NumPy arrays.
+    """
+    decided = p_win_a + p_win_b
+    ratio_a = np.where(decided > 0, p_win_a / np.where(decided > 0, decided, 1.0), 0.5)
+
+    p_et_a = p_draw * ET_PROB * ratio_a
+    pk_edge_a = np.where(elo_a >= elo_b, PK_HOME_EDGE, 1 - PK_HOME_EDGE)
+    p_pk_a = p_draw * (1 - ET_PROB) * pk_edge_a
+
+    return p_win_a + p_et_a + p_pk_a
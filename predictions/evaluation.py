@@ -5,11 +5,15 @@ Euro 2024). Metrics: Brier score, log loss, accuracy, calibration curves.
 """
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+from .features import get_rankings_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,16 +36,7 @@ def brier_score(predictions: np.ndarray, outcomes: np.ndarray) -> float:
     if n == 0:
         return 0.0
 
-    # One-hot encode outcomes: [win_a, draw, win_b]
-    one_hot = np.zeros((n, 3))
-    for i, o in enumerate(outcomes):
-        if o == 2:
-            one_hot[i, 0] = 1.0
-        elif o == 1:
-            one_hot[i, 1] = 1.0
-        else:
-            one_hot[i, 2] = 1.0
-
+    one_hot = _one_hot(outcomes)
     return float(np.mean(np.sum((predictions - one_hot) ** 2, axis=1)))
 
 
@@ -67,16 +62,8 @@ def log_loss_score(predictions: np.ndarray, outcomes: np.ndarray) -> float:
     eps = 1e-10
     preds = np.clip(predictions, eps, 1 - eps)
 
-    ll = 0.0
-    for i, o in enumerate(outcomes):
-        if o == 2:
-            ll -= np.log(preds[i, 0])
-        elif o == 1:
-            ll -= np.log(preds[i, 1])
-        else:
-            ll -= np.log(preds[i, 2])
-
-    return float(ll / n)
+    p_actual = preds[np.arange(n), _outcome_column(outcomes)]
+    return float(-np.mean(np.log(p_actual)))
 
 
 def accuracy_score(predictions: np.ndarray, outcomes: np.ndarray) -> float:
@@ -126,20 +113,10 @@ def ranked_probability_score(predictions: np.ndarray, outcomes: np.ndarray) -> f
     if n == 0:
         return 0.0
 
-    rps_total = 0.0
-    for i in range(n):
-        # Cumulative predicted: [p_win_a, p_win_a+p_draw, 1.0]
-        cum_pred = np.cumsum(predictions[i])
-        # Cumulative actual
-        o = outcomes[i]
-        cum_actual = np.array([
-            1.0 if o == 2 else 0.0,
-            1.0 if o >= 1 else 0.0,
-            1.0,
-        ])
-        rps_total += np.mean((cum_pred - cum_actual) ** 2)
-
-    return float(rps_total / n)
+    # Cumulative predicted [p_win_a, p_win_a+p_draw, 1] vs cumulative actual
+    cum_pred = np.cumsum(predictions, axis=1)
+    cum_actual = np.cumsum(_one_hot(outcomes), axis=1)
+    return float(np.mean((cum_pred - cum_actual) ** 2))
 
 
 def calibration_curve(
@@ -167,31 +144,34 @@ def calibration_curve(
         Columns: bin_center, predicted_prob, observed_freq, count.
     """
     # Flatten: treat each class prediction independently
-    rows = []
     # Class mapping: col 0 = win_a (outcome=2), col 1 = draw (outcome=1), col 2 = win_b (outcome=0)
-    class_map = {0: 2, 1: 1, 2: 0}
+    predictions = np.asarray(predictions, dtype=float).reshape(-1, 3)
+    actual = _one_hot(outcomes)
+    bin_edges = np.linspace(0, 1, n_bins + 1)
 
-    for col_idx, outcome_val in class_map.items():
+    frames = []
+    for col_idx, cls in enumerate(["win_a", "draw", "win_b"]):
         probs = predictions[:, col_idx]
-        actual = (outcomes == outcome_val).astype(float)
-
-        bin_edges = np.linspace(0, 1, n_bins + 1)
-        for b in range(n_bins):
-            lo, hi = bin_edges[b], bin_edges[b + 1]
-            mask = (probs >= lo) & (probs < hi)
-            if b == n_bins - 1:
-                mask = (probs >= lo) & (probs <= hi)
-            count = mask.sum()
-            if count > 0:
-                rows.append({
-                    "bin_center": (lo + hi) / 2,
-                    "predicted_prob": float(probs[mask].mean()),
-                    "observed_freq": float(actual[mask].mean()),
-                    "count": int(count),
-                    "class": ["win_a", "draw", "win_b"][col_idx],
-                })
-
-    return pd.DataFrame(rows)
+        # Right edge of the last bin is inclusive; values outside [0, 1] are dropped
+        bins = np.searchsorted(bin_edges, probs, side="right") - 1
+        bins[probs == 1.0] = n_bins - 1
+        valid = (bins >= 0) & (bins < n_bins)
+        bins = bins[valid]
+
+        count = np.bincount(bins, minlength=n_bins)
+        pred_sum = np.bincount(bins, weights=probs[valid], minlength=n_bins)
+        obs_sum = np.bincount(bins, weights=actual[valid, col_idx], minlength=n_bins)
+
+        nonzero = count > 0
+        frames.append(pd.DataFrame({
+            "bin_center": ((bin_edges[:-1] + bin_edges[1:]) / 2)[nonzero],
+            "predicted_prob": pred_sum[nonzero] / count[nonzero],
+            "observed_freq": obs_sum[nonzero] / count[nonzero],
+            "count": count[nonzero],
+            "class": cls,
+        }))
+
+    return pd.concat(frames, ignore_index=True)
 
 
 def backtest_tournament(
@@ -220,37 +200,21 @@ def backtest_tournament(
     -------
     Dict with metrics and detailed predictions.
     """
-    predictions = []
-    outcomes = []
-
-    for _, match in tournament_matches.iterrows():
-        team_a = match["team1"]
-        team_b = match["team2"]
-        score_a = int(match["team1_score"])
-        score_b = int(match["team2_score"])
-
-        # Predict
-        pred = predictor.predict(
-            team_a, team_b,
-            rankings_df=rankings_df,
-            squad_features=squad_features,
-        )
-        predictions.append([pred["p_win_a"], pred["p_draw"], pred["p_win_b"]])
-
-        # Actual outcome
-        if score_a > score_b:
-            outcomes.append(2)
-        elif score_a == score_b:
-            outcomes.append(1)
-        else:
-            outcomes.append(0)
-
-    preds = np.array(predictions)
-    outs = np.array(outcomes)
+    # One batched prediction for the whole test set
+    preds = predictor.predict_fixtures(
+        tournament_matches["team1"], tournament_matches["team2"],
+        rankings_df=rankings_df,
+        squad_features=squad_features,
+    )
+
+    # Actual outcome: 2=win_a, 1=draw, 0=win_b
+    score_a = tournament_matches["team1_score"].astype(int).to_numpy()
+    score_b = tournament_matches["team2_score"].astype(int).to_numpy()
+    outs = np.sign(score_a - score_b) + 1
 
     metrics = {
         "tournament": tournament_name,
-        "n_matches": len(outcomes),
+        "n_matches": len(outs),
         "brier_score": brier_score(preds, outs),
         "log_loss": log_loss_score(preds, outs),
         "accuracy": accuracy_score(preds, outs),
@@ -264,27 +228,24 @@ def backtest_tournament(
     metrics["baseline_random_ll"] = log_loss_score(random_preds, outs)
 
     # ELO-only baseline (predict favorite wins based on elo_rating_diff sign)
-    elo_preds = []
-    for _, match in tournament_matches.iterrows():
-        team_a = match["team1"]
-        team_b = match["team2"]
-        ra = rankings_df.loc[team_a, "elo_rating"] if team_a in rankings_df.index else 1500
-        rb = rankings_df.loc[team_b, "elo_rating"] if team_b in rankings_df.index else 1500
-        delta = ra - rb
-        # Simple ELO win probability
-        p_a = 1.0 / (1.0 + 10 ** (-delta / 400.0))
-        p_draw = 0.25  # Flat draw prior
-        p_a_adj = p_a * (1 - p_draw)
-        p_b_adj = (1 - p_a) * (1 - p_draw)
-        elo_preds.append([p_a_adj, p_draw, p_b_adj])
-
-    elo_preds = np.array(elo_preds)
+    index = get_rankings_index(rankings_df)
+    ra = index.values(tournament_matches["team1"], "elo_rating", 1500)
+    rb = index.values(tournament_matches["team2"], "elo_rating", 1500)
+    delta = ra - rb
+    # Simple ELO win probability
+    p_a = 1.0 / (1.0 + 10 ** (-delta / 400.0))
+    p_draw = 0.25  # Flat draw prior
+    elo_preds = np.column_stack([
+        p_a * (1 - p_draw),
+        np.full_like(p_a, p_draw),
+        (1 - p_a) * (1 - p_draw),
+    ])
     metrics["baseline_elo_brier"] = brier_score(elo_preds, outs)
     metrics["baseline_elo_ll"] = log_loss_score(elo_preds, outs)
 
     cal = calibration_curve(preds, outs)
 
-    logger.info("Backtest %s: %d matches", tournament_name, len(outcomes))
+    logger.info("Backtest %s: %d matches", tournament_name, len(outs))
     logger.info("  Brier=%.4f (random=%.4f, elo=%.4f)", metrics["brier_score"], metrics["baseline_random_brier"], metrics["baseline_elo_brier"])
     logger.info("  LogLoss=%.4f (random=%.4f, elo=%.4f)", metrics["log_loss"], metrics["baseline_random_ll"], metrics["baseline_elo_ll"])
     logger.info("  Accuracy=%.1f%%", metrics["accuracy"] * 100)
@@ -297,6 +258,71 @@ def backtest_tournament(
     }
 
 
+def run_backtest(
+    folds: List[Dict],
+    rankings_by_year: Dict[int, pd.DataFrame],
+    squad_features: Optional[Dict[str, Dict[str, float]]] = None,
+    predictor_params: Optional[Dict[str, Any]] = None,
+    n_workers: Optional[int] = 1,
+) -> Dict[str, Any]:
+    """Train and backtest every fold, returning a results table.
+
+    Parameters
+    ----------
+    folds : list of dict
+        Output of data_collector.prepare_backtest_data().
+    rankings_by_year : dict
+        {year: rankings_df} for building training features.
+    squad_features : dict, optional
+        Squad features used at test time (default: none, ELO-only).
+    predictor_params : dict, optional
+        Keyword arguments for MatchPredictor (e.g. w_dc, w_gbm), to
+        evaluate a model config across all folds.
+    n_workers : int, optional
+        Worker processes. 1 runs folds serially and warm-starts each
+        Dixon-Coles fit from the previous fold; >1 fits independent folds
+        concurrently from a cold start. None uses os.cpu_count().
+
+    Returns
+    -------
+    Dict with:
+        results : pd.DataFrame, one row per fold (n_train plus all metrics).
+        folds : {fold name: backtest_tournament() output}.
+    """
+    squad_features = squad_features or {}
+    predictor_params = predictor_params or {}
+    n_workers = min(n_workers or os.cpu_count() or 1, max(len(folds), 1))
+
+    if n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [
+                executor.submit(
+                    _run_fold_result, fold, rankings_by_year, squad_features, predictor_params,
+                )
+                for fold in folds
+            ]
+            outputs = [f.result() for f in futures]
+    else:
+        outputs = []
+        previous = None
+        for fold in folds:
+            result, previous = _run_fold(
+                fold, rankings_by_year, squad_features, predictor_params, warm_start=previous,
+            )
+            outputs.append(result)
+
+    rows = []
+    for fold, result in zip(folds, outputs):
+        rows.append({"fold": fold["name"], "n_train": len(fold["train_df"]), **result["metrics"]})
+    results = pd.DataFrame(rows)
+
+    logger.info("Backtest complete: %d folds (%d workers)", len(folds), n_workers)
+    return {
+        "results": results,
+        "folds": {fold["name"]: result for fold, result in zip(folds, outputs)},
+    }
+
+
 def plot_calibration(
     calibration_df: pd.DataFrame,
     title: str = "Calibration Plot",
@@ -352,3 +378,47 @@ def plot_calibration(
 
     plt.tight_layout()
     return fig
+
+
+# ------------------------------------------------------------------
+# Internal helpers
+# ------------------------------------------------------------------
+
+def _outcome_column(outcomes: np.ndarray) -> np.ndarray:
+    """Prediction column for each outcome (2=win_a -> 0, 1=draw -> 1, 0=win_b -> 2)."""
+    return 2 - np.clip(np.asarray(outcomes, dtype=int), 0, 2)
+
+
+def _one_hot(outcomes: np.ndarray) -> np.ndarray:
+    """One-hot encode outcomes as [win_a, draw, win_b] rows."""
+    return np.eye(3)[_outcome_column(outcomes)]
+
+
+def _run_fold(
+    fold: Dict,
+    rankings_by_year: Dict[int, pd.DataFrame],
+    squad_features: Dict[str, Dict[str, float]],
+    predictor_params: Dict[str, Any],
+    warm_start=None,
+) -> Tuple[Dict[str, Any], Any]:
+    """Fit a predictor on one fold's training data and backtest it."""
+    from .ensemble import MatchPredictor
+    from .features import build_training_matrix
+
+    X_train, y_train = build_training_matrix(fold["train_df"], rankings_by_year)
+    predictor = MatchPredictor(**predictor_params)
+    predictor.fit(fold["train_df"], X_train, y_train, warm_start=warm_start)
+
+    result = backtest_tournament(
+        predictor=predictor,
+        tournament_matches=fold["test_df"],
+        rankings_df=fold["rankings_df"],
+        squad_features=squad_features,
+        tournament_name=fold["name"],
+    )
+    return result, predictor
+
+
+def _run_fold_result(*args) -> Dict[str, Any]:
+    """Process-pool entry point: backtest output only (predictor stays in the worker)."""
+    return _run_fold(*args)[0]
@@ -6,7 +6,8 @@ the "first" team as listed in the fixture).
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
@@ -18,10 +19,124 @@ from ._config import (
     HOST_COUNTRIES,
     QUALIFIED_TEAMS,
     SQUAD_FEATURES,
+    TEAM_NAME_ALIASES,
 )
 
 logger = logging.getLogger(__name__)
 
+# Per-team squad metrics (suffixed _a/_b in the feature vector)
+_SQUAD_KEYS = [
+    "squad_avg_rating", "squad_attack_xg", "squad_attack_xa",
+    "squad_defense_tackles", "squad_defense_interceptions",
+    "squad_gk_saves", "squad_gk_clean_sheet",
+    "squad_total_market_value", "squad_median_market_value",
+    "squad_top5_rating", "squad_big_league_pct",
+    "squad_avg_age", "squad_depth_rating_std", "squad_avg_pass_accuracy",
+]
+
+
+# ------------------------------------------------------------------
+# Rankings lookup
+# ------------------------------------------------------------------
+
+class RankingsIndex:
+    """O(1) team lookups over an ELO rankings frame.
+
+    Team names resolve exactly first, then case-folded, then through
+    TEAM_NAME_ALIASES (in either direction). ELO columns are held as
+    contiguous float arrays; the index keeps no reference to the frame.
+
+    Use get_rankings_index() to share one index per rankings frame.
+    """
+
+    def __init__(
+        self,
+        rankings_df: pd.DataFrame,
+        aliases: Optional[Dict[str, str]] = None,
+    ):
+        self.teams: List[str] = list(rankings_df.index)
+        self._records: List[Dict] = rankings_df.to_dict("records")
+        self._columns: Dict[str, np.ndarray] = {
+            col: pd.to_numeric(rankings_df[col], errors="coerce").to_numpy(dtype=float)
+            for col in rankings_df.columns
+        }
+
+        self._exact: Dict[str, int] = {}
+        self._folded: Dict[str, int] = {}
+        for pos, name in enumerate(self.teams):
+            self._exact.setdefault(name, pos)
+            self._folded.setdefault(str(name).casefold(), pos)
+
+        for alias, name in (TEAM_NAME_ALIASES if aliases is None else aliases).items():
+            alias, name = alias.casefold(), name.casefold()
+            if name in self._folded:
+                self._folded.setdefault(alias, self._folded[name])
+            elif alias in self._folded:
+                self._folded[name] = self._folded[alias]
+
+    def __len__(self) -> int:
+        return len(self.teams)
+
+    def __contains__(self, team: str) -> bool:
+        return self.position(team) >= 0
+
+    def position(self, team: str) -> int:
+        """Row position of a team in the rankings frame, or -1 if unknown."""
+        pos = self._exact.get(team)
+        if pos is None:
+            pos = self._folded.get(str(team).casefold(), -1)
+        return pos
+
+    def positions(self, teams: Iterable[str]) -> np.ndarray:
+        """Vector of row positions (-1 for unknown teams)."""
+        return np.array([self.position(t) for t in teams], dtype=np.intp)
+
+    def column(self, name: str) -> np.ndarray:
+        """ELO column as a float array aligned with the rankings rows."""
+        values = self._columns.get(name)
+        if values is None:
+            values = np.full(len(self.teams), np.nan)
+        return values
+
+    def get(self, team: str, column: str, default: float = np.nan) -> float:
+        """Single ELO value for a team, ``default`` if the team is unknown."""
+        pos = self.position(team)
+        return default if pos < 0 else float(self.column(column)[pos])
+
+    def values(self, teams: Iterable[str], column: str, default: float = np.nan) -> np.ndarray:
+        """ELO values for many teams, ``default`` where the team is unknown."""
+        pos = self.positions(teams)
+        out = self.column(column)[np.maximum(pos, 0)] if len(self.teams) else np.empty(len(pos))
+        return np.where(pos >= 0, out, default)
+
+    def row(self, team: str) -> Dict:
+        """Full rankings row for a team as a dict ({} if unknown)."""
+        pos = self.position(team)
+        return {} if pos < 0 else dict(self._records[pos])
+
+
+_RANKINGS_INDEXES: Dict[int, Tuple[weakref.ref, RankingsIndex]] = {}
+
+
+def get_rankings_index(rankings_df: pd.DataFrame) -> RankingsIndex:
+    """Return the cached RankingsIndex for a rankings frame, building it once.
+
+    The cache holds a weak reference to the frame, so entries go away with
+    it. Frames are treated as read-only: build a new frame (or a
+    RankingsIndex directly) after editing rankings in place.
+    """
+    key = id(rankings_df)
+    cached = _RANKINGS_INDEXES.get(key)
+    if cached is not None and cached[0]() is rankings_df:
+        return cached[1]
+
+    index = RankingsIndex(rankings_df)
+    _RANKINGS_INDEXES[key] = (
+        weakref.ref(rankings_df, lambda _, key=key: _RANKINGS_INDEXES.pop(key, None)),
+        index,
+    )
+    return index
+
 
 def build_elo_features(
     team_a: str,
@@ -92,14 +207,7 @@ def build_squad_features_pair(
     sa = squad_features.get(team_a, {})
     sb = squad_features.get(team_b, {})
 
-    for key in [
-        "squad_avg_rating", "squad_attack_xg", "squad_attack_xa",
-        "squad_defense_tackles", "squad_defense_interceptions",
-        "squad_gk_saves", "squad_gk_clean_sheet",
-        "squad_total_market_value", "squad_median_market_value",
-        "squad_top5_rating", "squad_big_league_pct",
-        "squad_avg_age", "squad_depth_rating_std", "squad_avg_pass_accuracy",
-    ]:
+    for key in _SQUAD_KEYS:
         feat[f"{key}_a"] = sa.get(key, 0.0)
         feat[f"{key}_b"] = sb.get(key, 0.0)
 
@@ -209,6 +317,47 @@ def build_match_features(
     return feat
 
 
+def build_fixture_features(
+    teams_a: Sequence[str],
+    teams_b: Sequence[str],
+    rankings_df: pd.DataFrame,
+    squad_features: Dict[str, Dict[str, float]],
+    stage: int = 0,
+) -> pd.DataFrame:
+    """Build the feature matrix for many fixtures at once.
+
+    Columnar equivalent of calling build_match_features() per fixture with
+    default context (no h2h record, 3 rest days, no must-win flags).
+
+    Parameters
+    ----------
+    teams_a, teams_b : sequence of str
+        Team names, one pair per fixture.
+    rankings_df : pd.DataFrame
+        Current ELO rankings.
+    squad_features : dict
+        Output of squad_builder.build_all_squads().
+    stage : int
+        Tournament stage for every fixture.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per fixture with ALL_FEATURES columns.
+    """
+    df = pd.DataFrame({"team1": list(teams_a), "team2": list(teams_b)})
+    if df.empty:
+        return pd.DataFrame(columns=ALL_FEATURES, dtype=float)
+
+    key = pd.Series(0, index=df.index)
+    return _feature_frame(
+        df,
+        _elo_feature_frame(df, key, {0: rankings_df}),
+        _squad_feature_frame(df, key, {0: squad_features}),
+        stage=stage,
+    )
+
+
 def build_training_matrix(
     matches_df: pd.DataFrame,
     rankings_by_year: Dict[int, pd.DataFrame],
@@ -233,61 +382,40 @@ def build_training_matrix(
     y : pd.Series
         Target: 2=team1 win, 1=draw, 0=team2 win.
     """
-    rows = []
-    targets = []
-
-    empty_squad = {}
-
-    for _, match in matches_df.iterrows():
-        team_a = match["team1"]
-        team_b = match["team2"]
-        score_a = int(match["team1_score"])
-        score_b = int(match["team2_score"])
-
-        # Determine year for feature lookup
-        if "date" in match and pd.notna(match.get("date")):
-            year = pd.to_datetime(match["date"]).year
-        elif "year" in match:
-            year = int(match["year"])
-        else:
-            continue
-
-        # Get rankings for that year (fallback to nearest available)
-        rankings = _get_nearest_rankings(year, rankings_by_year)
-        if rankings is None:
-            continue
-
-        # Get squad features for that year
-        if squad_features_by_year:
-            squad = squad_features_by_year.get(year, empty_squad)
-        else:
-            squad = empty_squad
-
-        feat = build_match_features(
-            team_a, team_b,
-            rankings_df=rankings,
-            squad_features=squad,
-            stage=0,
-        )
-        rows.append(feat)
-
-        # Target: 2=win_a, 1=draw, 0=win_b
-        if score_a > score_b:
-            targets.append(2)
-        elif score_a == score_b:
-            targets.append(1)
-        else:
-            targets.append(0)
-
-    X = pd.DataFrame(rows)
-    y = pd.Series(targets, name="result")
-
-    # Ensure all expected columns exist (fill missing with 0)
-    for col in ALL_FEATURES:
-        if col not in X.columns:
-            X[col] = 0.0
+    df = matches_df.reset_index(drop=True)
 
-    X = X[ALL_FEATURES].fillna(0.0)
+    # Determine year for feature lookup (date first, then explicit year column)
+    if "date" in df.columns:
+        year = pd.to_datetime(df["date"]).dt.year
+    else:
+        year = pd.Series(np.nan, index=df.index)
+    if "year" in df.columns:
+        year = year.fillna(pd.to_numeric(df["year"], errors="coerce"))
+    keep = year.notna()
+    if not rankings_by_year:
+        keep[:] = False
+    df = df[keep].reset_index(drop=True)
+    year = year[keep].astype(int).reset_index(drop=True)
+    if df.empty:
+        return pd.DataFrame(columns=ALL_FEATURES, dtype=float), pd.Series([], dtype=int, name="result")
+
+    # Rankings for that year (fallback to nearest available)
+    rank_year = year.map({y: _nearest_year(y, rankings_by_year) for y in year.unique()})
+
+    X = _feature_frame(
+        df,
+        _elo_feature_frame(df, rank_year, rankings_by_year),
+        _squad_feature_frame(df, year, squad_features_by_year),
+        stage=0,
+    )
+
+    # Target: 2=win_a, 1=draw, 0=win_b
+    score_a = df["team1_score"].astype(int)
+    score_b = df["team2_score"].astype(int)
+    y = pd.Series(
+        np.select([score_a > score_b, score_a == score_b], [2, 1], default=0),
+        name="result",
+    )
 
     logger.info("Training matrix built: %d matches, %d features", len(X), len(ALL_FEATURES))
     return X, y
@@ -298,28 +426,136 @@ def build_training_matrix(
 # ------------------------------------------------------------------
 
 def _get_team_elo(team_name: str, rankings_df: pd.DataFrame) -> Dict:
-    """Get ELO data for a team, with case-insensitive fallback."""
+    """Get ELO data for a team, with case-insensitive / alias fallback."""
     if rankings_df.empty:
         return {}
-    # Exact match
-    if team_name in rankings_df.index:
-        return rankings_df.loc[team_name].to_dict()
-    # Case-insensitive
-    lower_idx = rankings_df.index.str.lower()
-    mask = lower_idx == team_name.lower()
-    if mask.any():
-        return rankings_df[mask].iloc[0].to_dict()
-    return {}
-
-
-def _get_nearest_rankings(
-    year: int,
+    return get_rankings_index(rankings_df).row(team_name)
+
+
+# ELO columns read per team, with the defaults used for unknown teams
+_ELO_DEFAULTS = {
+    "elo_rating": 1500,
+    "elo_rating_average": 1500,
+    "elo_rating_3m_chg": 0,
+    "elo_rating_6m_chg": 0,
+    "elo_rating_1y_chg": 0,
+    "elo_total_matches": 0,
+    "elo_wins": 0,
+    "elo_goals_for": 0,
+}
+
+
+def _elo_feature_frame(
+    df: pd.DataFrame,
+    rank_year: pd.Series,
     rankings_by_year: Dict[int, pd.DataFrame],
-) -> Optional[pd.DataFrame]:
-    """Get rankings for exact year, or nearest available."""
+) -> pd.DataFrame:
+    """Columnar equivalent of build_elo_features for every match row.
+
+    All rankings are stacked into one (year, row) keyed table and joined
+    once per side; team names resolve to rows through RankingsIndex.
+    """
+    cols = list(_ELO_DEFAULTS)
+    frames = []
+    for y in rank_year.unique():
+        rk = rankings_by_year[y]
+        frames.append(
+            rk.reindex(columns=cols).reset_index(drop=True)
+            .assign(_rank_year=y, _pos=np.arange(len(rk)))
+        )
+    table = pd.concat(frames, ignore_index=True)
+    table["_found"] = True
+
+    def resolve(team: pd.Series) -> np.ndarray:
+        keys = pd.DataFrame({"y": rank_year, "t": team})
+        unique = keys.drop_duplicates()
+        pos = {
+            (y, t): get_rankings_index(rankings_by_year[y]).position(t)
+            for y, t in zip(unique["y"], unique["t"])
+        }
+        return np.array([pos[k] for k in zip(keys["y"], keys["t"])], dtype=np.intp)
+
+    feat = pd.DataFrame(index=df.index)
+    sides = {}
+    for suffix, team_col in [("a", "team1"), ("b", "team2")]:
+        keys = pd.DataFrame({"_rank_year": rank_year, "_pos": resolve(df[team_col])})
+        side = keys.merge(table, on=["_rank_year", "_pos"], how="left")
+        side.index = df.index
+        missing = side["_found"].isna()
+        for col, default in _ELO_DEFAULTS.items():
+            side[col] = side[col].astype(float).mask(missing, default)
+        sides[suffix] = side
+
+    ra, rb = sides["a"], sides["b"]
+    feat["elo_rating_diff"] = ra["elo_rating"] - rb["elo_rating"]
+    feat["elo_rating_avg_diff"] = ra["elo_rating_average"] - rb["elo_rating_average"]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for suffix, data in sides.items():
+            feat[f"elo_rating_3m_chg_{suffix}"] = data["elo_rating_3m_chg"]
+            feat[f"elo_rating_6m_chg_{suffix}"] = data["elo_rating_6m_chg"]
+            feat[f"elo_rating_1y_chg_{suffix}"] = data["elo_rating_1y_chg"]
+
+            total = data["elo_total_matches"]
+            feat[f"elo_win_pct_{suffix}"] = np.where(total > 0, data["elo_wins"] / total, 0.0)
+            feat[f"elo_goals_per_match_{suffix}"] = np.where(total > 0, data["elo_goals_for"] / total, 0.0)
+            feat[f"elo_form_momentum_{suffix}"] = data["elo_rating_3m_chg"] - data["elo_rating_1y_chg"]
+
+    return feat
+
+
+def _squad_feature_frame(
+    df: pd.DataFrame,
+    year: pd.Series,
+    squad_features_by_year: Optional[Dict[int, Dict[str, Dict[str, float]]]],
+) -> pd.DataFrame:
+    """Columnar equivalent of build_squad_features_pair (0.0 when unknown)."""
+    feat = pd.DataFrame(index=df.index)
+    records = [
+        {"_year": y, "_team": team, **values}
+        for y, squads in (squad_features_by_year or {}).items()
+        for team, values in squads.items()
+    ]
+    table = pd.DataFrame(records).reindex(columns=["_year", "_team"] + _SQUAD_KEYS)
+
+    for suffix, team_col in [("a", "team1"), ("b", "team2")]:
+        keys = pd.DataFrame({"_year": year, "_team": df[team_col]})
+        side = keys.merge(table, on=["_year", "_team"], how="left")
+        for key in _SQUAD_KEYS:
+            feat[f"{key}_{suffix}"] = side[key].fillna(0.0).to_numpy()
+
+    return feat
+
+
+def _feature_frame(
+    df: pd.DataFrame,
+    elo: pd.DataFrame,
+    squad: pd.DataFrame,
+    stage: int,
+) -> pd.DataFrame:
+    """Assemble ALL_FEATURES from ELO/squad frames plus default context."""
+    X = pd.DataFrame(index=df.index)
+    for col in ALL_FEATURES:
+        if col in elo:
+            X[col] = elo[col]
+        elif col in squad:
+            X[col] = squad[col]
+    X["tournament_stage"] = stage
+    X["is_host_a"] = df["team1"].isin(HOST_COUNTRIES).astype(float)
+    X["is_host_b"] = df["team2"].isin(HOST_COUNTRIES).astype(float)
+    X["rest_days_a"] = 3
+    X["rest_days_b"] = 3
+    X["group_match_number"] = 0
+    X["must_win_a"] = 0.0
+    X["must_win_b"] = 0.0
+    X["h2h_win_pct"] = 0.0
+    X["h2h_goal_diff"] = 0.0
+    X["h2h_matches"] = 0
+    return X[ALL_FEATURES].fillna(0.0)
+
+
+def _nearest_year(year: int, rankings_by_year: Dict[int, pd.DataFrame]) -> int:
+    """Key of the rankings to use for a year: exact, or nearest available."""
     if year in rankings_by_year:
-        return rankings_by_year[year]
-    if not rankings_by_year:
-        return None
-    nearest = min(rankings_by_year.keys(), key=lambda y: abs(y - year))
-    return rankings_by_year[nearest]
+        return year
+    return min(rankings_by_year.keys(), key=lambda y: abs(y - year))
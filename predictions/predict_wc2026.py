@@ -5,6 +5,7 @@ Usage: python predictions/predict_wc2026.py
 """
 
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -17,6 +18,7 @@ from predictions._config import (
     BACKTEST_TOURNAMENTS,
     GROUPS,
     MC_SIMULATIONS,
+    MC_TOLERANCE,
     QUALIFIED_TEAMS,
 )
 from predictions.data_collector import (
@@ -25,7 +27,7 @@ from predictions.data_collector import (
     prepare_backtest_data,
 )
 from predictions.ensemble import MatchPredictor
-from predictions.evaluation import backtest_tournament, plot_calibration
+from predictions.evaluation import plot_calibration, run_backtest
 from predictions.features import build_training_matrix
 from predictions.simulation import TournamentSimulator
 
@@ -148,20 +150,35 @@ def option_simulate():
     squad_features = {}  # Load separately if available
 
     n_sims = MC_SIMULATIONS
-    custom = input(f"  Simulations [{n_sims}]: ").strip()
+    custom = input(f"  Max simulations [{n_sims}]: ").strip()
     if custom.isdigit():
         n_sims = int(custom)
 
-    print(f"Running {n_sims:,} simulations...")
+    n_workers = os.cpu_count() or 1
+    custom = input(f"  Worker processes [{n_workers}]: ").strip()
+    if custom.isdigit() and int(custom) > 0:
+        n_workers = int(custom)
+
+    print(f"Running up to {n_sims:,} simulations on {n_workers} worker(s)...")
     simulator = TournamentSimulator(
         predictor=predictor,
         rankings_df=rankings_df,
         squad_features=squad_features,
         n_simulations=n_sims,
+        n_workers=n_workers,
+        tolerance=MC_TOLERANCE,
     )
 
     results = simulator.simulate_tournament()
 
+    conv = results.get("convergence", {})
+    if conv:
+        status = "converged" if conv["converged"] else "NOT converged"
+        print(
+            f"  {conv['n_simulations']:,} simulations in {conv['batches']} batches, "
+            f"{conv['elapsed_s']:.1f}s ({status}, max CI half-width {conv['max_half_width']:.4f})"
+        )
+
     # Display results
     tp = results["team_probabilities"]
     if not tp.empty:
@@ -214,25 +231,19 @@ def option_backtest():
         print(f"  Train: {len(fold['train_df'])} matches")
         print(f"  Test: {len(fold['test_df'])} matches")
 
-        # Build features and train
-        X_train, y_train = build_training_matrix(
-            fold["train_df"], rankings_by_year
-        )
-
-        predictor = MatchPredictor()
-        predictor.fit(fold["train_df"], X_train, y_train)
+    # 1 worker: folds run in order, warm-starting each Dixon-Coles fit from
+    # the last; more workers fit the folds concurrently from a cold start
+    n_workers = 1
+    custom = input(f"  Worker processes [{n_workers}]: ").strip()
+    if custom.isdigit() and int(custom) > 0:
+        n_workers = int(custom)
 
-        # Backtest
-        result = backtest_tournament(
-            predictor=predictor,
-            tournament_matches=fold["test_df"],
-            rankings_df=fold["rankings_df"],
-            squad_features={},
-            tournament_name=fold["name"],
-        )
+    backtest = run_backtest(folds, rankings_by_year, n_workers=n_workers)
 
+    for fold in folds:
+        result = backtest["folds"][fold["name"]]
         m = result["metrics"]
-        print(f"  Results:")
+        print(f"\n  Results: {fold['name']}")
         print(f"    Brier Score: {m['brier_score']:.4f} (random: {m['baseline_random_brier']:.4f}, ELO: {m['baseline_elo_brier']:.4f})")
         print(f"    Log Loss:    {m['log_loss']:.4f} (random: {m['baseline_random_ll']:.4f}, ELO: {m['baseline_elo_ll']:.4f})")
         print(f"    Accuracy:    {m['accuracy']:.1%}")
@@ -250,6 +261,15 @@ def option_backtest():
         except Exception as e:
             logger.debug("Could not save calibration plot: %s", e)
 
+    results = backtest["results"]
+    print("\n  Summary:")
+    print(results[["fold", "n_matches", "brier_score", "log_loss", "accuracy", "rps"]].to_string(index=False))
+
+    PREDICTIONS_DIR.mkdir(parents=True, exist_ok=True)
+    path = PREDICTIONS_DIR / "backtest_results.csv"
+    results.to_csv(path, index=False)
+    print(f"  Saved: {path}")
+
 
 def option_export(results=None):
     """Export predictions to CSV."""
@@ -2,10 +2,15 @@
 
 Simulates group stage + knockout bracket N times (default 100K) to produce
 probability distributions for each team advancing to each round.
-Uses vectorized NumPy for performance (~2 min for 100K simulations).
+Uses vectorized NumPy for performance; runs can be split across a process
+pool with independent SeedSequence streams per worker.
 """
 
 import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
@@ -14,6 +19,8 @@ import pandas as pd
 from ._config import (
     GROUPS,
     HOST_COUNTRIES,
+    MC_BATCH_SIZE,
+    MC_CONFIDENCE_Z,
     MC_SEED,
     MC_SIMULATIONS,
     QUALIFIED_TEAMS,
@@ -22,6 +29,9 @@ from .ensemble import MatchPredictor
 
 logger = logging.getLogger(__name__)
 
+# Round labels by depth (from R32 inward)
+ROUND_LABELS = ["p_r32", "p_r16", "p_qf", "p_sf", "p_final", "p_champion"]
+
 
 class TournamentSimulator:
     """Monte Carlo simulator for 48-team World Cup.
@@ -35,9 +45,19 @@ class TournamentSimulator:
     squad_features : dict
         Squad features for all teams.
     n_simulations : int
-        Number of Monte Carlo runs.
+        Number of Monte Carlo runs (upper bound when tolerance is set).
     seed : int
         Random seed for reproducibility.
+    n_workers : int, optional
+        Worker processes. 1 (default) runs in-process on a single stream;
+        None uses every available core. Results are reproducible for a
+        given (seed, n_workers) pair.
+    tolerance : float, optional
+        Early-stopping target: simulate in batches and stop once the 95% CI
+        half-width of every team's p_champion and p_final is below this.
+        None (default) runs exactly n_simulations.
+    batch_size : int
+        Simulations per convergence check (only used with tolerance).
     """
 
     def __init__(
@@ -47,13 +67,19 @@ class TournamentSimulator:
         squad_features: Dict[str, Dict[str, float]],
         n_simulations: int = MC_SIMULATIONS,
         seed: int = MC_SEED,
+        n_workers: Optional[int] = 1,
+        tolerance: Optional[float] = None,
+        batch_size: int = MC_BATCH_SIZE,
     ):
         self.predictor = predictor
         self.rankings_df = rankings_df
         self.squad_features = squad_features
         self.n_sims = n_simulations
+        self.seed = seed
+        self.n_workers = n_workers if n_workers is not None else (os.cpu_count() or 1)
+        self.tolerance = tolerance
+        self.batch_size = batch_size
         self.rng = np.random.default_rng(seed)
-        self._match_cache: Dict[Tuple[str, str], Dict] = {}
 
     def simulate_tournament(
         self,
@@ -72,6 +98,8 @@ class TournamentSimulator:
             - team_probabilities: DataFrame with P(advance), P(R16)..P(champion)
             - group_standings: Dict[group_letter -> DataFrame]
             - match_predictions: DataFrame with all group match predictions
+            - convergence: Dict with n_simulations, batches, converged,
+              max_half_width and elapsed_s
         """
         if groups is None:
             groups = GROUPS
@@ -85,50 +113,32 @@ class TournamentSimulator:
 
         if not valid_groups:
             logger.error("No valid groups found. Provide groups with real team names.")
-            return {"team_probabilities": pd.DataFrame(), "group_standings": {}, "match_predictions": pd.DataFrame()}
-
-        logger.info("Simulating tournament: %d groups, %d simulations", len(valid_groups), self.n_sims)
-
-        # Pre-compute all group match probabilities
-        group_match_probs = self._precompute_group_matches(valid_groups)
+            return {
+                "team_probabilities": pd.DataFrame(),
+                "group_standings": {},
+                "match_predictions": pd.DataFrame(),
+                "convergence": {},
+            }
+
+        n_workers = max(1, min(self.n_workers, self.n_sims))
+        logger.info(
+            "Simulating tournament: %d groups, %d simulations, %d worker(s)",
+            len(valid_groups), self.n_sims, n_workers,
+        )
+
+        # Pre-compute every pairwise probability in one batched inference
+        team_index, probs, lambdas, p_advance = self._precompute_probabilities(valid_groups)
+        group_match_probs = self._precompute_group_matches(valid_groups, team_index, probs, lambdas)
 
         # Pre-compute match predictions for output
         match_predictions = self._build_match_predictions(valid_groups, group_match_probs)
 
-        # Simulate group stages
-        group_results = {}
-        group_standings = {}
-        for letter, teams in valid_groups.items():
-            standings, positions = self._simulate_group(teams, group_match_probs, letter)
-            group_results[letter] = positions  # {team: [finish_position per sim]}
-            group_standings[letter] = standings
-
-        # Collect group winners and runners-up for knockout
-        team_probs = self._simulate_knockout(valid_groups, group_results)
-
-        # Add group advance probabilities
-        for team, probs in team_probs.items():
-            for letter, positions in group_results.items():
-                if team in positions:
-                    finishes = positions[team]
-                    probs["p_group_1st"] = float(np.mean(finishes == 1))
-                    probs["p_group_2nd"] = float(np.mean(finishes == 2))
-                    probs["p_group_3rd"] = float(np.mean(finishes == 3))
-                    probs["p_group_advance"] = probs["p_group_1st"] + probs["p_group_2nd"]
-                    break
-
-        # Build output DataFrame
-        prob_rows = []
-        for team, probs in team_probs.items():
-            row = {"team": team}
-            row.update(probs)
-            prob_rows.append(row)
+        tables = {"group_probs": probs[0], "lambdas": lambdas, "p_advance": p_advance}
+        tallies, convergence = self._run_batches(valid_groups, team_index, tables, n_workers)
 
-        team_probabilities = pd.DataFrame(prob_rows)
-        if not team_probabilities.empty:
-            team_probabilities = team_probabilities.sort_values(
-                "p_champion", ascending=False
-            ).reset_index(drop=True)
+        team_probabilities, group_standings = self._summarize(
+            valid_groups, team_index, tallies, convergence["n_simulations"],
+        )
 
         logger.info("Simulation complete. Top 5 favorites:")
         for _, row in team_probabilities.head(5).iterrows():
@@ -143,81 +153,302 @@ class TournamentSimulator:
             "team_probabilities": team_probabilities,
             "group_standings": group_standings,
             "match_predictions": match_predictions,
+            "convergence": convergence,
         }
 
+    def _precompute_probabilities(
+        self,
+        groups: Dict[str, List[str]],
+    ) -> Tuple[Dict[str, int], np.ndarray, np.ndarray, np.ndarray]:
+        """Predict all ordered team pairs for every stage in one call.
+
+        Returns
+        -------
+        team_index : dict
+            {team: axis position in the probability tensors}.
+        probs : np.ndarray
+            Shape (n_stages, n, n, 3) 90-minute [win_a, draw, win_b]; stage 0
+            is the group stage, stage k the k-th knockout round.
+        lambdas : np.ndarray
+            Shape (n, n, 2) Dixon-Coles expected goals.
+        p_advance : np.ndarray
+            Shape (n_stages, n, n) P(team i advances vs team j) after ET/PKs.
+        """
+        teams = [team for letter in sorted(groups) for team in groups[letter]]
+        team_index = {team: i for i, team in enumerate(teams)}
+
+        # Knockout rounds for a bracket of group winners + runners-up
+        n_rounds = 0
+        size = 2 * len(groups)
+        while size > 1:
+            size = (size + 1) // 2
+            n_rounds += 1
+        stages = list(range(n_rounds + 1))
+
+        probs, lambdas = self.predictor.predict_matrix(
+            teams,
+            rankings_df=self.rankings_df,
+            squad_features=self.squad_features,
+            stages=stages,
+            return_lambdas=True,
+        )
+        p_advance = self.predictor.predict_knockout_matrix(
+            teams,
+            rankings_df=self.rankings_df,
+            squad_features=self.squad_features,
+            stages=stages,
+            probs=probs,
+        )
+        logger.debug("Pre-computed %d teams x %d stages probability tensor", len(teams), len(stages))
+        return team_index, probs, lambdas, p_advance
+
     def _precompute_group_matches(
         self,
         groups: Dict[str, List[str]],
+        team_index: Dict[str, int],
+        probs: np.ndarray,
+        lambdas: np.ndarray,
     ) -> Dict[Tuple[str, str], Dict[str, float]]:
         """Pre-compute match probabilities for all group fixtures."""
-        probs = {}
+        match_probs = {}
         for letter, teams in groups.items():
             for i in range(len(teams)):
                 for j in range(i + 1, len(teams)):
-                    key = (teams[i], teams[j])
-                    if key not in self._match_cache:
-                        pred = self.predictor.predict(
-                            teams[i], teams[j],
-                            rankings_df=self.rankings_df,
-                            squad_features=self.squad_features,
-                            stage=0,
-                        )
-                        self._match_cache[key] = pred
-                    probs[key] = self._match_cache[key]
-        logger.debug("Pre-computed %d group match probabilities", len(probs))
-        return probs
+                    a, b = team_index[teams[i]], team_index[teams[j]]
+                    p_win_a, p_draw, p_win_b = probs[0, a, b]
+                    match_probs[(teams[i], teams[j])] = {
+                        "p_win_a": float(p_win_a),
+                        "p_draw": float(p_draw),
+                        "p_win_b": float(p_win_b),
+                        "lambda_a": float(lambdas[a, b, 0]),
+                        "lambda_b": float(lambdas[a, b, 1]),
+                    }
+        logger.debug("Pre-computed %d group match probabilities", len(match_probs))
+        return match_probs
+
+    def _run_batches(
+        self,
+        groups: Dict[str, List[str]],
+        team_index: Dict[str, int],
+        tables: Dict[str, np.ndarray],
+        n_workers: int,
+    ) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        """Simulate in batches, stopping early once estimates converge.
+
+        Without a tolerance the whole run is a single batch. With one,
+        batches of batch_size are added until the largest p_champion /
+        p_final CI half-width drops below the tolerance or n_simulations
+        is exhausted.
+
+        Returns
+        -------
+        tallies : dict
+            Summed tallies over all batches (see _simulate_chunk).
+        convergence : dict
+            n_simulations, batches, converged, max_half_width, elapsed_s.
+        """
+        batch_size = self.n_sims if self.tolerance is None else max(1, self.batch_size)
+        seed_seq = np.random.SeedSequence(self.seed)
+        start = time.perf_counter()
+
+        tallies: Optional[Dict[str, np.ndarray]] = None
+        n_done = 0
+        batches = 0
+        half_width = float("nan")
+        converged = self.tolerance is None
+
+        executor = None
+        blocks = []
+        try:
+            if n_workers > 1:
+                blocks, specs = _share_tables(tables)
+                executor = ProcessPoolExecutor(
+                    max_workers=n_workers,
+                    initializer=_attach_tables,
+                    initargs=(specs,),
+                )
+
+            while n_done < self.n_sims:
+                n = min(batch_size, self.n_sims - n_done)
+                if executor is None:
+                    batch = self._simulate_chunk(groups, team_index, tables, n, self.rng)
+                else:
+                    batch = self._simulate_parallel(
+                        executor, groups, team_index, n, seed_seq.spawn(n_workers),
+                    )
+                tallies = batch if tallies is None else _reduce_tallies([tallies, batch])
+                n_done += n
+                batches += 1
+
+                half_width = self._max_half_width(tallies, n_done)
+                if self.tolerance is not None:
+                    logger.info(
+                        "Batch %d: %d simulations, max CI half-width %.4f (target %.4f)",
+                        batches, n_done, half_width, self.tolerance,
+                    )
+                    if half_width < self.tolerance:
+                        converged = True
+                        break
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+        elapsed = time.perf_counter() - start
+        if self.tolerance is not None:
+            if converged:
+                logger.info("Converged after %d batches (%d simulations) in %.1fs", batches, n_done, elapsed)
+            else:
+                logger.warning(
+                    "Not converged after %d simulations (max half-width %.4f > %.4f)",
+                    n_done, half_width, self.tolerance,
+                )
+
+        convergence = {
+            "n_simulations": n_done,
+            "batches": batches,
+            "converged": converged,
+            "max_half_width": half_width,
+            "elapsed_s": elapsed,
+        }
+        return tallies, convergence
+
+    @staticmethod
+    def _max_half_width(tallies: Dict[str, np.ndarray], n: int) -> float:
+        """Largest binomial CI half-width across p_champion and p_final."""
+        p = np.concatenate([tallies["p_champion"], tallies["p_final"]]) / n
+        return float(MC_CONFIDENCE_Z * np.sqrt(p * (1 - p) / n).max())
+
+    @staticmethod
+    def _simulate_parallel(
+        executor: ProcessPoolExecutor,
+        groups: Dict[str, List[str]],
+        team_index: Dict[str, int],
+        n: int,
+        seeds: List[np.random.SeedSequence],
+    ) -> Dict[str, np.ndarray]:
+        """Split n simulations into one chunk per seed and reduce their tallies.
+
+        Each chunk draws from its own SeedSequence child, and the workers
+        read the probability tables from shared memory.
+        """
+        base, extra = divmod(n, len(seeds))
+        sizes = [base + (1 if k < extra else 0) for k in range(len(seeds))]
+        chunks = list(executor.map(
+            _run_chunk,
+            [groups] * len(seeds),
+            [team_index] * len(seeds),
+            sizes,
+            seeds,
+        ))
+        return _reduce_tallies(chunks)
+
+    @classmethod
+    def _simulate_chunk(
+        cls,
+        groups: Dict[str, List[str]],
+        team_index: Dict[str, int],
+        tables: Dict[str, np.ndarray],
+        n: int,
+        rng: np.random.Generator,
+    ) -> Dict[str, np.ndarray]:
+        """Simulate n tournaments and return additive tallies.
+
+        Returns
+        -------
+        Dict of arrays indexed by team position in team_index:
+            points, goal_diff, goals_for : summed group totals, shape (n_teams,)
+            finish : group finish counts, shape (n_teams, max(4, group size))
+            p_r32 .. p_champion : round-reach counts, shape (n_teams,)
+        """
+        n_teams = len(team_index)
+        width = max(4, max(len(t) for t in groups.values()))
+        tallies = {
+            "points": np.zeros(n_teams),
+            "goal_diff": np.zeros(n_teams),
+            "goals_for": np.zeros(n_teams),
+            "finish": np.zeros((n_teams, width), dtype=np.int64),
+        }
+
+        group_results = {}
+        for letter, teams in groups.items():
+            group_idx = np.array([team_index[t] for t in teams])
+            points, goal_diff, goals_for, finish = cls._simulate_group(
+                group_idx, tables["group_probs"], tables["lambdas"], n, rng,
+            )
+            group_results[letter] = (group_idx, finish)
+
+            tallies["points"][group_idx] += points.sum(axis=0)
+            tallies["goal_diff"][group_idx] += goal_diff.sum(axis=0)
+            tallies["goals_for"][group_idx] += goals_for.sum(axis=0)
+            for pos in range(len(teams)):
+                tallies["finish"][group_idx, pos] += (finish == pos + 1).sum(axis=0)
+
+        tallies.update(cls._simulate_knockout(group_results, tables["p_advance"], n_teams, n, rng))
+        return tallies
 
+    @classmethod
     def _simulate_group(
-        self,
-        teams: List[str],
-        match_probs: Dict[Tuple[str, str], Dict[str, float]],
-        group_letter: str,
-    ) -> Tuple[pd.DataFrame, Dict[str, np.ndarray]]:
+        cls,
+        group_idx: np.ndarray,
+        group_probs: np.ndarray,
+        lambdas: np.ndarray,
+        n: int,
+        rng: np.random.Generator,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """Simulate a single group N times.
 
+        Parameters
+        ----------
+        group_idx : np.ndarray
+            Team positions (into the probability tables) of the group members.
+        group_probs : np.ndarray
+            Shape (n, n, 3) group-stage [win_a, draw, win_b] table.
+        lambdas : np.ndarray
+            Shape (n, n, 2) expected goals table.
+
         Returns
         -------
-        standings : pd.DataFrame
-            Average standings with columns: team, avg_points, avg_gd,
-            p_1st, p_2nd, p_3rd, p_4th.
-        positions : dict
-            {team: np.ndarray of finish positions (1-4) per simulation}.
+        points, goal_diff, goals_for : np.ndarray
+            Shape (n_sims, n_teams) group totals.
+        finish : np.ndarray
+            Shape (n_sims, n_teams) finish positions (1-4) per simulation.
         """
-        n_teams = len(teams)
-        n = self.n_sims
+        n_teams = len(group_idx)
 
         # Points and goals arrays: shape (n_sims, n_teams)
         points = np.zeros((n, n_teams), dtype=np.int32)
         goals_for = np.zeros((n, n_teams), dtype=np.int32)
         goals_against = np.zeros((n, n_teams), dtype=np.int32)
+        # Per-fixture results for head-to-head tie-breakers:
+        # h2h_pts[s, i, j] = points team i took from team j in simulation s
+        h2h_pts = np.zeros((n, n_teams, n_teams), dtype=np.int16)
+        h2h_gf = np.zeros((n, n_teams, n_teams), dtype=np.int16)
 
         # Simulate each match
         for i in range(n_teams):
             for j in range(i + 1, n_teams):
-                key = (teams[i], teams[j])
-                pred = match_probs.get(key)
-                if pred is None:
-                    logger.warning("No pre-computed probability for %s vs %s, using uniform", teams[i], teams[j])
-                    pred = {"p_win_a": 0.33, "p_draw": 0.34, "p_win_b": 0.33, "lambda_a": 1.2, "lambda_b": 1.0}
-                p_w = pred["p_win_a"]
-                p_d = pred["p_draw"]
-
-                lambda_a = pred.get("lambda_a", 1.2)
-                lambda_b = pred.get("lambda_b", 1.0)
+                a, b = group_idx[i], group_idx[j]
+                p_w, p_d, _ = group_probs[a, b]
+                lambda_a, lambda_b = lambdas[a, b]
 
                 # Sample outcomes
-                rand = self.rng.random(n)
+                rand = rng.random(n)
                 win_a = rand < p_w
                 draw = (rand >= p_w) & (rand < p_w + p_d)
                 win_b = ~win_a & ~draw
 
                 # Points
-                points[:, i] += 3 * win_a.astype(np.int32) + draw.astype(np.int32)
-                points[:, j] += 3 * win_b.astype(np.int32) + draw.astype(np.int32)
+                pts_a = 3 * win_a.astype(np.int32) + draw.astype(np.int32)
+                pts_b = 3 * win_b.astype(np.int32) + draw.astype(np.int32)
+                points[:, i] += pts_a
+                points[:, j] += pts_b
 
                 # Goals (sample from Poisson for goal difference)
-                ga = self.rng.poisson(lambda_a, n).astype(np.int32)
-                gb = self.rng.poisson(lambda_b, n).astype(np.int32)
+                ga = rng.poisson(lambda_a, n).astype(np.int32)
+                gb = rng.poisson(lambda_b, n).astype(np.int32)
 
                 # Adjust goals to be consistent with result
                 # If win_a but ga <= gb, set ga = gb + 1
@@ -235,163 +466,209 @@ class TournamentSimulator:
                 goals_for[:, j] += gb
                 goals_against[:, j] += ga
 
-        # Determine positions per simulation
+                h2h_pts[:, i, j] = pts_a
+                h2h_pts[:, j, i] = pts_b
+                h2h_gf[:, i, j] = ga
+                h2h_gf[:, j, i] = gb
+
         goal_diff = goals_for - goals_against
-        # Composite sort key: points * 1000 + gd * 10 + gf (breaks ties)
-        sort_key = points * 10000 + (goal_diff + 500) * 10 + goals_for
-        # Rank teams per simulation (argsort descending)
-        positions = {}
-        for sim in range(n):
-            order = np.argsort(-sort_key[sim])
-            for rank, idx in enumerate(order):
-                team = teams[idx]
-                if team not in positions:
-                    positions[team] = np.zeros(n, dtype=np.int32)
-                positions[team][sim] = rank + 1  # 1-indexed
 
-        # Build standings summary
-        rows = []
-        for idx, team in enumerate(teams):
-            pos = positions.get(team, np.full(n, 4))
-            rows.append({
-                "team": team,
-                "group": group_letter,
-                "avg_points": float(points[:, idx].mean()),
-                "avg_gd": float(goal_diff[:, idx].mean()),
-                "avg_gf": float(goals_for[:, idx].mean()),
-                "p_1st": float(np.mean(pos == 1)),
-                "p_2nd": float(np.mean(pos == 2)),
-                "p_3rd": float(np.mean(pos == 3)),
-                "p_4th": float(np.mean(pos == 4)) if n_teams >= 4 else 0.0,
-            })
-
-        standings = pd.DataFrame(rows).sort_values("p_1st", ascending=False).reset_index(drop=True)
-        return standings, positions
+        # Drawing of lots: random key for teams level on every criterion
+        lots = rng.random((n, n_teams))
+        finish = cls._rank_group(points, goal_diff, goals_for, h2h_pts, h2h_gf, lots)
+        return points, goal_diff, goals_for, finish
+
+    @staticmethod
+    def _rank_group(
+        points: np.ndarray,
+        goal_diff: np.ndarray,
+        goals_for: np.ndarray,
+        h2h_pts: np.ndarray,
+        h2h_gf: np.ndarray,
+        lots: np.ndarray,
+    ) -> np.ndarray:
+        """Rank every simulated group table in one batched sort.
+
+        FIFA 2026 criteria, in order: points; head-to-head points, goal
+        difference and goals scored among the teams level on points, applied
+        again to any subset still level after that pass; overall goal
+        difference; overall goals scored; drawing of lots.
 
+        Parameters
+        ----------
+        points, goal_diff, goals_for : np.ndarray
+            Shape (n_sims, n_teams) group totals.
+        h2h_pts, h2h_gf : np.ndarray
+            Shape (n_sims, n_teams, n_teams): points / goals team i took
+            from its match against team j (zero on the diagonal).
+        lots : np.ndarray
+            Shape (n_sims, n_teams) random keys for the final tie-break.
+
+        Returns
+        -------
+        np.ndarray
+            Shape (n_sims, n_teams) finish positions (1 = group winner).
+        """
+        n, n_teams = points.shape
+
+        def same(values: np.ndarray) -> np.ndarray:
+            return values[:, :, None] == values[:, None, :]
+
+        # Head-to-head mini-tables, one pass per level of residual ties:
+        # each pass only counts matches between teams still level on every
+        # earlier criterion, and stops once a pass separates no one
+        tied = same(points)
+        mini_keys = []
+        for _ in range(n_teams - 1):
+            h2h_points = np.where(tied, h2h_pts, 0).sum(axis=2)
+            mini_gf = np.where(tied, h2h_gf, 0).sum(axis=2)
+            mini_ga = np.where(tied, h2h_gf.transpose(0, 2, 1), 0).sum(axis=2)
+            h2h_goal_diff = mini_gf - mini_ga
+            mini_keys += [-h2h_points, -h2h_goal_diff, -mini_gf]
+            still_tied = tied & same(h2h_points) & same(h2h_goal_diff) & same(mini_gf)
+            if np.array_equal(still_tied, tied):
+                break
+            tied = still_tied
+
+        # np.lexsort: last key is primary; negate for descending order
+        keys = np.stack([lots, -goals_for, -goal_diff] + mini_keys[::-1] + [-points])
+        order = np.lexsort(keys, axis=-1)
+
+        # Scatter ranks back onto team columns
+        finish = np.empty((n, n_teams), dtype=np.int32)
+        finish[np.arange(n)[:, None], order] = np.arange(1, n_teams + 1, dtype=np.int32)
+        return finish
+
+    @staticmethod
     def _simulate_knockout(
-        self,
-        groups: Dict[str, List[str]],
-        group_results: Dict[str, Dict[str, np.ndarray]],
-    ) -> Dict[str, Dict[str, float]]:
+        group_results: Dict[str, Tuple[np.ndarray, np.ndarray]],
+        p_advance: np.ndarray,
+        n_teams: int,
+        n: int,
+        rng: np.random.Generator,
+    ) -> Dict[str, np.ndarray]:
         """Simulate knockout bracket from group results.
 
         Collects group winners and runners-up, then runs a generic
         single-elimination bracket. Works for any number of groups.
+        All simulations advance through a round at once: the bracket is an
+        (n_sims, bracket_size) array of team indices, each tie takes one
+        uniform draw against the precomputed p_advance[stage] table, and
+        round-reach counts come from np.bincount.
+
+        Parameters
+        ----------
+        group_results : dict
+            {group_letter: (team positions, finish positions per simulation)}.
 
         Returns
         -------
-        Dict mapping team -> {p_r32, p_r16, p_qf, p_sf, p_final, p_champion}.
+        Dict mapping round label (p_r32 .. p_champion) -> counts per team.
         """
-        n = self.n_sims
-        all_teams = set()
-        for teams_dict in group_results.values():
-            all_teams.update(teams_dict.keys())
-
-        # Initialize counters
-        counters = {team: {
-            "p_r32": 0, "p_r16": 0, "p_qf": 0,
-            "p_sf": 0, "p_final": 0, "p_champion": 0,
-        } for team in all_teams}
-
-        # Round labels by depth (from R32 inward)
-        round_labels = ["p_r32", "p_r16", "p_qf", "p_sf", "p_final", "p_champion"]
-        group_letters = sorted(groups.keys())
-
-        for sim in range(n):
-            # Get group winners and runners-up for this simulation
-            winners = []
-            runners_up = []
-
-            for letter in group_letters:
-                teams_pos = group_results[letter]
-                w, r = None, None
-                for team, positions in teams_pos.items():
-                    if positions[sim] == 1:
-                        w = team
-                    elif positions[sim] == 2:
-                        r = team
-                if w:
-                    winners.append(w)
-                if r:
-                    runners_up.append(r)
-
-            # Build initial bracket: cross-pair winners vs runners-up
-            bracket_teams = []
-            n_pairs = min(len(winners), len(runners_up))
-            for i in range(n_pairs):
-                j = (n_pairs - 1 - i)  # Cross-pairing
-                bracket_teams.append(winners[i])
-                bracket_teams.append(runners_up[j])
-
-            # Generic single-elimination bracket
-            current_round = bracket_teams
-            round_idx = 0
-            stage = 1
-
-            while len(current_round) > 1:
-                # Determine round label
-                rounds_remaining = 0
-                t = len(current_round)
-                while t > 1:
-                    t = (t + 1) // 2
-                    rounds_remaining += 1
-                label_idx = max(0, len(round_labels) - rounds_remaining - 1)
-                round_label = round_labels[min(label_idx, len(round_labels) - 1)]
-
-                # Mark participation in this round
-                for team in current_round:
-                    if team in counters and round_label != "p_champion":
-                        counters[team][round_label] += 1
-
-                # Play matches
-                next_round = []
-                for i in range(0, len(current_round) - 1, 2):
-                    team_a = current_round[i]
-                    team_b = current_round[i + 1]
-                    winner = self._simulate_knockout_match(team_a, team_b, stage=stage)
-                    next_round.append(winner)
-
-                # Odd team gets a bye
-                if len(current_round) % 2 == 1:
-                    next_round.append(current_round[-1])
-
-                current_round = next_round
-                stage += 1
-
-            # Champion
-            if current_round:
-                counters[current_round[0]]["p_champion"] += 1
-
-        # Normalize
-        for team in counters:
-            for key in counters[team]:
-                counters[team][key] /= n
-
-        return counters
-
-    def _simulate_knockout_match(
-        self,
-        team_a: str,
-        team_b: str,
-        stage: int,
-    ) -> str:
-        """Simulate a single knockout match, return winner."""
-        cache_key = (team_a, team_b, stage)
-        if cache_key not in self._match_cache:
-            pred = self.predictor.predict_knockout(
-                team_a, team_b,
-                rankings_df=self.rankings_df,
-                squad_features=self.squad_features,
-                stage=stage,
-            )
-            self._match_cache[cache_key] = pred
+        group_letters = sorted(group_results.keys())
+
+        # Group winners / runners-up per simulation as team indices
+        winners = np.empty((n, len(group_letters)), dtype=np.int64)
+        runners_up = np.empty((n, len(group_letters)), dtype=np.int64)
+        for g, letter in enumerate(group_letters):
+            group_idx, finish = group_results[letter]
+            winners[:, g] = group_idx[np.argmax(finish == 1, axis=1)]
+            runners_up[:, g] = group_idx[np.argmax(finish == 2, axis=1)]
+
+        # Build initial bracket: cross-pair winners vs runners-up
+        bracket = np.empty((n, 2 * len(group_letters)), dtype=np.int64)
+        bracket[:, 0::2] = winners
+        bracket[:, 1::2] = runners_up[:, ::-1]
+
+        counts = {label: np.zeros(n_teams, dtype=np.int64) for label in ROUND_LABELS}
+
+        current_round = bracket
+        stage = 1
+        while current_round.shape[1] > 1:
+            size = current_round.shape[1]
+
+            # Determine round label
+            rounds_remaining = 0
+            t = size
+            while t > 1:
+                t = (t + 1) // 2
+                rounds_remaining += 1
+            label_idx = max(0, len(ROUND_LABELS) - rounds_remaining - 1)
+            round_label = ROUND_LABELS[min(label_idx, len(ROUND_LABELS) - 1)]
+
+            # Mark participation in this round
+            if round_label != "p_champion":
+                counts[round_label] += np.bincount(current_round.ravel(), minlength=n_teams)
+
+            # Play matches: one uniform draw per tie
+            team_a = current_round[:, 0:size - 1:2]
+            team_b = current_round[:, 1:size:2]
+            draws = rng.random(team_a.shape)
+            next_round = np.where(draws < p_advance[stage, team_a, team_b], team_a, team_b)
+
+            # Odd team gets a bye
+            if size % 2 == 1:
+                next_round = np.column_stack([next_round, current_round[:, -1]])
+
+            current_round = next_round
+            stage += 1
+
+        # Champion
+        if current_round.shape[1] == 1:
+            counts["p_champion"] += np.bincount(current_round[:, 0], minlength=n_teams)
+
+        return counts
+
+    @staticmethod
+    def _summarize(
+        groups: Dict[str, List[str]],
+        team_index: Dict[str, int],
+        tallies: Dict[str, np.ndarray],
+        n: int,
+    ) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+        """Normalize tallies into team probabilities and group standings."""
+        finish = tallies["finish"] / n
 
-        pred = self._match_cache[cache_key]
-        p_a = pred["p_advance_a"]
+        prob_rows = []
+        for team, idx in team_index.items():
+            row = {"team": team}
+            row.update({label: tallies[label][idx] / n for label in ROUND_LABELS})
+            row["se_champion"] = float(np.sqrt(row["p_champion"] * (1 - row["p_champion"]) / n))
+            row["se_final"] = float(np.sqrt(row["p_final"] * (1 - row["p_final"]) / n))
+            row["p_group_1st"] = float(finish[idx, 0])
+            row["p_group_2nd"] = float(finish[idx, 1])
+            row["p_group_3rd"] = float(finish[idx, 2])
+            row["p_group_advance"] = row["p_group_1st"] + row["p_group_2nd"]
+            prob_rows.append(row)
 
-        if self.rng.random() < p_a:
-            return team_a
-        return team_b
+        team_probabilities = pd.DataFrame(prob_rows)
+        if not team_probabilities.empty:
+            team_probabilities = team_probabilities.sort_values(
+                "p_champion", ascending=False
+            ).reset_index(drop=True)
+
+        # Build standings summary
+        group_standings = {}
+        for letter, teams in groups.items():
+            rows = []
+            for team in teams:
+                idx = team_index[team]
+                rows.append({
+                    "team": team,
+                    "group": letter,
+                    "avg_points": float(tallies["points"][idx] / n),
+                    "avg_gd": float(tallies["goal_diff"][idx] / n),
+                    "avg_gf": float(tallies["goals_for"][idx] / n),
+                    "p_1st": float(finish[idx, 0]),
+                    "p_2nd": float(finish[idx, 1]),
+                    "p_3rd": float(finish[idx, 2]),
+                    "p_4th": float(finish[idx, 3]),
+                })
+            group_standings[letter] = (
+                pd.DataFrame(rows).sort_values("p_1st", ascending=False).reset_index(drop=True)
+            )
+
+        return team_probabilities, group_standings
 
     def _build_match_predictions(
         self,
@@ -420,3 +697,57 @@ class TournamentSimulator:
                         "lambda_b": pred.get("lambda_b", 0.0),
                     })
         return pd.DataFrame(rows)
+
+
+# ------------------------------------------------------------------
+# Process-pool helpers (module level so workers can unpickle them)
+# ------------------------------------------------------------------
+
+# Read-only probability tables attached in each worker process
+_WORKER_TABLES: Dict[str, np.ndarray] = {}
+_WORKER_BLOCKS: List[shared_memory.SharedMemory] = []
+
+
+def _share_tables(
+    tables: Dict[str, np.ndarray],
+) -> Tuple[List[shared_memory.SharedMemory], Dict[str, Tuple[str, Tuple[int, ...], str]]]:
+    """Copy tables into shared memory blocks; return blocks and attach specs."""
+    blocks = []
+    specs = {}
+    for name, arr in tables.items():
+        arr = np.ascontiguousarray(arr)
+        block = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+        np.ndarray(arr.shape, dtype=arr.dtype, buffer=block.buf)[...] = arr
+        blocks.append(block)
+        specs[name] = (block.name, arr.shape, arr.dtype.str)
+    return blocks, specs
+
+
+def _attach_tables(specs: Dict[str, Tuple[str, Tuple[int, ...], str]]):
+    """Pool initializer: map shared tables as read-only arrays."""
+    for name, (block_name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        arr = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        arr.flags.writeable = False
+        _WORKER_BLOCKS.append(block)
+        _WORKER_TABLES[name] = arr
+
+
+def _run_chunk(
+    groups: Dict[str, List[str]],
+    team_index: Dict[str, int],
+    n: int,
+    seed: np.random.SeedSequence,
+) -> Dict[str, np.ndarray]:
+    """Worker entry point: simulate one chunk on its own RNG stream."""
+    rng = np.random.default_rng(seed)
+    return TournamentSimulator._simulate_chunk(groups, team_index, _WORKER_TABLES, n, rng)
+
+
+def _reduce_tallies(chunks: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """Sum per-chunk tallies key by key."""
+    total = {key: arr.copy() for key, arr in chunks[0].items()}
+    for chunk in chunks[1:]:
+        for key, arr in chunk.items():
+            total[key] += arr
+    return total
@@ -0,0 +1,101 @@
+"""Cache freshness rules per resource class (see CACHE_POLICY in _config).
+
+A URL resolves to the first CacheRule whose pattern matches it. The rule
+decides whether a cached copy is fresh, stale (served while a background
+refetch runs) or expired, depending on its age and on whether the caller
+knows the resource is final (a finished match, a completed season).
+"""
+
+import re
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Optional
+
+from ._config import CACHE_POLICY
+
+FRESH = "fresh"
+STALE = "stale"
+EXPIRED = "expired"
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    """Freshness rule for one resource class.
+
+    Attributes:
+        name: Resource class (recorded as the cache entry's TTL class).
+        pattern: Compiled URL regex (None for the default rule).
+        ttl: Freshness of a live resource (None = never expires).
+        final_ttl: Freshness once the resource is final (None = immutable).
+        stale: Window after expiry in which the old copy is still served.
+    """
+
+    name: str
+    pattern: Optional[re.Pattern]
+    ttl: Optional[timedelta]
+    final_ttl: Optional[timedelta]
+    stale: timedelta
+
+    def max_age(self, final: Optional[bool] = None) -> Optional[timedelta]:
+        """Freshness window for a live or final resource."""
+        return self.final_ttl if final else self.ttl
+
+    def state(self, fetched_at: Optional[float], final: Optional[bool] = None) -> str:
+        """FRESH, STALE or EXPIRED for a copy fetched at fetched_at (None: not cached)."""
+        if fetched_at is None:
+            return EXPIRED
+        max_age = self.max_age(final)
+        if max_age is None:
+            return FRESH
+        age = time.time() - fetched_at
+        if age <= max_age.total_seconds():
+            return FRESH
+        if age <= (max_age + self.stale).total_seconds():
+            return STALE
+        return EXPIRED
+
+
+def _seconds(value: Optional[float]) -> Optional[timedelta]:
+    return None if value is None else timedelta(seconds=value)
+
+
+class CachePolicy:
+    """Ordered resource-class rules; URLs matching none use the "default" rule.
+
+    Args:
+        config: {name: {pattern, ttl, final_ttl, stale}} in CACHE_POLICY format.
+    """
+
+    def __init__(self, config: dict = CACHE_POLICY):
+        self.rules: list[CacheRule] = []
+        self.default = CacheRule("default", None, timedelta(days=1), None, timedelta(0))
+        for name, spec in config.items():
+            rule = CacheRule(
+                name=name,
+                pattern=re.compile(spec["pattern"]) if spec.get("pattern") else None,
+                ttl=_seconds(spec.get("ttl")),
+                final_ttl=_seconds(spec.get("final_ttl")),
+                stale=timedelta(seconds=spec.get("stale") or 0),
+            )
+            if rule.pattern is None:
+                self.default = rule
+            else:
+                self.rules.append(rule)
+
+    def resolve(self, url: str) -> CacheRule:
+        """Rule for url."""
+        for rule in self.rules:
+            if rule.pattern.search(url):
+                return rule
+        return self.default
+
+    def named(self, name: str) -> CacheRule:
+        """Rule for the resource class name (the default rule if there is none)."""
+        for rule in self.rules:
+            if rule.name == name:
+                return rule
+        return self.default
+
+
+CACHE_RULES = CachePolicy()
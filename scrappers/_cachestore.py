@@ -0,0 +1,550 @@
+"""Pluggable storage behind BaseReader.get() caching.
+
+Two backends share one small interface (is_fresh / fetched_at / etag /
+open / put / touch / delete / clear / stamp), keyed by the cache path a reader
+passes to get():
+
+- FileCacheStore: the historical layout, one plain file per payload under
+  DATA_DIR, freshness from the file mtime.
+- BlobCacheStore: compressed, content-addressed blobs sharded under
+  CACHE_STORE_DIR/blobs, with a SQLite index mapping each cache path to its
+  blob hash, URL, fetch time, TTL class and size. Freshness checks are index
+  lookups (no stat()), identical payloads are stored once, and the store is
+  kept under CACHE_MAX_BYTES by least-recently-used eviction.
+
+The backend is chosen with SOCCERDATA_CACHE_BACKEND ("files" by default).
+Existing caches move to the blob store with:
+
+    python -m scrappers._cachestore migrate [--delete]
+"""
+
+import argparse
+import fnmatch
+import gzip
+import hashlib
+import io
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+from typing import IO, Iterator, Optional, Tuple, Union
+
+from ._config import CACHE_BACKEND, CACHE_MAX_BYTES, CACHE_STORE_DIR, DATA_DIR, logger
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Puts between two size checks (a SUM over the blob table)
+EVICT_CHECK_EVERY = 200
+# Evict down to this fraction of the cap so the next put does not evict again
+EVICT_TARGET = 0.9
+# Caches under DATA_DIR not served through BaseReader.get() (EloRatings keeps its own)
+MIGRATE_EXCLUDE = ("EloRatings",)
+
+# (key, fetched_at, size) of every entry in a set, sorted: changes when any entry does
+Stamp = Tuple[Tuple[str, float, int], ...]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    url TEXT,
+    hash TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    ttl_class TEXT,
+    size INTEGER NOT NULL,
+    etag TEXT
+);
+CREATE INDEX IF NOT EXISTS entries_hash ON entries (hash);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    codec TEXT NOT NULL,
+    stored_size INTEGER NOT NULL
+);
+"""
+
+
+def _compress(payload: bytes) -> tuple[str, bytes]:
+    """Compress with zstd when available, gzip otherwise. Returns (codec, data)."""
+    if zstandard is not None:
+        return "zst", zstandard.ZstdCompressor(level=10).compress(payload)
+    return "gz", gzip.compress(payload, compresslevel=6)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == "zst":
+        if zstandard is None:
+            raise RuntimeError("Blob is zstd-compressed but 'zstandard' is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+def _etag_path(path: Path) -> Path:
+    return path.with_name(path.name + ".etag")
+
+
+def _is_fresh(fetched_at: float, max_age: Optional[timedelta]) -> bool:
+    return max_age is None or (time.time() - fetched_at) <= max_age.total_seconds()
+
+
+class FileCacheStore:
+    """One plain file per payload, at the path the reader asked for."""
+
+    def is_fresh(self, path: Optional[Path], max_age: Optional[timedelta] = None) -> bool:
+        """True if path exists and is younger than max_age."""
+        if path is None:
+            return False
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return False
+        return _is_fresh(mtime, max_age)
+
+    def fetched_at(self, path: Optional[Path]) -> Optional[float]:
+        """When path was last fetched (its mtime), or None if not cached."""
+        if path is None:
+            return None
+        try:
+            return path.stat().st_mtime
+        except OSError:
+            return None
+
+    def etag(self, path: Path) -> Optional[str]:
+        """ETag the payload was served with (kept in a .etag sidecar file)."""
+        try:
+            return _etag_path(path).read_text(encoding="utf-8").strip() or None
+        except OSError:
+            return None
+
+    def open(self, path: Path) -> IO[bytes]:
+        """Open the cached payload (FileNotFoundError if missing)."""
+        return path.open(mode="rb")
+
+    def put(
+        self,
+        path: Path,
+        payload: bytes,
+        url: Optional[str] = None,
+        ttl_class: Optional[str] = None,
+        etag: Optional[str] = None,
+    ) -> None:
+        """Write payload to path.
+
+        Written to a temp file and swapped in, so a handle already returned by
+        open() (e.g. while a stale entry is revalidated) keeps the old payload.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+        if etag:
+            _etag_path(path).write_text(etag, encoding="utf-8")
+        else:
+            _etag_path(path).unlink(missing_ok=True)
+
+    def touch(self, path: Path) -> None:
+        """Mark the cached payload as fetched now (after a 304 Not Modified)."""
+        os.utime(path)
+
+    def delete(self, path: Path) -> None:
+        path.unlink(missing_ok=True)
+        _etag_path(path).unlink(missing_ok=True)
+
+    def clear(self, prefix: Path, pattern: str = "*") -> int:
+        """Delete cached files directly under prefix matching pattern. Returns count."""
+        count = 0
+        if prefix.exists():
+            for f in prefix.glob(pattern):
+                if f.is_file():
+                    f.unlink()
+                    count += 1
+        return count
+
+    def stamp(self, prefix: Path, pattern: str = "*") -> Stamp:
+        """(path, mtime, size) of the cached files directly under prefix matching pattern."""
+        stamp = []
+        for f in prefix.glob(pattern):
+            if f.name.endswith((".etag", ".tmp")):
+                continue
+            try:
+                st = f.stat()
+            except OSError:
+                continue
+            stamp.append((str(f), st.st_mtime, st.st_size))
+        return tuple(sorted(stamp))
+
+
+class BlobCacheStore:
+    """Compressed content-addressed blobs with a SQLite index.
+
+    Safe to share between threads; several processes may use the same store
+    (SQLite serializes the index, blobs are written atomically).
+
+    Args:
+        root: Store directory (index.sqlite + blobs/).
+        max_bytes: Cap on compressed blob bytes (0 = unbounded).
+        data_dir: Base that cache paths are keyed relative to.
+    """
+
+    def __init__(
+        self,
+        root: Path = CACHE_STORE_DIR,
+        max_bytes: int = CACHE_MAX_BYTES,
+        data_dir: Path = DATA_DIR,
+    ):
+        self.root = root
+        self.blob_dir = root / "blobs"
+        self.max_bytes = max_bytes
+        self.data_dir = data_dir
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._batch = False
+        self._puts = 0
+        self._conn = sqlite3.connect(
+            root / "index.sqlite", timeout=30, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        # Indexes created before conditional GETs lack the etag column
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(entries)")}
+        if "etag" not in columns:
+            self._conn.execute("ALTER TABLE entries ADD COLUMN etag TEXT")
+            self._conn.commit()
+
+    def key(self, path: Path) -> str:
+        """Index key of a cache path: relative to data_dir when under it."""
+        try:
+            return path.relative_to(self.data_dir).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def _blob_path(self, digest: str, codec: str) -> Path:
+        return self.blob_dir / digest[:2] / digest[2:4] / f"{digest}.{codec}"
+
+    def _commit(self) -> None:
+        if not self._batch:
+            self._conn.commit()
+
+    @contextmanager
+    def batch(self) -> Iterator["BlobCacheStore"]:
+        """Group many puts into one index transaction (used by the migration)."""
+        with self._lock:
+            self._batch = True
+            try:
+                yield self
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+            finally:
+                self._batch = False
+
+    def is_fresh(self, path: Optional[Path], max_age: Optional[timedelta] = None) -> bool:
+        """True if path is indexed and was fetched less than max_age ago."""
+        if path is None:
+            return False
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at FROM entries WHERE key = ?", (self.key(path),)
+            ).fetchone()
+        return row is not None and _is_fresh(row[0], max_age)
+
+    def fetched_at(self, path: Optional[Path]) -> Optional[float]:
+        """When path was last fetched, or None if not cached."""
+        if path is None:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at FROM entries WHERE key = ?", (self.key(path),)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def etag(self, path: Path) -> Optional[str]:
+        """ETag the payload was served with."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag FROM entries WHERE key = ?", (self.key(path),)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def touch(self, path: Path) -> None:
+        """Mark the cached payload as fetched now (after a 304 Not Modified)."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET fetched_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, self.key(path)),
+            )
+            self._commit()
+
+    def open(self, path: Path) -> IO[bytes]:
+        """Return the cached payload; FileNotFoundError if not indexed or blob missing."""
+        key = self.key(path)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT e.hash, b.codec FROM entries e JOIN blobs b ON b.hash = e.hash "
+                "WHERE e.key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                raise FileNotFoundError(key)
+            digest, codec = row
+            try:
+                data = self._blob_path(digest, codec).read_bytes()
+            except FileNotFoundError:
+                # Blob removed behind the index's back: forget the entry
+                self._delete_keys([key])
+                self._commit()
+                raise
+            self._conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+            self._commit()
+        return io.BytesIO(_decompress(codec, data))
+
+    def put(
+        self,
+        path: Path,
+        payload: bytes,
+        url: Optional[str] = None,
+        ttl_class: Optional[str] = None,
+        etag: Optional[str] = None,
+        fetched_at: Optional[float] = None,
+    ) -> None:
+        """Store payload for path (blob written once per distinct content)."""
+        digest = hashlib.sha256(payload).hexdigest()
+        now = time.time()
+        key = self.key(path)
+        with self._lock:
+            known = self._conn.execute(
+                "SELECT codec FROM blobs WHERE hash = ?", (digest,)
+            ).fetchone()
+            if known is None or not self._blob_path(digest, known[0]).exists():
+                codec, data = _compress(payload)
+                blob_path = self._blob_path(digest, codec)
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = blob_path.with_name(f"{blob_path.name}.{os.getpid()}.tmp")
+                tmp.write_bytes(data)
+                os.replace(tmp, blob_path)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO blobs (hash, codec, stored_size) VALUES (?, ?, ?)",
+                    (digest, codec, len(data)),
+                )
+
+            previous = self._conn.execute(
+                "SELECT hash FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, url, hash, fetched_at, accessed_at, ttl_class, size, etag) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, digest, fetched_at or now, now, ttl_class, len(payload), etag),
+            )
+            if previous is not None and previous[0] != digest:
+                self._drop_orphans([previous[0]])
+            self._commit()
+
+            self._puts += 1
+            if self.max_bytes and self._puts % EVICT_CHECK_EVERY == 0:
+                self.evict()
+
+    def delete(self, path: Path) -> None:
+        with self._lock:
+            self._delete_keys([self.key(path)])
+            self._commit()
+
+    def _under(self, prefix: Path, pattern: str) -> list[tuple]:
+        """(key, fetched_at, size) of entries directly under prefix matching pattern."""
+        base = self.key(prefix).rstrip("/") + "/"
+        # Range bounds let SQLite walk the primary-key index ("/" + 1 == "0")
+        upper = base[:-1] + "0"
+        return [
+            row
+            for row in self._conn.execute(
+                "SELECT key, fetched_at, size FROM entries WHERE key >= ? AND key < ?",
+                (base, upper),
+            )
+            if "/" not in row[0][len(base):] and fnmatch.fnmatch(row[0][len(base):], pattern)
+        ]
+
+    def clear(self, prefix: Path, pattern: str = "*") -> int:
+        """Delete entries directly under prefix whose name matches pattern. Returns count."""
+        with self._lock:
+            keys = [row[0] for row in self._under(prefix, pattern)]
+            self._delete_keys(keys)
+            self._commit()
+        return len(keys)
+
+    def stamp(self, prefix: Path, pattern: str = "*") -> Stamp:
+        """(key, fetched_at, size) of the entries directly under prefix matching pattern."""
+        with self._lock:
+            return tuple(sorted(self._under(prefix, pattern)))
+
+    def size(self) -> int:
+        """Compressed bytes currently stored."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(stored_size), 0) FROM blobs").fetchone()[0]
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """Drop least recently used entries until the store fits max_bytes. Returns count."""
+        cap = self.max_bytes if max_bytes is None else max_bytes
+        if not cap:
+            return 0
+        evicted = 0
+        with self._lock:
+            total = self.size()
+            if total <= cap:
+                return 0
+            target = cap * EVICT_TARGET
+            while total > target:
+                keys = [
+                    key for (key,) in self._conn.execute(
+                        "SELECT key FROM entries ORDER BY accessed_at LIMIT 500"
+                    )
+                ]
+                if not keys:
+                    break
+                self._delete_keys(keys)
+                evicted += len(keys)
+                total = self.size()
+            self._commit()
+        logger.info("Cache store evicted %d entries (%.1f MB left)", evicted, total / 1e6)
+        return evicted
+
+    def _delete_keys(self, keys: list[str]) -> None:
+        if not keys:
+            return
+        hashes = set()
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            hashes.update(
+                digest for (digest,) in self._conn.execute(
+                    f"SELECT hash FROM entries WHERE key IN ({marks})", chunk
+                )
+            )
+            self._conn.execute(f"DELETE FROM entries WHERE key IN ({marks})", chunk)
+        self._drop_orphans(list(hashes))
+
+    def _drop_orphans(self, hashes: list[str]) -> None:
+        """Delete blobs no entry references any more."""
+        for digest in hashes:
+            if self._conn.execute(
+                "SELECT 1 FROM entries WHERE hash = ? LIMIT 1", (digest,)
+            ).fetchone():
+                continue
+            row = self._conn.execute("SELECT codec FROM blobs WHERE hash = ?", (digest,)).fetchone()
+            self._conn.execute("DELETE FROM blobs WHERE hash = ?", (digest,))
+            if row is not None:
+                self._blob_path(digest, row[0]).unlink(missing_ok=True)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+CacheStore = Union[FileCacheStore, BlobCacheStore]
+
+_STORE: Optional[CacheStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_cache_store() -> CacheStore:
+    """Process-wide store for the configured CACHE_BACKEND."""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            if CACHE_BACKEND == "blob":
+                _STORE = BlobCacheStore()
+            elif CACHE_BACKEND == "files":
+                _STORE = FileCacheStore()
+            else:
+                raise ValueError(f"Unknown SOCCERDATA_CACHE_BACKEND '{CACHE_BACKEND}'")
+            logger.debug("Cache backend: %s", CACHE_BACKEND)
+        return _STORE
+
+
+def migrate_file_cache(
+    store: Optional[BlobCacheStore] = None,
+    data_dir: Path = DATA_DIR,
+    delete: bool = False,
+    batch_size: int = 1000,
+    exclude: tuple[str, ...] = MIGRATE_EXCLUDE,
+) -> int:
+    """Import every cached file under data_dir into a blob store.
+
+    Fetch times are taken from the file mtimes, so freshness is preserved.
+
+    Args:
+        store: Target store (default: BlobCacheStore under CACHE_STORE_DIR).
+        data_dir: Root of the file cache.
+        delete: Remove each file once imported.
+        batch_size: Files per index transaction.
+        exclude: Top-level directories of data_dir to leave alone.
+
+    Returns:
+        Number of files imported.
+    """
+    store = store or BlobCacheStore(data_dir=data_dir)
+    files = (
+        f for f in data_dir.rglob("*")
+        if f.is_file()
+        and not f.name.endswith((".tmp", ".etag"))
+        and f.relative_to(data_dir).parts[0] not in exclude
+    )
+    imported = 0
+    pending: list[Path] = []
+
+    def flush():
+        nonlocal imported
+        with store.batch():
+            for f in pending:
+                store.put(
+                    f,
+                    f.read_bytes(),
+                    etag=FileCacheStore().etag(f),
+                    fetched_at=f.stat().st_mtime,
+                )
+        if delete:
+            for f in pending:
+                FileCacheStore().delete(f)
+        imported += len(pending)
+        pending.clear()
+        logger.info("Migrated %d files", imported)
+
+    for f in files:
+        pending.append(f)
+        if len(pending) >= batch_size:
+            flush()
+    if pending:
+        flush()
+    return imported
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Manage the scraper cache store.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    migrate = sub.add_parser("migrate", help="Import the file cache into the blob store")
+    migrate.add_argument("--data-dir", type=Path, default=DATA_DIR)
+    migrate.add_argument("--delete", action="store_true", help="Delete files once imported")
+    evict = sub.add_parser("evict", help="Shrink the blob store to a size cap")
+    evict.add_argument("max_bytes", type=int)
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        count = migrate_file_cache(BlobCacheStore(data_dir=args.data_dir), args.data_dir, args.delete)
+        print(f"Imported {count} files into {CACHE_STORE_DIR}")
+    elif args.command == "evict":
+        store = BlobCacheStore()
+        print(f"Evicted {store.evict(args.max_bytes)} entries ({store.size() / 1e6:.1f} MB left)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,19 +4,26 @@ Provides caching, rate limiting, proxy rotation, TLS fingerprinting,
 Selenium automation, and season/league normalization.
 """
 
+import asyncio
 import io
 import json
 import pprint
 import random
 import re
+import threading
 import time
 import warnings
+import weakref
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from email.utils import formatdate
 from enum import Enum
 from pathlib import Path
-from typing import IO, Callable, Optional, Union
+from typing import IO, Any, Awaitable, Callable, Iterator, Optional, Union
+from urllib.parse import urlsplit
 
 import numpy as np
 import pandas as pd
@@ -28,6 +35,7 @@ _original_stdout = sys.stdout
 sys.stdout = io.StringIO()
 import tls_requests
 sys.stdout = _original_stdout
+from tls_requests.exceptions import ProtocolError, ProxyError, RemoteProtocolError, TLSError
 
 # Disable tls_requests print statements permanently
 try:
@@ -40,7 +48,17 @@ from dateutil.relativedelta import relativedelta
 from lxml.etree import _Element
 from selenium.common.exceptions import JavascriptException, WebDriverException
 
-from ._config import DATA_DIR, LEAGUE_DICT, MAXAGE, TEAMNAME_REPLACEMENTS, logger
+from ._config import (
+    DATA_DIR,
+    LEAGUE_DICT,
+    SELENIUM_DRIVERS,
+    SELENIUM_MAX_PAGES,
+    TEAMNAME_REPLACEMENTS,
+    logger,
+)
+from ._cachepolicy import CACHE_RULES, EXPIRED, FRESH, STALE
+from ._cachestore import CacheStore, get_cache_store
+from ._ratelimit import HostRateLimiter, get_limiter
 
 
 class SeasonCode(Enum):
@@ -179,9 +197,18 @@ class SeasonCode(Enum):
         raise ValueError(f"Unrecognized season code: '{season}'")
 
 
+# Background refetches of stale cache entries (stale-while-revalidate)
+_REVALIDATE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="revalidate")
+_REVALIDATING: set[str] = set()
+_REVALIDATING_LOCK = threading.Lock()
+
+
 class BaseReader(ABC):
     """Abstract base for all data readers. Handles caching, proxies, and league/season config."""
 
+    # Whether stale cache entries may be served while a background thread refetches them
+    _background_revalidate = False
+
     def __init__(
         self,
         leagues: Optional[Union[str, list[str]]] = None,
@@ -207,8 +234,13 @@ class BaseReader(ABC):
         self.no_cache = no_cache
         self.no_store = no_store
         self.data_dir = data_dir
+        # Pacing for hosts missing from RATE_LIMITS (seconds between requests, max jitter)
         self.rate_limit = 0
         self.max_delay = 0
+        # Explicit limiter overriding the per-host one (acquired before each download)
+        self.rate_limiter: Optional[HostRateLimiter] = None
+        # Where cached payloads live (plain files or the blob store, see SOCCERDATA_CACHE_BACKEND)
+        self.cache: CacheStore = get_cache_store()
         if self.no_store:
             logger.debug("Caching disabled")
         else:
@@ -219,26 +251,114 @@ class BaseReader(ABC):
         self,
         url: str,
         filepath: Optional[Path] = None,
-        max_age: Optional[Union[int, timedelta]] = MAXAGE,
+        max_age: Optional[Union[int, timedelta]] = None,
         no_cache: bool = False,
         var: Optional[Union[str, Iterable[str]]] = None,
+        final: Optional[bool] = None,
     ) -> IO[bytes]:
-        """Fetch url with caching. Returns cached file if fresh, otherwise downloads."""
-        is_cached = self._is_cached(filepath, max_age)
-        if no_cache or self.no_cache or not is_cached:
+        """Fetch url with caching. Returns the cached copy if fresh, otherwise downloads.
+
+        Freshness comes from the CACHE_POLICY rule matching url unless
+        max_age is given. Copies within the rule's stale window are returned
+        at once and refetched in the background (requests-based readers).
+
+        Args:
+            url: URL to fetch.
+            filepath: Cache path for the payload.
+            max_age: Explicit max age (days or timedelta), overriding the policy.
+            no_cache: Ignore the cached copy.
+            var: JS variable name(s) to extract instead of the raw body.
+            final: The resource can no longer change (finished match,
+                completed season), so the rule's final_ttl applies.
+
+        Returns:
+            File-like object with the payload.
+        """
+        reader, stale = self._cached(url, filepath, max_age, no_cache, final)
+        if reader is None:
             logger.debug("Fetching %s", url)
             return self._download_and_save(url, filepath, var)
-        logger.debug("Cache hit: %s", url)
-        if filepath is None:
-            raise ValueError("No filepath provided for cached data.")
-        return filepath.open(mode="rb")
+        if stale:
+            self._revalidate(url, filepath, var)  # type: ignore[arg-type]
+        return reader
+
+    def _cached(
+        self,
+        url: str,
+        filepath: Optional[Path],
+        max_age: Optional[Union[int, timedelta]] = None,
+        no_cache: bool = False,
+        final: Optional[bool] = None,
+    ) -> tuple[Optional[IO[bytes]], bool]:
+        """Cached copy of url usable now (or None), and whether it is stale."""
+        if no_cache or self.no_cache or filepath is None:
+            return None, False
+        if max_age is not None:
+            state = FRESH if self._is_cached(filepath, max_age) else EXPIRED
+        else:
+            state = CACHE_RULES.resolve(url).state(self.cache.fetched_at(filepath), final)
+        if state == EXPIRED or (state == STALE and not self._background_revalidate):
+            return None, False
+        try:
+            reader = self.cache.open(filepath)
+        except FileNotFoundError:
+            return None, False
+        logger.debug("Cache hit (%s): %s", state, url)
+        return reader, state == STALE
+
+    def _revalidate(
+        self, url: str, filepath: Path, var: Optional[Union[str, Iterable[str]]] = None
+    ) -> None:
+        """Refetch a stale cache entry in the background (once per entry at a time)."""
+        key = str(filepath)
+        with _REVALIDATING_LOCK:
+            if key in _REVALIDATING:
+                return
+            _REVALIDATING.add(key)
+
+        def refresh():
+            try:
+                self._refresh(url, filepath, var)
+                logger.debug("Revalidated %s", url)
+            except Exception as e:
+                logger.debug("Revalidation of %s failed: %s", url, str(e)[:100])
+            finally:
+                with _REVALIDATING_LOCK:
+                    _REVALIDATING.discard(key)
+
+        _REVALIDATE_POOL.submit(refresh)
+
+    def _refresh(
+        self, url: str, filepath: Path, var: Optional[Union[str, Iterable[str]]] = None
+    ) -> None:
+        """Single background refetch of a stale entry."""
+        self._download_and_save(url, filepath, var)
+
+    def _store(
+        self,
+        filepath: Optional[Path],
+        payload: bytes,
+        url: Optional[str] = None,
+        etag: Optional[str] = None,
+    ) -> IO[bytes]:
+        """Cache payload under filepath (unless no_store) and return it as a file-like object."""
+        if not self.no_store and filepath is not None:
+            ttl_class = CACHE_RULES.resolve(url).name if url else None
+            self.cache.put(filepath, payload, url=url, ttl_class=ttl_class, etag=etag)
+        return io.BytesIO(payload)
+
+    def _limiter_for(self, url: str) -> Optional[HostRateLimiter]:
+        """Limiter shared by every reader and process requesting url's host."""
+        if self.rate_limiter is not None:
+            return self.rate_limiter
+        return get_limiter(urlsplit(url).netloc, self.rate_limit, self.max_delay)
 
     def _is_cached(
         self,
         filepath: Optional[Path] = None,
         max_age: Optional[Union[int, timedelta]] = None,
     ) -> bool:
-        """Return True if filepath exists and is younger than max_age."""
+        """Return True if filepath is cached and younger than max_age."""
         if max_age is not None:
             if isinstance(max_age, int):
                 _max_age = timedelta(days=max_age)
@@ -249,14 +369,7 @@ class BaseReader(ABC):
         else:
             _max_age = None
 
-        cache_invalid = False
-        if _max_age is not None and filepath is not None and filepath.exists():
-            last_modified = datetime.fromtimestamp(filepath.stat().st_mtime, tz=timezone.utc)
-            now = datetime.now(timezone.utc)
-            if (now - last_modified) > _max_age:
-                cache_invalid = True
-
-        return not cache_invalid and filepath is not None and filepath.exists()
+        return self.cache.is_fresh(filepath, _max_age)
 
     @abstractmethod
     def _download_and_save(
@@ -372,9 +485,110 @@ class BaseReader(ABC):
         self._season_ids = [self._season_code.parse(s) for s in seasons]
 
 
+# Errors that mean the connection itself is broken; anything else (HTTP status,
+# parsing) keeps the pooled session alive
+CONNECTION_ERRORS = (ProxyError, TLSError, ProtocolError, RemoteProtocolError, OSError)
+
+ASYNC_MAX_CONCURRENCY = 8
+ASYNC_MAX_PER_HOST = 4
+
+
+class SessionPool:
+    """Keep-alive tls_requests clients shared per proxy.
+
+    Every async fetch through the same proxy reuses one client (and its
+    connections); a client is only replaced after a connection-level error.
+    """
+
+    def __init__(self):
+        self._clients: dict[Optional[str], tls_requests.Client] = {}
+        self._lock = threading.Lock()
+
+    def get(self, proxy: Optional[str]) -> tls_requests.Client:
+        """Return the pooled client for proxy, creating it on first use."""
+        with self._lock:
+            client = self._clients.get(proxy)
+            if client is None:
+                client = self._clients[proxy] = tls_requests.Client(proxy=proxy)
+            return client
+
+    def recycle(self, proxy: Optional[str], client: tls_requests.Client) -> None:
+        """Drop client if it is still the pooled one (concurrent failures recycle once)."""
+        with self._lock:
+            if self._clients.get(proxy) is not client:
+                return
+            del self._clients[proxy]
+        logger.debug("Recycling TLS session (proxy=%s)", proxy)
+        try:
+            client.close()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        """Close every pooled client."""
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            try:
+                client.close()
+            except Exception:
+                pass
+
+
+SESSION_POOL = SessionPool()
+
+# Per-host semaphores, one set per event loop (asyncio primitives are loop-bound)
+_HOST_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _host_semaphore(host: str) -> asyncio.Semaphore:
+    """Semaphore bounding concurrent requests to host on the running loop."""
+    loop = asyncio.get_running_loop()
+    semaphores = _HOST_SEMAPHORES.setdefault(loop, {})
+    if host not in semaphores:
+        semaphores[host] = asyncio.Semaphore(ASYNC_MAX_PER_HOST)
+    return semaphores[host]
+
+
+def _request_kwargs(request: Union[str, tuple, dict]) -> dict:
+    """get()/aget() kwargs from a URL, a (url, filepath) tuple or a kwargs dict."""
+    if isinstance(request, str):
+        return {"url": request}
+    if isinstance(request, dict):
+        return request
+    return dict(zip(("url", "filepath"), request))
+
+
+def run_async(coro: Awaitable[Any]) -> Any:
+    """Run coro to completion from sync code, even if a loop is already running."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Inside a running loop (e.g. Jupyter): run on a private loop in a worker thread
+    result: dict[str, Any] = {}
+
+    def runner():
+        try:
+            result["value"] = asyncio.run(coro)
+        except BaseException as e:  # noqa: BLE001
+            result["error"] = e
+
+    thread = threading.Thread(target=runner, daemon=True)
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
 class BaseRequestsReader(BaseReader):
     """Base class for HTTP scrapers. Uses tls_requests for TLS fingerprint evasion."""
 
+    _background_revalidate = True
+
     def __init__(
         self,
         leagues: Optional[Union[str, list[str]]] = None,
@@ -440,38 +654,87 @@ class BaseRequestsReader(BaseReader):
             "Cache-Control": "max-age=0"
         }
 
+    def _request_headers(self, url: str) -> dict:
+        """Headers sent with every download (override for API-specific headers)."""
+        return self._get_random_headers()
+
+    def _extract_payload(
+        self, content: bytes, var: Optional[Union[str, Iterable[str]]] = None
+    ) -> bytes:
+        """Return the bytes to cache: the raw body, or the JSON of the requested JS vars."""
+        if var is None:
+            return content
+        # Extract JS variables matching: varName = JSON.parse('...')
+        if isinstance(var, str):
+            var = [var]
+        var_names = "|".join(var)
+        template_understat = rb"(%b)+[\s\t]*=[\s\t]*JSON\.parse\('(.*)'\)"
+        pattern_understat = template_understat % bytes(var_names, encoding="utf-8")
+        results = re.findall(pattern_understat, content)
+        data = {
+            key.decode("unicode_escape"): json.loads(value.decode("unicode_escape"))
+            for key, value in results
+        }
+        return json.dumps(data).encode("utf-8")
+
+    def _conditional_headers(
+        self, url: str, filepath: Optional[Path], headers: Optional[dict] = None
+    ) -> dict:
+        """Request headers plus If-None-Match / If-Modified-Since for a cached copy."""
+        headers = dict(headers or self._request_headers(url))
+        if filepath is None or self.no_store:
+            return headers
+        fetched_at = self.cache.fetched_at(filepath)
+        if fetched_at is None:
+            return headers
+        headers["If-Modified-Since"] = formatdate(fetched_at, usegmt=True)
+        etag = self.cache.etag(filepath)
+        if etag:
+            headers["If-None-Match"] = etag
+        return headers
+
+    def _handle_response(
+        self,
+        response,
+        url: str,
+        filepath: Optional[Path],
+        var: Optional[Union[str, Iterable[str]]] = None,
+    ) -> IO[bytes]:
+        """Cache a response's payload, or keep the cached copy on 304 Not Modified."""
+        if response.status_code == 304 and filepath is not None:
+            logger.debug("Not modified: %s", url)
+            self.cache.touch(filepath)
+            return self.cache.open(filepath)
+        response.raise_for_status()
+        payload = self._extract_payload(response.content, var)
+        return self._store(filepath, payload, url, response.headers.get("ETag"))
+
+    def _request(self, url: str, headers: Optional[dict] = None, session=None):
+        """GET url on the reader's session (or session), paced by the host limiter.
+
+        Throttling responses (429/503) push the whole host back by their
+        Retry-After before the response is returned.
+        """
+        limiter = self._limiter_for(url)
+        if limiter is not None:
+            limiter.acquire()
+        session = session or self._session
+        response = session.get(url, headers=headers or self._request_headers(url))
+        if limiter is not None:
+            limiter.feedback(response.status_code, response.headers)
+        return response
+
     def _download_and_save(
         self,
         url: str,
         filepath: Optional[Path] = None,
         var: Optional[Union[str, Iterable[str]]] = None,
     ) -> IO[bytes]:
-        """Download url with retry (5 attempts). Resets session on failure."""
+        """Download url with retry (5 attempts). Resets session on connection errors."""
         for i in range(5):
             try:
-                response = self._session.get(url, headers=self._get_random_headers())
-                time.sleep(self.rate_limit + random.random() * self.max_delay)
-                response.raise_for_status()
-                if var is not None:
-                    # Extract JS variables matching: varName = JSON.parse('...')
-                    if isinstance(var, str):
-                        var = [var]
-                    var_names = "|".join(var)
-                    template_understat = rb"(%b)+[\s\t]*=[\s\t]*JSON\.parse\('(.*)'\)"
-                    pattern_understat = template_understat % bytes(var_names, encoding="utf-8")
-                    results = re.findall(pattern_understat, response.content)
-                    data = {
-                        key.decode("unicode_escape"): json.loads(value.decode("unicode_escape"))
-                        for key, value in results
-                    }
-                    payload = json.dumps(data).encode("utf-8")
-                else:
-                    payload = response.content
-                if not self.no_store and filepath is not None:
-                    filepath.parent.mkdir(parents=True, exist_ok=True)
-                    with filepath.open(mode="wb") as fh:
-                        fh.write(payload)
-                return io.BytesIO(payload)
+                response = self._request(url, self._conditional_headers(url, filepath))
+                return self._handle_response(response, url, filepath, var)
             except Exception as e:
                 logger.error(
                     "Error scraping %s (attempt %d/5): %s",
@@ -479,14 +742,272 @@ class BaseRequestsReader(BaseReader):
                     i + 1,
                     str(e)[:100],
                 )
-                self._session = self._init_session()
+                if isinstance(e, CONNECTION_ERRORS):
+                    self._session = self._init_session()
                 continue
 
         raise ConnectionError(f"Could not download {url}.")
 
+    def _refresh(
+        self, url: str, filepath: Path, var: Optional[Union[str, Iterable[str]]] = None
+    ) -> None:
+        """Single conditional refetch on the pooled session (runs off the caller's thread)."""
+        proxy = self.proxy()
+        client = SESSION_POOL.get(proxy)
+        try:
+            response = self._request(url, self._conditional_headers(url, filepath), client)
+        except CONNECTION_ERRORS:
+            SESSION_POOL.recycle(proxy, client)
+            raise
+        self._handle_response(response, url, filepath, var)
+
+    async def aget(
+        self,
+        url: str,
+        filepath: Optional[Path] = None,
+        max_age: Optional[Union[int, timedelta]] = None,
+        no_cache: bool = False,
+        var: Optional[Union[str, Iterable[str]]] = None,
+        headers: Optional[dict] = None,
+        final: Optional[bool] = None,
+    ) -> IO[bytes]:
+        """Async get(): cache hit, or a download on the pooled session for the proxy.
+
+        Requests to one host share a limiter and at most ASYNC_MAX_PER_HOST of
+        them are in flight at once on the running loop.
+
+        Args:
+            url: URL to fetch.
+            filepath: Cache file (read if fresh, written after download).
+            max_age: Explicit max age (days or timedelta), overriding the policy.
+            no_cache: Ignore the cached file.
+            var: JS variable name(s) to extract instead of the raw body.
+            headers: Request headers (default: _request_headers(url)).
+            final: The resource can no longer change (see get()).
+
+        Returns:
+            File-like object with the payload.
+        """
+        reader, stale = self._cached(url, filepath, max_age, no_cache, final)
+        if reader is not None:
+            if stale:
+                self._revalidate(url, filepath, var)  # type: ignore[arg-type]
+            return reader
+        logger.debug("Fetching %s (async)", url)
+        return await self._adownload_and_save(url, filepath, var, headers)
+
+    async def aget_many(
+        self,
+        requests: Iterable[Union[str, tuple, dict]],
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+    ) -> list[Union[IO[bytes], Exception]]:
+        """Fetch many URLs concurrently with aget().
+
+        Args:
+            requests: URLs, (url, filepath) tuples or dicts of aget() kwargs.
+            max_concurrency: Requests in flight across all hosts.
+
+        Returns:
+            One entry per request, in order: the file-like payload, or the
+            exception that request ended with (failures do not cancel the rest).
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(request):
+            async with semaphore:
+                return await self.aget(**_request_kwargs(request))
+
+        return await asyncio.gather(*(fetch(r) for r in requests), return_exceptions=True)
+
+    def get_many(
+        self,
+        requests: Iterable[Union[str, tuple, dict]],
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+    ) -> list[Union[IO[bytes], Exception]]:
+        """Blocking wrapper around aget_many() for sync callers."""
+        return run_async(self.aget_many(list(requests), max_concurrency))
+
+    async def _adownload_and_save(
+        self,
+        url: str,
+        filepath: Optional[Path] = None,
+        var: Optional[Union[str, Iterable[str]]] = None,
+        headers: Optional[dict] = None,
+    ) -> IO[bytes]:
+        """Async download with retry (5 attempts) on the pooled session."""
+        host = urlsplit(url).netloc
+        limiter = self._limiter_for(url)
+        async with _host_semaphore(host):
+            for i in range(5):
+                proxy = self.proxy()
+                client = SESSION_POOL.get(proxy)
+                try:
+                    if limiter is not None:
+                        await limiter.acquire_async()
+                    # tls_requests calls its shared library synchronously: keep it off the loop
+                    response = await asyncio.to_thread(
+                        client.get, url, headers=self._conditional_headers(url, filepath, headers)
+                    )
+                    if limiter is not None:
+                        limiter.feedback(response.status_code, response.headers)
+                    return await asyncio.to_thread(
+                        self._handle_response, response, url, filepath, var
+                    )
+                except Exception as e:
+                    logger.error(
+                        "Error scraping %s (attempt %d/5): %s",
+                        url,
+                        i + 1,
+                        str(e)[:100],
+                    )
+                    if isinstance(e, CONNECTION_ERRORS):
+                        SESSION_POOL.recycle(proxy, client)
+
+        raise ConnectionError(f"Could not download {url}.")
+
+
+class DriverPool:
+    """Warm browser instances shared by the threads of one Selenium reader.
+
+    At most ``size`` drivers are alive at once; a lease blocks until one is
+    idle or may be launched. Idle drivers are health-checked before each
+    lease. A driver is relaunched when the check fails, after ``max_pages``
+    pages, or when its lease ends with a WebDriverException (Incapsula
+    block, dead session); other errors hand it back for reuse.
+
+    Args:
+        factory: Launches a new driver.
+        size: Maximum number of live drivers.
+        max_pages: Pages served before a driver is recycled (0: never).
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], "sb.Driver"],
+        size: int = SELENIUM_DRIVERS,
+        max_pages: int = SELENIUM_MAX_PAGES,
+    ):
+        self.factory = factory
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self._idle: list["sb.Driver"] = []  # LIFO: reuse the warmest driver first
+        self._pages: dict[int, int] = {}
+        self._live = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        # Serialize launches: UC mode patches the chromedriver binary on startup
+        self._launch_lock = threading.Lock()
+
+    def _launch(self) -> "sb.Driver":
+        """Launch a driver for a slot already counted in _live."""
+        try:
+            with self._launch_lock:
+                driver = self.factory()
+        except BaseException:
+            with self._cond:
+                self._live -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._pages[id(driver)] = 0
+        return driver
+
+    def _discard(self, driver: "sb.Driver") -> None:
+        """Quit driver and free its slot."""
+        with self._cond:
+            self._pages.pop(id(driver), None)
+            self._live -= 1
+            self._cond.notify()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _healthy(driver: "sb.Driver") -> bool:
+        """True if the browser session still answers."""
+        try:
+            driver.execute_script("return 1;")
+            return True
+        except Exception:
+            return False
+
+    def warm(self, n: int = 1) -> None:
+        """Launch idle drivers until at least n (capped at size) are alive."""
+        while True:
+            with self._cond:
+                if self._closed or self._live >= min(n, self.size):
+                    return
+                self._live += 1
+            driver = self._launch()
+            with self._cond:
+                self._idle.append(driver)
+                self._cond.notify()
+
+    def acquire(self) -> "sb.Driver":
+        """Take a healthy idle driver, launching one if a slot is free."""
+        while True:
+            with self._cond:
+                # Re-checked after every wake-up: close() may run while we wait
+                while not self._closed and not self._idle and self._live >= self.size:
+                    self._cond.wait()
+                if self._closed:
+                    raise RuntimeError("Driver pool is closed.")
+                if self._idle:
+                    driver = self._idle.pop()
+                else:
+                    self._live += 1
+                    driver = None
+            if driver is None:
+                return self._launch()
+            if self._healthy(driver):
+                return driver
+            logger.debug("Browser session failed health check, relaunching")
+            self._discard(driver)
+
+    def release(self, driver: "sb.Driver", recycle: bool = False) -> None:
+        """Return driver after one page; quit it if recycle or it hit max_pages."""
+        with self._cond:
+            pages = self._pages.get(id(driver), 0) + 1
+            self._pages[id(driver)] = pages
+            worn_out = self.max_pages > 0 and pages >= self.max_pages
+            if not (recycle or worn_out or self._closed):
+                self._idle.append(driver)
+                self._cond.notify()
+                return
+        if worn_out:
+            logger.debug("Recycling browser after %d pages", pages)
+        self._discard(driver)
+
+    @contextmanager
+    def lease(self) -> Iterator["sb.Driver"]:
+        """Context manager around acquire()/release()."""
+        driver = self.acquire()
+        recycle = False
+        try:
+            yield driver
+        except WebDriverException:
+            recycle = True
+            raise
+        finally:
+            self.release(driver, recycle)
+
+    def close(self) -> None:
+        """Quit idle drivers; leased ones are quit when released."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for driver in idle:
+            self._discard(driver)
+
 
 class BaseSeleniumReader(BaseReader):
-    """Base class for browser-based scrapers. Uses SeleniumBase with UC mode for anti-bot bypass."""
+    """Base class for browser-based scrapers. Uses SeleniumBase with UC mode for anti-bot bypass.
+
+    Pages are loaded from a DriverPool of up to max_drivers browsers;
+    get_many() spreads a batch of pages across them.
+    """
 
     def __init__(
         self,
@@ -497,6 +1018,7 @@ class BaseSeleniumReader(BaseReader):
         data_dir: Path = DATA_DIR,
         path_to_browser: Optional[Path] = None,
         headless: bool = True,
+        max_drivers: int = SELENIUM_DRIVERS,
     ):
         """Initialize the reader."""
         super().__init__(
@@ -508,9 +1030,10 @@ class BaseSeleniumReader(BaseReader):
         )
         self.path_to_browser = path_to_browser
         self.headless = headless
+        self._pool = DriverPool(self._init_webdriver, max_drivers, SELENIUM_MAX_PAGES)
 
         try:
-            self._driver = self._init_webdriver()
+            self._pool.warm(1)
         except WebDriverException as e:
             logger.error(
                 "ChromeDriver failed to start: %s",
@@ -519,8 +1042,6 @@ class BaseSeleniumReader(BaseReader):
 
     def _init_webdriver(self) -> "sb.Driver":
         """Start a new Selenium driver with undetected-chromedriver mode."""
-        if hasattr(self, "_driver"):
-            self._driver.quit()
         proxy_str = self.proxy()
         # Force DNS through proxy to prevent DNS leaks
         resolver_rules = None
@@ -534,42 +1055,45 @@ class BaseSeleniumReader(BaseReader):
             proxy=proxy_str,
         )
 
+    def close(self) -> None:
+        """Quit the pooled browsers."""
+        self._pool.close()
+
     def _download_and_save(
         self,
         url: str,
         filepath: Optional[Path] = None,
         var: Optional[Union[str, Iterable[str]]] = None,
     ) -> IO[bytes]:
-        """Download url via browser with retry (5 attempts). Exponential backoff on failure."""
+        """Download url via a pooled browser with retry (5 attempts). Linear backoff on failure."""
+        limiter = self._limiter_for(url)
         for i in range(5):
             try:
-                self._driver.get(url)
-                time.sleep(self.rate_limit + random.random() * self.max_delay)
-                # Incapsula (Imperva WAF) = IP blocked
-                if "Incapsula incident ID" in self._driver.page_source:
-                    raise WebDriverException(
-                        "Your IP is blocked. Use tor or a proxy to continue scraping."
-                    )
-                if var is None:
-                    response = self._driver.execute_script(
-                        "return document.body.innerHTML;"
-                    ).encode("utf-8")
-                    if response == b"":
-                        raise Exception("Empty response.")
-                else:
-                    if not isinstance(var, str):
-                        raise NotImplementedError("Only implemented for single variables.")
-                    try:
-                        response = json.dumps(self._driver.execute_script("return " + var)).encode(
-                            "utf-8"
+                with self._pool.lease() as driver:
+                    if limiter is not None:
+                        limiter.acquire()
+                    driver.get(url)
+                    # Incapsula (Imperva WAF) = IP blocked; the lease relaunches the browser
+                    if "Incapsula incident ID" in driver.page_source:
+                        raise WebDriverException(
+                            "Your IP is blocked. Use tor or a proxy to continue scraping."
                         )
-                    except JavascriptException:
-                        response = json.dumps(None).encode("utf-8")
-                if not self.no_store and filepath is not None:
-                    filepath.parent.mkdir(parents=True, exist_ok=True)
-                    with filepath.open(mode="wb") as fh:
-                        fh.write(response)
-                return io.BytesIO(response)
+                    if var is None:
+                        response = driver.execute_script(
+                            "return document.body.innerHTML;"
+                        ).encode("utf-8")
+                        if response == b"":
+                            raise Exception("Empty response.")
+                    else:
+                        if not isinstance(var, str):
+                            raise NotImplementedError("Only implemented for single variables.")
+                        try:
+                            response = json.dumps(driver.execute_script("return " + var)).encode(
+                                "utf-8"
+                            )
+                        except JavascriptException:
+                            response = json.dumps(None).encode("utf-8")
+                return self._store(filepath, response, url=url)
             except Exception as e:
                 logger.error(
                     "Error scraping %s (attempt %d/5, retry in %ds): %s",
@@ -579,11 +1103,51 @@ class BaseSeleniumReader(BaseReader):
                     str(e)[:100],
                 )
                 time.sleep(i * 10)
-                self._driver = self._init_webdriver()
                 continue
 
         raise ConnectionError(f"Could not download {url}.")
 
+    def _parallel(self, func: Callable[[Any], Any], items: Iterable[Any]) -> Iterator[Any]:
+        """Call func on every item, one worker thread per pooled browser.
+
+        Yields:
+            One entry per item, in order: func's result, or the exception it
+            raised (failures do not cancel the rest). Items not yet started
+            are dropped if the caller stops iterating.
+        """
+        items = list(items)
+
+        def call(item):
+            try:
+                return func(item)
+            except Exception as e:
+                return e
+
+        workers = min(self._pool.size, len(items))
+        if workers <= 1:
+            for item in items:
+                yield call(item)
+            return
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="selenium")
+        try:
+            yield from executor.map(call, items)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_many(
+        self, requests: Iterable[Union[str, tuple, dict]]
+    ) -> list[Union[IO[bytes], Exception]]:
+        """Fetch many pages with get(), spread across the pooled browsers.
+
+        Args:
+            requests: URLs, (url, filepath) tuples or dicts of get() kwargs.
+
+        Returns:
+            One entry per request, in order: the file-like payload, or the
+            exception that request ended with.
+        """
+        return list(self._parallel(lambda request: self.get(**_request_kwargs(request)), requests))
+
 
 def make_game_id(row: pd.Series) -> str:
     """Return a game id based on date, home and away team."""
@@ -23,11 +23,33 @@ LOGS_DIR = Path(BASE_DIR, "logs")
 DATA_DIR = Path(BASE_DIR, "data")
 CONFIG_DIR = Path(BASE_DIR, "config")
 
+# Cache backend: "files" (one plain file per payload under DATA_DIR) or "blob"
+# (compressed content-addressed blobs + SQLite index under CACHE_STORE_DIR)
+CACHE_BACKEND = os.environ.get("SOCCERDATA_CACHE_BACKEND", "files").lower()
+CACHE_STORE_DIR = Path(BASE_DIR, "cache")
+CACHE_MAX_BYTES = int(os.environ.get("SOCCERDATA_CACHE_MAX_BYTES", 0))  # 0 = unbounded
+
 # Create dirs
 LOGS_DIR.mkdir(parents=True, exist_ok=True)
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
+# Request pacing per host: (seconds between requests, burst size, max jitter in seconds).
+# Limits are shared by every reader, thread and process using the same BASE_DIR.
+RATE_LIMITS = {
+    "understat.com": (1.0, 3, 0.5),
+    "www.fotmob.com": (3.0, 2, 2.0),
+    "www.transfermarkt.com": (6.0, 1, 3.0),
+    "www.whoscored.com": (5.0, 1, 5.0),
+    "www.eloratings.net": (3.0, 3, 2.0),
+}
+RATE_LIMIT_DIR = Path(BASE_DIR, "ratelimit")
+
+# Selenium readers: browsers kept warm per reader (pages are fetched in parallel
+# across them) and pages one browser serves before it is relaunched (0 = never)
+SELENIUM_DRIVERS = int(os.environ.get("SOCCERDATA_SELENIUM_DRIVERS", 3))
+SELENIUM_MAX_PAGES = int(os.environ.get("SOCCERDATA_SELENIUM_MAX_PAGES", 50))
+
 # Logger configuration
 logging_config = {
     "version": 1,
@@ -265,4 +287,72 @@ else:
     logger.debug(
         "Custom league dict config not found at %s",
         _f_custom_league_dict.name,
-    )
\ No newline at end of file
+    )
+
+# Cache policy: resource classes matched by URL regex, first match wins ("default"
+# last). Durations in seconds, null = never expires.
+#   ttl:       how long a copy of a live resource is fresh
+#   final_ttl: same, once the resource can no longer change (finished match,
+#              completed season); readers say so with get(..., final=True)
+#   stale:     extra window in which an expired copy is still served while it
+#              is refetched in the background (stale-while-revalidate)
+CACHE_POLICY = {
+    "catalog": {
+        "pattern": (
+            r"understat\.com/getStatData"
+            r"|fotmob\.com/api/leagueseasondeepstats\?.*&season=0&"
+            r"|whoscored\.com/?$|whoscored\.com/Regions/\d+/Tournaments/\d+/?$"
+        ),
+        "ttl": 7 * 86400,
+        "final_ttl": 30 * 86400,
+        "stale": 7 * 86400,
+    },
+    "match": {
+        "pattern": r"understat\.com/(match/|getMatchData/)|whoscored\.com/Matches/\d+",
+        "ttl": 3600,
+        "final_ttl": None,
+        "stale": 0,
+    },
+    "schedule": {
+        "pattern": r"whoscored\.com/tournaments/\d+/data/|whoscored\.com/.*/Stages/\d+",
+        "ttl": 3600,
+        "final_ttl": None,
+        "stale": 3600,
+    },
+    "league_season": {
+        "pattern": (
+            r"understat\.com/(getLeagueData|getTeamData)/"
+            r"|fotmob\.com/api/leagueseasondeepstats"
+            r"|whoscored\.com/Regions/\d+/Tournaments/\d+/Seasons/"
+        ),
+        "ttl": 6 * 3600,
+        "final_ttl": None,
+        "stale": 86400,
+    },
+    "player": {
+        "pattern": (
+            r"understat\.com/getPlayerData/"
+            r"|transfermarkt\.com/(-/profil/spieler|ceapi/marketValueDevelopment)/"
+        ),
+        "ttl": 30 * 86400,
+        "final_ttl": 30 * 86400,
+        "stale": 7 * 86400,
+    },
+    "search": {
+        "pattern": r"transfermarkt\.com/schnellsuche/",
+        "ttl": 60 * 86400,
+        "final_ttl": 60 * 86400,
+        "stale": 0,
+    },
+    "default": {"pattern": None, "ttl": MAXAGE, "final_ttl": None, "stale": 0},
+}
+_f_custom_cache_policy = CONFIG_DIR / "cache_policy.json"
+if _f_custom_cache_policy.is_file():
+    with _f_custom_cache_policy.open(encoding="utf8") as json_file:
+        _custom_policy = json.load(json_file)
+    # Custom classes are matched before the built-in ones
+    CACHE_POLICY = {
+        **_custom_policy,
+        **{k: v for k, v in CACHE_POLICY.items() if k not in _custom_policy},
+    }
+    logger.debug("Custom cache policy loaded from %s", _f_custom_cache_policy.name)
@@ -0,0 +1,204 @@
+"""Per-host request pacing shared across readers, threads and processes.
+
+Each host gets one token bucket whose state (tokens, last refill, back-off
+deadline) lives in a small file under RATE_LIMIT_DIR, updated under an
+exclusive ``flock``. Every reader and process using the same BASE_DIR
+therefore draws from the same budget. Where ``fcntl`` is unavailable
+(Windows) the bucket is shared by the threads of one process only.
+"""
+
+import asyncio
+import json
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Mapping, Optional
+
+from ._config import RATE_LIMIT_DIR, RATE_LIMITS, logger
+from ._utils import TokenBucket
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# Back-off applied on 429/503 responses that carry no usable Retry-After
+RETRY_AFTER_DEFAULT = 60.0
+RETRY_AFTER_MAX = 900.0
+THROTTLE_STATUSES = (429, 503)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class HostRateLimiter(TokenBucket):
+    """Token bucket for one host with burst, jitter and server back-off.
+
+    Args:
+        host: Host name the limiter paces (also names its state file).
+        interval: Seconds between requests in steady state.
+        burst: Requests allowed back to back after an idle period.
+        jitter: Upper bound of the random delay added after each token.
+        state_dir: Directory for the shared state file (None: process-local).
+    """
+
+    def __init__(
+        self,
+        host: str,
+        interval: float,
+        burst: int = 1,
+        jitter: float = 0.0,
+        state_dir: Optional[Path] = RATE_LIMIT_DIR,
+    ):
+        super().__init__(rate=1 / interval, capacity=burst)
+        self.host = host
+        self.jitter = jitter
+        # Wall-clock time: the state is compared across processes
+        self._updated = time.time()
+        self._blocked_until = 0.0
+        self._path: Optional[Path] = None
+        if state_dir is not None and fcntl is not None:
+            state_dir.mkdir(parents=True, exist_ok=True)
+            self._path = state_dir / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', host)}.json"
+
+    def _take(self) -> float:
+        """Take a token if one is available (returns 0), else seconds until one is."""
+        with self._lock:
+            if self._path is None:
+                return self._update(time.time())
+            with self._path.open("a+") as fh:
+                fcntl.flock(fh, fcntl.LOCK_EX)
+                try:
+                    self._load(fh)
+                    wait = self._update(time.time())
+                    self._save(fh)
+                finally:
+                    fcntl.flock(fh, fcntl.LOCK_UN)
+            return wait
+
+    def _update(self, now: float) -> float:
+        """Refill and try to take one token (caller holds the locks)."""
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        self._tokens = min(self.capacity, self._tokens + max(0.0, now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def _load(self, fh) -> None:
+        fh.seek(0)
+        try:
+            state = json.loads(fh.read() or "{}")
+        except ValueError:
+            state = {}
+        self._tokens = float(state.get("tokens", self.capacity))
+        self._updated = float(state.get("updated", time.time()))
+        self._blocked_until = float(state.get("blocked_until", 0.0))
+
+    def _save(self, fh) -> None:
+        fh.seek(0)
+        fh.truncate()
+        json.dump(
+            {"tokens": self._tokens, "updated": self._updated, "blocked_until": self._blocked_until},
+            fh,
+        )
+        fh.flush()
+
+    def acquire(self) -> float:
+        """Block until a token is available, then add jitter. Returns seconds waited."""
+        waited = super().acquire()
+        if self.jitter:
+            delay = random.uniform(0, self.jitter)
+            time.sleep(delay)
+            waited += delay
+        return waited
+
+    async def acquire_async(self) -> float:
+        """Await a token without blocking the event loop, then add jitter."""
+        waited = await super().acquire_async()
+        if self.jitter:
+            delay = random.uniform(0, self.jitter)
+            await asyncio.sleep(delay)
+            waited += delay
+        return waited
+
+    def penalize(self, seconds: float) -> None:
+        """Hold every request to this host for seconds and drain the bucket."""
+        seconds = min(seconds, RETRY_AFTER_MAX)
+        with self._lock:
+            if self._path is None:
+                self._penalize(time.time(), seconds)
+                return
+            with self._path.open("a+") as fh:
+                fcntl.flock(fh, fcntl.LOCK_EX)
+                try:
+                    self._load(fh)
+                    self._penalize(time.time(), seconds)
+                    self._save(fh)
+                finally:
+                    fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _penalize(self, now: float, seconds: float) -> None:
+        self._blocked_until = max(self._blocked_until, now + seconds)
+        self._tokens = 0.0
+        self._updated = self._blocked_until
+
+    def feedback(self, status_code: int, headers: Optional[Mapping[str, str]] = None) -> float:
+        """Back off after a throttling response (429/503). Returns the back-off applied."""
+        if status_code not in THROTTLE_STATUSES:
+            return 0.0
+        retry_after = parse_retry_after((headers or {}).get("Retry-After"))
+        if retry_after is None:
+            retry_after = RETRY_AFTER_DEFAULT
+        logger.warning("%s answered %d, backing off %.0fs", self.host, status_code, retry_after)
+        self.penalize(retry_after)
+        return retry_after
+
+
+_LIMITERS: dict[str, HostRateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_limiter(
+    host: str, interval: float = 0.0, jitter: float = 0.0
+) -> Optional[HostRateLimiter]:
+    """Process-wide limiter for host.
+
+    Hosts listed in RATE_LIMITS use their configured pacing; other hosts
+    fall back to interval/jitter (None when interval is 0: unlimited).
+    """
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(host)
+        if limiter is None:
+            if host in RATE_LIMITS:
+                interval, burst, jitter = RATE_LIMITS[host]
+            elif interval > 0:
+                burst = 1
+            else:
+                return None
+            limiter = _LIMITERS[host] = HostRateLimiter(host, interval, burst, jitter)
+            logger.debug(
+                "Rate limit for %s: 1 request / %.1fs (burst %d, jitter %.1fs, pid %d)",
+                host, interval, burst, jitter, os.getpid(),
+            )
+        return limiter
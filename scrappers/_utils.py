@@ -1,4 +1,8 @@
-"""Shared utility functions: distance calculations, name validation, formatting."""
+"""Shared utility functions: distance calculations, name validation, formatting, rate limiting."""
+
+import asyncio
+import threading
+import time
 
 import pandas as pd
 import numpy as np
@@ -33,4 +37,49 @@ def format_player_name_base(full_name: str, default: str = "Unknown") -> str:
     """Validate and strip a player name. Returns default if invalid."""
     if not validate_name_field(full_name):
         return default
-    return full_name.strip()
\ No newline at end of file
+    return full_name.strip()
+
+
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter.
+
+    Allows bursts of up to ``capacity`` requests, refilled at ``rate``
+    tokens per second. Share one instance between everything that hits
+    the same host.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be > 0 and capacity >= 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self) -> float:
+        """Take a token if one is available (returns 0), else seconds until one is."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> float:
+        """Block until a token is available. Returns seconds waited."""
+        waited = 0.0
+        while (wait := self._take()) > 0:
+            time.sleep(wait)
+            waited += wait
+        return waited
+
+    async def acquire_async(self) -> float:
+        """Await a token without blocking the event loop. Returns seconds waited."""
+        waited = 0.0
+        while (wait := self._take()) > 0:
+            await asyncio.sleep(wait)
+            waited += wait
+        return waited
@@ -11,13 +11,18 @@ Data sources:
     - ``en.tournaments.tsv``: Tournament code to name mapping
 """
 
+import csv
+import hashlib
 import io
-import random
-import time
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from email.utils import formatdate
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 # Suppress tls_requests debug output on import
@@ -34,6 +39,7 @@ except (ImportError, AttributeError):
     pass
 
 from ._config import DATA_DIR, logger
+from ._ratelimit import get_limiter
 
 ELO_DATADIR = DATA_DIR / "EloRatings"
 ELO_BASE_URL = "https://www.eloratings.net"
@@ -87,6 +93,17 @@ MATCH_COLUMNS = [
     "team1_rank", "team2_rank",
 ]
 
+# Bump when the parsed frame layout changes, to invalidate .npz caches
+PARSED_CACHE_VERSION = 1
+
+# Request pacing (bursts of 3, then one every 3s + jitter), shared by every
+# EloRatings instance and process: see RATE_LIMITS
+ELO_RATE_LIMITER = get_limiter("www.eloratings.net")
+ELO_MAX_WORKERS = 4
+
+# Files for past years fetched this long after the year ended are final
+ELO_FINAL_GRACE_DAYS = 14
+
 
 class EloRatings:
     """Scrape national team ELO ratings from eloratings.net.
@@ -102,6 +119,8 @@ class EloRatings:
         Skip cached data.
     data_dir : Path
         Cache directory path.
+    max_workers : int
+        Concurrent downloads for multi-year reads.
     """
 
     def __init__(
@@ -109,14 +128,16 @@ class EloRatings:
         proxy: Optional[str] = None,
         no_cache: bool = False,
         data_dir: Path = ELO_DATADIR,
+        max_workers: int = ELO_MAX_WORKERS,
     ):
         self.proxy = proxy
         self.no_cache = no_cache
         self.data_dir = data_dir
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.rate_limit = 3
-        self.max_delay = 2
-        self._session = tls_requests.Client(proxy=proxy)
+        self.max_workers = max_workers
+        self.rate_limiter = ELO_RATE_LIMITER
+        self._local = threading.local()
+        self._lock = threading.Lock()
         self._team_map: Optional[dict[str, str]] = None
         self._tournament_map: Optional[dict[str, str]] = None
 
@@ -142,36 +163,11 @@ class EloRatings:
 
         filepath = self.data_dir / f"rankings_{year}.tsv"
         url = f"{ELO_BASE_URL}/{year}.tsv"
-        raw = self._fetch(url, filepath, max_age_days=1)
-        team_map = self._get_team_map()
+        raw = self._fetch(url, filepath, max_age_days=1, year=year)
 
-        rows = []
-        for line in raw.strip().split("\n"):
-            if not line.strip():
-                continue
-            fields = line.split("\t")
-            if len(fields) < 33:
-                continue
-            code = fields[2]
-            team_name = team_map.get(code, code)
-            row = {"team": team_name, "code": code}
-            for i, col in enumerate(RANKING_COLUMNS):
-                if col == "code":
-                    continue
-                val = fields[i].replace("\u2212", "-").strip()
-                if col in ("local_rank",):
-                    row[col] = val
-                else:
-                    try:
-                        row[col] = int(val)
-                    except ValueError:
-                        row[col] = None
-            rows.append(row)
-
-        df = pd.DataFrame(rows)
+        df = self._load_parsed(raw, filepath, self._parse_rankings)
         if df.empty:
             return df
-        df = df.set_index("team").sort_values("elo_rank")
         logger.info("ELO rankings: %d teams fetched for %d", len(df), year)
         return df
 
@@ -186,7 +182,7 @@ class EloRatings:
         filepath = self.data_dir / "latest.tsv"
         url = f"{ELO_BASE_URL}/latest.tsv"
         raw = self._fetch(url, filepath, max_age_days=1)
-        return self._parse_matches(raw)
+        return self._load_parsed(raw, filepath, self._parse_matches)
 
     def read_matches_for_year(self, year: int) -> pd.DataFrame:
         """Fetch international match results for a specific year.
@@ -203,8 +199,8 @@ class EloRatings:
         """
         filepath = self.data_dir / f"matches_{year}.tsv"
         url = f"{ELO_BASE_URL}/{year}_results.tsv"
-        raw = self._fetch(url, filepath, max_age_days=30)
-        df = self._parse_matches(raw)
+        raw = self._fetch(url, filepath, max_age_days=30, year=year)
+        df = self._load_parsed(raw, filepath, self._parse_matches)
         if not df.empty:
             logger.info("ELO matches for %d: %d results", year, len(df))
         return df
@@ -212,6 +208,9 @@ class EloRatings:
     def read_matches_range(self, start_year: int, end_year: int) -> pd.DataFrame:
         """Fetch match results across multiple years.
 
+        Years are fetched concurrently (up to ``max_workers``), paced by the
+        shared rate limiter.
+
         Parameters
         ----------
         start_year : int
@@ -225,13 +224,11 @@ class EloRatings:
             Combined match results sorted by date descending.
         """
         frames = []
-        for year in range(start_year, end_year + 1):
-            try:
-                df = self.read_matches_for_year(year)
-                if not df.empty:
-                    frames.append(df)
-            except ConnectionError:
+        for year, df in self._read_years(self.read_matches_for_year, start_year, end_year):
+            if df is None:
                 logger.warning("No match data available for year %d", year)
+            elif not df.empty:
+                frames.append(df)
         if not frames:
             return pd.DataFrame()
         combined = pd.concat(frames, ignore_index=True)
@@ -242,6 +239,80 @@ class EloRatings:
         logger.info("ELO matches %d-%d: %d total results", start_year, end_year, len(combined))
         return combined
 
+    def read_rankings_range(self, start_year: int, end_year: int) -> dict[int, pd.DataFrame]:
+        """Fetch ELO rankings for each year in a range (concurrently).
+
+        Parameters
+        ----------
+        start_year : int
+            First year (inclusive).
+        end_year : int
+            Last year (inclusive).
+
+        Returns
+        -------
+        dict
+            {year: rankings DataFrame} for the years that returned data.
+        """
+        rankings = {}
+        for year, df in self._read_years(self.read_rankings, start_year, end_year):
+            if df is None:
+                logger.warning("No rankings available for year %d", year)
+            elif not df.empty:
+                rankings[year] = df
+        return rankings
+
+    def _read_years(self, reader, start_year: int, end_year: int) -> list[tuple[int, Optional[pd.DataFrame]]]:
+        """Run a per-year reader over a range on a thread pool.
+
+        Returns (year, frame) pairs in year order; frame is None when the
+        year failed (download or parse), so one bad year never drops the rest.
+        """
+        def read(year: int) -> Optional[pd.DataFrame]:
+            try:
+                return reader(year)
+            except Exception as e:
+                logger.warning("Year %d failed: %s", year, e)
+                return None
+
+        years = list(range(start_year, end_year + 1))
+        workers = max(1, min(self.max_workers, len(years)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(zip(years, executor.map(read, years)))
+
+    def _parse_rankings(self, raw: str) -> pd.DataFrame:
+        """Parse TSV rankings data into DataFrame.
+
+        Parameters
+        ----------
+        raw : str
+            Raw TSV text with 33 fields per line (RANKING_COLUMNS format).
+
+        Returns
+        -------
+        pd.DataFrame
+            Indexed by team name and sorted by elo_rank.
+        """
+        fields = _read_tsv(raw, len(RANKING_COLUMNS))
+        if fields.empty:
+            return pd.DataFrame()
+
+        team_map = self._get_team_map()
+        codes = fields[2]
+        columns = {"team": _map_codes(codes, team_map), "code": codes.to_numpy(dtype=object)}
+        for i, col in enumerate(RANKING_COLUMNS):
+            if col == "code":
+                continue
+            values = _clean_fields(fields[i])
+            if col in ("local_rank",):
+                columns[col] = values.to_numpy(dtype=object)
+            else:
+                columns[col] = _to_int_column(values, keep_text=False)
+
+        df = pd.DataFrame(columns)
+        df = df.set_index("team").sort_values("elo_rank")
+        return df
+
     def _parse_matches(self, raw: str) -> pd.DataFrame:
         """Parse TSV match data into DataFrame.
 
@@ -255,49 +326,38 @@ class EloRatings:
         pd.DataFrame
             Parsed match results.
         """
+        fields = _read_tsv(raw, len(MATCH_COLUMNS))
+        if fields.empty:
+            return pd.DataFrame()
+
         team_map = self._get_team_map()
         tournament_map = self._get_tournament_map()
 
-        rows = []
-        for line in raw.strip().split("\n"):
-            if not line.strip():
-                continue
-            fields = line.split("\t")
-            if len(fields) < 16:
-                continue
-            row = {}
-            for i, col in enumerate(MATCH_COLUMNS):
-                val = fields[i].replace("\u2212", "-").strip()
-                try:
-                    row[col] = int(val)
-                except ValueError:
-                    row[col] = val
-
-            # Resolve team names
-            row["team1"] = team_map.get(row["team1_code"], row["team1_code"])
-            row["team2"] = team_map.get(row["team2_code"], row["team2_code"])
-            # Resolve tournament
-            row["tournament"] = tournament_map.get(
-                row.get("tournament_code", ""), row.get("tournament_code", "")
-            )
-            # Build date
-            try:
-                row["date"] = f"{row['year']:04d}-{row['month']:02d}-{row['day']:02d}"
-            except (ValueError, TypeError):
-                row["date"] = None
-
-            # Venue: empty = home/away, code = neutral ground
-            venue = row.get("venue_code", "")
-            if venue and venue != row["team1_code"]:
-                row["venue"] = team_map.get(venue, venue) if venue else "Home/Away"
-            else:
-                row["venue"] = "Home"
+        columns = {
+            col: _to_int_column(_clean_fields(fields[i]), keep_text=True)
+            for i, col in enumerate(MATCH_COLUMNS)
+        }
 
-            rows.append(row)
+        # Resolve team names and tournament
+        columns["team1"] = _map_codes(columns["team1_code"], team_map)
+        columns["team2"] = _map_codes(columns["team2_code"], team_map)
+        columns["tournament"] = _map_codes(columns["tournament_code"], tournament_map)
+
+        # Build date (None unless year/month/day are all integers)
+        date = np.full(len(fields), None, dtype=object)
+        ymd = [columns[c] for c in ("year", "month", "day")]
+        valid = np.logical_and.reduce([np.array([_is_int(v) for v in c]) for c in ymd])
+        date[valid] = [
+            f"{y:04d}-{m:02d}-{d:02d}" for y, m, d in zip(*(c[valid] for c in ymd))
+        ]
+        columns["date"] = date
 
-        df = pd.DataFrame(rows)
-        if df.empty:
-            return df
+        # Venue: empty = home/away, code = neutral ground
+        venue = columns["venue_code"]
+        neutral = np.array([bool(v) for v in venue]) & (venue != columns["team1_code"])
+        columns["venue"] = np.where(neutral, _map_codes(venue, team_map), "Home").astype(object)
+
+        df = pd.DataFrame(columns)
 
         # Reorder columns
         col_order = [
@@ -315,12 +375,68 @@ class EloRatings:
         logger.info("ELO matches: %d results parsed", len(df))
         return df
 
+    # ------------------------------------------------------------------
+    # Internal: parsed-frame cache
+    # ------------------------------------------------------------------
+
+    def _load_parsed(self, raw: str, filepath: Path, parser) -> pd.DataFrame:
+        """Parse raw TSV, reusing the columnar cache stored next to it.
+
+        The cache (``<file>.npz``) is keyed by a hash of the raw text and
+        of the cached team/tournament reference files, so it is reused
+        until either changes, independently of the TSV's expiry.
+
+        Parameters
+        ----------
+        raw : str
+            Raw TSV text (as returned by _fetch()).
+        filepath : Path
+            Local TSV cache file; the parsed cache sits alongside.
+        parser : callable
+            Cold-path parser, raw text -> DataFrame.
+
+        Returns
+        -------
+        pd.DataFrame
+            Parsed frame.
+        """
+        cache_path = filepath.with_suffix(".npz")
+        key = self._parsed_key(raw)
+
+        if not self.no_cache:
+            df = _load_frame(cache_path, key)
+            if df is not None:
+                logger.debug("Parsed cache hit: %s", cache_path.name)
+                return df
+
+        df = parser(raw)
+        # The parser may have just downloaded the reference files: hash what it used
+        key = self._parsed_key(raw)
+        try:
+            _save_frame(cache_path, df, key)
+        except (OSError, ValueError) as e:
+            logger.debug("Could not write parsed cache %s: %s", cache_path.name, e)
+        return df
+
+    def _parsed_key(self, raw: str) -> str:
+        """Cache key for a parsed frame: raw text + reference data + version."""
+        digest = hashlib.sha1(f"v{PARSED_CACHE_VERSION}".encode())
+        digest.update(raw.encode("utf-8"))
+        for name in ("en.teams.tsv", "en.tournaments.tsv"):
+            ref = self.data_dir / name
+            digest.update(ref.read_bytes() if ref.exists() else b"")
+        return digest.hexdigest()
+
     # ------------------------------------------------------------------
     # Reference data
     # ------------------------------------------------------------------
 
     def _get_team_map(self) -> dict[str, str]:
         """Return {code: name} dict from en.teams.tsv. Cached after first fetch."""
+        with self._lock:
+            return self._load_team_map()
+
+    def _load_team_map(self) -> dict[str, str]:
         if self._team_map is not None:
             return self._team_map
 
@@ -345,6 +461,10 @@ class EloRatings:
 
     def _get_tournament_map(self) -> dict[str, str]:
         """Return {code: name} dict from en.tournaments.tsv. Cached after first fetch."""
+        with self._lock:
+            return self._load_tournament_map()
+
+    def _load_tournament_map(self) -> dict[str, str]:
         if self._tournament_map is not None:
             return self._tournament_map
 
@@ -369,9 +489,20 @@ class EloRatings:
     # Internal: fetch with cache
     # ------------------------------------------------------------------
 
-    def _fetch(self, url: str, filepath: Path, max_age_days: int = 1) -> str:
+    def _fetch(
+        self,
+        url: str,
+        filepath: Path,
+        max_age_days: int = 1,
+        year: Optional[int] = None,
+    ) -> str:
         """Fetch URL with file-based caching.
 
+        Expired files are revalidated with a conditional request
+        (If-None-Match / If-Modified-Since); a 304 keeps the cached text.
+        Files for a past ``year`` downloaded after that year was over are
+        treated as final and never refetched.
+
         Parameters
         ----------
         url : str
@@ -380,22 +511,24 @@ class EloRatings:
             Local cache file.
         max_age_days : int
             Cache expiry in days.
+        year : int, optional
+            Season the file covers, for the historic-years policy.
 
         Returns
         -------
         str
             Raw text content.
         """
-        if not self.no_cache and filepath.exists():
+        cached = not self.no_cache and filepath.exists()
+        if cached:
             mtime = datetime.fromtimestamp(filepath.stat().st_mtime, tz=timezone.utc)
             age = datetime.now(tz=timezone.utc) - mtime
-            if age < timedelta(days=max_age_days):
+            if age < timedelta(days=max_age_days) or _is_final(year, mtime):
                 logger.debug("Cache hit: %s", filepath.name)
                 return filepath.read_text(encoding="utf-8")
 
-        # Rate limit
-        delay = self.rate_limit + random.uniform(0, self.max_delay)
-        time.sleep(delay)
+        # Rate limit (shared bucket, jitter included)
+        self.rate_limiter.acquire()
 
         headers = {
             "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
@@ -403,13 +536,176 @@ class EloRatings:
             "Accept": "text/plain,text/tab-separated-values,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.9",
         }
+        etag_path = filepath.with_name(filepath.name + ".etag")
+        if cached:
+            headers["If-Modified-Since"] = formatdate(filepath.stat().st_mtime, usegmt=True)
+            if etag_path.exists():
+                headers["If-None-Match"] = etag_path.read_text(encoding="utf-8").strip()
 
         logger.debug("Fetching %s", url)
-        response = self._session.get(url, headers=headers)
+        response = self._get_session().get(url, headers=headers)
+        self.rate_limiter.feedback(response.status_code, response.headers)
+        if cached and response.status_code == 304:
+            filepath.touch()
+            logger.debug("Not modified: %s", filepath.name)
+            return filepath.read_text(encoding="utf-8")
         if response.status_code != 200:
             raise ConnectionError(f"HTTP {response.status_code} for {url}")
 
         text = response.text
         filepath.write_text(text, encoding="utf-8")
+        etag = response.headers.get("ETag")
+        if etag:
+            etag_path.write_text(etag, encoding="utf-8")
         logger.debug("Cached: %s (%d bytes)", filepath.name, len(text))
         return text
+
+    def _get_session(self) -> tls_requests.Client:
+        """HTTP client for the calling thread (clients are not shared across threads)."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = tls_requests.Client(proxy=self.proxy)
+            self._local.session = session
+        return session
+
+
+def _is_final(year: Optional[int], mtime: datetime) -> bool:
+    """True if a file for ``year`` was downloaded after the year was over.
+
+    Past seasons do not change, so such files never need refetching.
+    """
+    if year is None:
+        return False
+    year_end = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
+    return mtime >= year_end + timedelta(days=ELO_FINAL_GRACE_DAYS)
+
+
+# ----------------------------------------------------------------------
+# Vectorized TSV parsing helpers
+# ----------------------------------------------------------------------
+
+def _read_tsv(raw: str, n_fields: int) -> pd.DataFrame:
+    """Read TSV text as raw string fields, skipping blank and short lines."""
+    lines = [
+        line for line in raw.strip().split("\n")
+        if line.strip() and line.count("\t") >= n_fields - 1
+    ]
+    if not lines:
+        return pd.DataFrame()
+    width = max(line.count("\t") for line in lines) + 1
+    return pd.read_csv(
+        io.StringIO("\n".join(lines)),
+        sep="\t",
+        header=None,
+        names=range(width),
+        dtype=str,
+        na_filter=False,
+        quoting=csv.QUOTE_NONE,
+    )
+
+
+def _clean_fields(values: pd.Series) -> pd.Series:
+    """Normalize unicode minus signs and strip whitespace."""
+    return values.str.replace("\u2212", "-", regex=False).str.strip()
+
+
+def _is_int(value) -> bool:
+    return isinstance(value, (int, np.integer)) and not isinstance(value, bool)
+
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and np.isnan(value))
+
+
+def _to_int_column(values: pd.Series, keep_text: bool) -> np.ndarray:
+    """Convert string fields to integers where int() would succeed.
+
+    Unparseable fields are kept as text (keep_text=True) or set to None,
+    giving the same column dtypes as building the frame from row dicts.
+    """
+    is_int = values.str.fullmatch(r"[+-]?\d+").to_numpy(dtype=bool)
+    if is_int.all():
+        return values.to_numpy().astype(np.int64)
+    if not keep_text and not is_int.any():
+        return np.full(len(values), None, dtype=object)
+
+    ints = np.zeros(len(values), dtype=np.int64)
+    ints[is_int] = values[is_int].to_numpy().astype(np.int64)
+    if keep_text:
+        out = values.to_numpy(dtype=object).copy()
+        out[is_int] = [int(v) for v in ints[is_int]]
+        return out
+    return np.where(is_int, ints, np.nan)
+
+
+def _map_codes(codes, mapping: dict) -> np.ndarray:
+    """Map codes to names, keeping unmapped codes as-is."""
+    return np.array([mapping.get(c, c) for c in codes], dtype=object)
+
+
+def _save_frame(path: Path, df: pd.DataFrame, key: str):
+    """Write a DataFrame as one array per column to an .npz file (atomic).
+
+    Object columns are stored as text plus a per-value kind (0=missing,
+    1=str, 2=int) so that mixed int/str columns round-trip exactly.
+    """
+    arrays = {
+        "__key__": np.array(key),
+        "__columns__": np.array([str(c) for c in df.columns]),
+        "__index__": np.array(df.index.name or ""),
+    }
+    if df.index.name:
+        df = df.reset_index()
+
+    for i, col in enumerate(df.columns):
+        values = df[col].to_numpy()
+        if values.dtype != object:
+            arrays[f"c{i}"] = values
+            continue
+        # Object columns: strings, ints and None -> text + kind (0=None, 1=str, 2=int)
+        kinds = np.array([0 if _is_missing(v) else 2 if _is_int(v) else 1 for v in values], dtype=np.int8)
+        if (kinds == 1).all():
+            arrays[f"s{i}"] = values.astype(str)
+        else:
+            arrays[f"s{i}"] = np.array(["" if k == 0 else str(v) for v, k in zip(values, kinds)])
+            arrays[f"k{i}"] = kinds
+
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp, path)
+
+
+def _load_frame(path: Path, key: str) -> Optional[pd.DataFrame]:
+    """Read a frame written by _save_frame(); None if missing, stale or corrupt."""
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            if str(data["__key__"]) != key:
+                return None
+            index_name = str(data["__index__"])
+            names = list(data["__columns__"])
+            if index_name:
+                names = [index_name] + names
+
+            columns = {}
+            for i, name in enumerate(names):
+                if f"c{i}" in data:
+                    columns[name] = data[f"c{i}"]
+                    continue
+                text = data[f"s{i}"].astype(object)
+                if f"k{i}" in data:
+                    kinds = data[f"k{i}"]
+                    text[kinds == 0] = None
+                    ints = kinds == 2
+                    text[ints] = [int(v) for v in text[ints]]
+                columns[name] = text
+    except (OSError, KeyError, ValueError) as e:
+        logger.debug("Ignoring unreadable parsed cache %s: %s", path.name, e)
+        return None
+
+    df = pd.DataFrame(columns)
+    if index_name:
+        df = df.set_index(index_name)
+    return df
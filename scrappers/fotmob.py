@@ -6,8 +6,6 @@ All metric columns are prefixed with ``fotmob_``.
 """
 
 import json
-import random
-import time
 from collections.abc import Iterable
 from pathlib import Path
 from typing import Any, Callable, Optional, Union
@@ -147,7 +145,7 @@ class FotMob(BaseRequestsReader):
         no_store: bool = NOSTORE,
         data_dir: Path = FOTMOB_DATADIR,
     ):
-        """Initialize reader with rate_limit=3s and max_delay=2s jitter."""
+        """Initialize reader (pacing for www.fotmob.com comes from RATE_LIMITS)."""
         super().__init__(
             leagues=leagues,
             proxy=proxy,
@@ -156,8 +154,6 @@ class FotMob(BaseRequestsReader):
             data_dir=data_dir,
         )
         self.seasons = seasons  # type: ignore
-        self.rate_limit = 3
-        self.max_delay = 2
 
     # ------------------------------------------------------------------
     # Public methods
@@ -244,12 +240,13 @@ class FotMob(BaseRequestsReader):
                     continue
 
                 is_current = not self._is_complete(league, season)
-                no_cache = is_current and not force_cache
+                final = not is_current or force_cache
 
+                stats = self._fetch_stats(
+                    league_id, season_id, entity_type, stat_keys, final
+                )
                 for stat_key in stat_keys:
-                    data = self._fetch_stat(
-                        league_id, season_id, entity_type, stat_key, no_cache
-                    )
+                    data = stats[stat_key]
                     if data is None:
                         continue
 
@@ -333,63 +330,56 @@ class FotMob(BaseRequestsReader):
     def _fetch_seasons_map(self, league_id: int, force_cache: bool = False) -> dict:
         """Return {season_id: season_name} for a league from cached or API data."""
         filepath = self.data_dir / f"seasons_{league_id}.json"
-        max_age = 30 if force_cache else 7
-
-        if self._is_cached(filepath, max_age):
-            with filepath.open("r") as f:
-                return {int(k): v for k, v in json.load(f).items()}
-
         # Any stat request returns the full seasons list as a side effect
         url = f"{FOTMOB_API}/leagueseasondeepstats?id={league_id}&season=0&type=players&stat=goals"
+
         try:
-            response = self._session.get(url, headers=self._get_fotmob_headers())
-            time.sleep(self.rate_limit + random.random() * self.max_delay)
-            response.raise_for_status()
-            data = response.json()
+            data = json.load(self.get(url, filepath, final=force_cache))
         except Exception as e:
             logger.error("Failed to fetch seasons for league %d: %s", league_id, str(e)[:100])
             return {}
 
-        seasons = data.get("seasons", [])
-        result = {s["id"]: s["name"] for s in seasons}
-
-        if not self.no_store:
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            with filepath.open("w") as f:
-                json.dump(result, f)
-
-        return result
+        if "seasons" not in data:
+            # Older caches stored the extracted {season_id: name} map
+            return {int(k): v for k, v in data.items()}
+        return {s["id"]: s["name"] for s in data["seasons"]}
 
-    def _fetch_stat(
+    def _fetch_stats(
         self,
         league_id: int,
         season_id: int,
         entity_type: str,
-        stat_key: str,
-        no_cache: bool = False,
-    ) -> Optional[list[dict]]:
-        """Fetch a single stat key from the leagueseasondeepstats endpoint."""
-        filepath = (
-            self.data_dir / f"stats_{league_id}_{season_id}_{entity_type}_{stat_key}.json"
-        )
-
-        url = (
-            f"{FOTMOB_API}/leagueseasondeepstats"
-            f"?id={league_id}&season={season_id}&type={entity_type}&stat={stat_key}"
-        )
-
-        try:
-            reader = self.get(url, filepath, max_age=30, no_cache=no_cache)
-            data = json.load(reader)
-        except Exception as e:
-            logger.debug("Failed to fetch stat %s: %s", stat_key, str(e)[:100])
-            return None
-
-        stats_data = data.get("statsData", [])
-        if not stats_data:
-            return None
+        stat_keys: list[str],
+        final: Optional[bool] = None,
+    ) -> dict[str, Optional[list[dict]]]:
+        """Fetch several stat keys concurrently. Returns {stat_key: statsData or None}."""
+        requests = [
+            {
+                "url": (
+                    f"{FOTMOB_API}/leagueseasondeepstats"
+                    f"?id={league_id}&season={season_id}&type={entity_type}&stat={stat_key}"
+                ),
+                "filepath": (
+                    self.data_dir / f"stats_{league_id}_{season_id}_{entity_type}_{stat_key}.json"
+                ),
+                "final": final,
+            }
+            for stat_key in stat_keys
+        ]
+
+        results: dict[str, Optional[list[dict]]] = {}
+        for stat_key, reader in zip(stat_keys, self.get_many(requests)):
+            try:
+                if isinstance(reader, Exception):
+                    raise reader
+                data = json.load(reader)
+            except Exception as e:
+                logger.debug("Failed to fetch stat %s: %s", stat_key, str(e)[:100])
+                results[stat_key] = None
+                continue
+            results[stat_key] = data.get("statsData", []) or None
 
-        return stats_data
+        return results
 
     def _get_fotmob_headers(self) -> dict:
         """Return headers suitable for FotMob API requests."""
@@ -403,32 +393,9 @@ class FotMob(BaseRequestsReader):
         })
         return headers
 
-    def _download_and_save(self, url, filepath=None, var=None):
-        """Override base method to use FotMob-specific headers. Retries up to 5 times."""
-        for i in range(5):
-            try:
-                response = self._session.get(url, headers=self._get_fotmob_headers())
-                time.sleep(self.rate_limit + random.random() * self.max_delay)
-                response.raise_for_status()
-
-                payload = response.content
-
-                if not self.no_store and filepath is not None:
-                    filepath.parent.mkdir(parents=True, exist_ok=True)
-                    with filepath.open(mode="wb") as fh:
-                        fh.write(payload)
-
-                import io
-                return io.BytesIO(payload)
-            except Exception as e:
-                logger.error(
-                    "Error fetching %s (attempt %d/5): %s",
-                    url, i + 1, str(e)[:100],
-                )
-                self._session = self._init_session()
-                continue
-
-        raise ConnectionError(f"Could not download {url}.")
+    def _request_headers(self, url: str) -> dict:
+        """Use FotMob API headers for every download (sync and async)."""
+        return self._get_fotmob_headers()
 
 
 def _safe_number(value: Any) -> Optional[float]:
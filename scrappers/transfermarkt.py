@@ -67,9 +67,7 @@ class Transfermarkt(BaseRequestsReader):
             no_store=no_store,
             data_dir=data_dir,
         )
-        # Rate limiting: 6-9s total per request to avoid 429 errors
-        self.rate_limit = 6
-        self.max_delay = 3
+        # Pacing (6s between requests + 0-3s jitter, shared across processes): RATE_LIMITS
 
     def search_player(
         self, player_name: str, birth_year: Optional[int] = None
@@ -79,12 +77,7 @@ class Transfermarkt(BaseRequestsReader):
         Uses fuzzy matching (85% threshold) with optional birth year filtering
         to disambiguate common names.
         """
-        # "schnellsuche" = German for "quick search"
-        query = quote(player_name)
-        url = f"{TRANSFERMARKT_URL}/schnellsuche/ergebnis/schnellsuche?query={query}"
-
-        filepath = self.data_dir / "search" / f"{self._normalize_name(player_name)}.html"
-        reader = self.get(url, filepath, max_age=60)
+        reader = self.get(**self._search_request(player_name))
 
         tree = html.parse(reader)
         results_xpath = "//table[contains(@class, 'items')]//tbody//tr"
@@ -152,6 +145,55 @@ class Transfermarkt(BaseRequestsReader):
         )
         return None
 
+    def _search_request(self, player_name: str) -> Dict[str, Any]:
+        """get() kwargs for a player's quick-search results page."""
+        # "schnellsuche" = German for "quick search"
+        query = quote(player_name)
+        return {
+            "url": f"{TRANSFERMARKT_URL}/schnellsuche/ergebnis/schnellsuche?query={query}",
+            "filepath": self.data_dir / "search" / f"{self._normalize_name(player_name)}.html",
+        }
+
+    def prefetch_searches(self, player_names: list[str]) -> int:
+        """Download quick-search pages for many players concurrently.
+
+        Warms the cache files search_player() reads. Returns number of pages
+        that could not be fetched.
+        """
+        requests = [self._search_request(name) for name in dict.fromkeys(player_names)]
+        failed = sum(isinstance(r, Exception) for r in self.get_many(requests))
+        if failed:
+            logger.debug(f"Transfermarkt search prefetch: {failed}/{len(requests)} pages failed")
+        return failed
+
+    def prefetch_players(
+        self, player_ids: list[str], market_history: bool = True
+    ) -> int:
+        """Download profile pages (and market value histories) for many players concurrently.
+
+        Warms the same cache files read_player_profile() uses, so later
+        per-player calls are cache hits. Requests still go through the shared
+        Transfermarkt limiter.
+
+        Returns number of pages that could not be fetched.
+        """
+        requests = []
+        for player_id in player_ids:
+            requests.append({
+                "url": f"{TRANSFERMARKT_URL}/-/profil/spieler/{player_id}",
+                "filepath": self.data_dir / "players" / f"{player_id}.html",
+            })
+            if market_history:
+                requests.append({
+                    "url": f"{TRANSFERMARKT_URL}/ceapi/marketValueDevelopment/graph/{player_id}",
+                    "filepath": self.data_dir / "market_history" / f"{player_id}.json",
+                })
+
+        failed = sum(isinstance(r, Exception) for r in self.get_many(requests))
+        if failed:
+            logger.debug(f"Transfermarkt prefetch: {failed}/{len(requests)} pages failed")
+        return failed
+
     def read_player_market_value_history(self, player_id: str) -> list:
         """Extract market value history from Transfermarkt's internal JSON API.
 
@@ -160,7 +202,7 @@ class Transfermarkt(BaseRequestsReader):
         url = f"{TRANSFERMARKT_URL}/ceapi/marketValueDevelopment/graph/{player_id}"
 
         filepath = self.data_dir / "market_history" / f"{player_id}.json"
-        reader = self.get(url, filepath, max_age=30)
+        reader = self.get(url, filepath)
 
         try:
             import json
@@ -198,7 +240,7 @@ class Transfermarkt(BaseRequestsReader):
         url = f"{TRANSFERMARKT_URL}/-/profil/spieler/{player_id}"
 
         filepath = self.data_dir / "players" / f"{player_id}.html"
-        reader = self.get(url, filepath, max_age=30)
+        reader = self.get(url, filepath)
 
         tree = html.parse(reader)
 
@@ -182,9 +182,9 @@ class Understat(BaseRequestsReader):
             url = league_season["url"]
 
             is_current_season = not self._is_complete(league, season)
-            no_cache = is_current_season and not force_cache
+            final = not is_current_season or force_cache
 
-            data = self._read_league_season(url, league_id, season_id, no_cache)
+            data = self._read_league_season(url, league_id, season_id, final)
 
             matches_data = data["datesData"]
             for match in matches_data:
@@ -259,9 +259,9 @@ class Understat(BaseRequestsReader):
             url = league_season["url"]
 
             is_current_season = not self._is_complete(league, season)
-            no_cache = is_current_season and not force_cache
+            final = not is_current_season or force_cache
 
-            data = self._read_league_season(url, league_id, season_id, no_cache)
+            data = self._read_league_season(url, league_id, season_id, final)
 
             schedule = {}  # match_id -> match metadata
             matches = {}   # (date, team_id) -> match_id
@@ -353,9 +353,9 @@ class Understat(BaseRequestsReader):
             url = league_season["url"]
 
             is_current_season = not self._is_complete(league, season)
-            no_cache = is_current_season and not force_cache
+            final = not is_current_season or force_cache
 
-            data = self._read_league_season(url, league_id, season_id, no_cache)
+            data = self._read_league_season(url, league_id, season_id, final)
 
             teams_data = data["teamsData"]
             team_mapping = {}
@@ -441,7 +441,7 @@ class Understat(BaseRequestsReader):
             game_id = league_season_game["game_id"]
             url = league_season_game["url"]
 
-            data = self._read_match(url, game_id)
+            data = self._read_match(url, game_id, _as_bool(league_season_game["is_result"]))
             if data is None:
                 continue
 
@@ -523,7 +523,7 @@ class Understat(BaseRequestsReader):
             game_id = league_season_game["game_id"]
             url = league_season_game["url"]
 
-            data = self._read_match(url, game_id)
+            data = self._read_match(url, game_id, _as_bool(league_season_game["is_result"]))
             if data is None:
                 continue
 
@@ -611,24 +611,29 @@ class Understat(BaseRequestsReader):
             url = league_season["url"]
 
             is_current_season = not self._is_complete(league, season)
-            no_cache = is_current_season and not force_cache
+            final = not is_current_season or force_cache
 
-            data = self._read_league_season(url, league_season["league_id"], season_id, no_cache)
+            data = self._read_league_season(url, league_season["league_id"], season_id, final)
             teams_data = data["teamsData"]
 
-            for team in teams_data.values():
-                team_name = _as_str(team["title"])
-                team_id = _as_int(team["id"])
-                team_slug = team_name.replace(" ", "_")
-
-                endpoint = f"{UNDERSTAT_URL}/getTeamData/{team_slug}/{season_id}"
-                filepath = self.data_dir / f"team_{team_id}_{season_id}_advanced.json"
+            teams = [
+                (_as_str(team["title"]), _as_int(team["id"])) for team in teams_data.values()
+            ]
+            team_results = self._fetch_ajax_many(
+                [
+                    (
+                        f"{UNDERSTAT_URL}/getTeamData/{team_name.replace(' ', '_')}/{season_id}",
+                        self.data_dir / f"team_{team_id}_{season_id}_advanced.json",
+                    )
+                    for team_name, team_id in teams
+                ],
+                final,
+            )
 
-                try:
-                    team_data = self._fetch_ajax(endpoint, filepath, no_cache)
-                except Exception as e:
+            for (team_name, team_id), team_data in zip(teams, team_results):
+                if isinstance(team_data, Exception):
                     from ._config import logger
-                    logger.debug(f"Error fetching advanced stats for {team_name}: {e}")
+                    logger.debug(f"Error fetching advanced stats for {team_name}: {team_data}")
                     continue
 
                 record = {
@@ -735,30 +740,46 @@ class Understat(BaseRequestsReader):
 
         return df
 
-    def _fetch_ajax(self, endpoint: str, filepath: Path, no_cache: bool = False) -> dict:
-        """Fetch JSON from Understat AJAX endpoint with 30-day file cache."""
-        is_cached = self._is_cached(filepath, max_age=30)
-        if not no_cache and not self.no_cache and is_cached:
-            with filepath.open("rb") as f:
-                return json.load(f)
-
-        import time as _time
-        import random as _random
-
+    def _request_headers(self, url: str) -> dict:
+        """Browser headers, marked as XHR for the AJAX (get*) endpoints."""
         headers = self._get_random_headers()
-        headers["X-Requested-With"] = "XMLHttpRequest"
+        if url.startswith(f"{UNDERSTAT_URL}/get"):
+            headers["X-Requested-With"] = "XMLHttpRequest"
+        return headers
 
-        response = self._session.get(endpoint, headers=headers)
-        _time.sleep(self.rate_limit + _random.random() * self.max_delay)
-        response.raise_for_status()
-        data = response.json()
+    def _fetch_ajax(
+        self,
+        endpoint: str,
+        filepath: Path,
+        no_cache: bool = False,
+        final: Optional[bool] = None,
+    ) -> dict:
+        """Fetch JSON from an Understat AJAX endpoint, cached per the cache policy."""
+        return json.load(self.get(endpoint, filepath, no_cache=no_cache, final=final))
 
-        if not self.no_store and filepath is not None:
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            with filepath.open("wb") as fh:
-                fh.write(json.dumps(data).encode("utf-8"))
+    def _fetch_ajax_many(
+        self, requests: list[tuple[str, Path]], final: Optional[bool] = None
+    ) -> list[Union[dict, Exception]]:
+        """Fetch several AJAX endpoints concurrently (same cache as _fetch_ajax).
+
+        Returns one parsed dict per (endpoint, filepath), or the exception
+        that request failed with.
+        """
+        readers = self.get_many(
+            {"url": endpoint, "filepath": filepath, "final": final}
+            for endpoint, filepath in requests
+        )
 
-        return data
+        results: list[Union[dict, Exception]] = []
+        for reader in readers:
+            if isinstance(reader, Exception):
+                results.append(reader)
+                continue
+            try:
+                results.append(json.load(reader))
+            except ValueError as e:
+                results.append(e)
+        return results
 
     def _read_leagues(self, no_cache: bool = False) -> dict:
         """Fetch league metadata from getStatData endpoint."""
@@ -767,30 +788,33 @@ class Understat(BaseRequestsReader):
         return {"statData": data["stat"]}
 
     def _read_league_season(
-        self, url: str, league_id: int, season_id: int, no_cache: bool = False
+        self, url: str, league_id: int, season_id: int, final: Optional[bool] = None
     ) -> dict:
         """Fetch matches, players, and teams for a league-season."""
         league_slug = url.split("/league/")[1].split("/")[0]
         endpoint = f"{UNDERSTAT_URL}/getLeagueData/{league_slug}/{season_id}"
         filepath = self.data_dir / f"league_{league_id}_season_{season_id}.json"
-        data = self._fetch_ajax(endpoint, filepath, no_cache)
+        data = self._fetch_ajax(endpoint, filepath, final=final)
         return {
             "datesData": data["dates"],
             "playersData": data["players"],
             "teamsData": data["teams"],
         }
 
-    def _read_match(self, url: str, match_id: int) -> Optional[dict]:
-        """Fetch match data: info from HTML, rosters+shots from AJAX. Returns None on error."""
+    def _read_match(self, url: str, match_id: int, final: Optional[bool] = None) -> Optional[dict]:
+        """Fetch match data: info from HTML, rosters+shots from AJAX. Returns None on error.
+
+        Finished matches (final=True) never change and are cached for good.
+        """
         try:
             filepath_html = self.data_dir / f"match_{match_id}_info.json"
-            response = self.get(url, filepath_html, var="match_info")
+            response = self.get(url, filepath_html, var="match_info", final=final)
             match_info_wrapper = json.load(response)
             match_info = match_info_wrapper.get("match_info", match_info_wrapper)
 
             filepath_data = self.data_dir / f"match_{match_id}_data.json"
             ajax_data = self._fetch_ajax(
-                f"{UNDERSTAT_URL}/getMatchData/{match_id}", filepath_data
+                f"{UNDERSTAT_URL}/getMatchData/{match_id}", filepath_data, final=final
             )
 
             # Remap rosters from {h/a: ...} to {team_id: ...} for compatibility
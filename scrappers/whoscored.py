@@ -8,7 +8,6 @@ Supports multiple output formats including raw JSON, DataFrame, and SPADL.
 import itertools
 import json
 import re
-import time
 from collections.abc import Iterable
 from pathlib import Path
 from typing import Callable, Literal, Optional, Union
@@ -16,17 +15,23 @@ from typing import Callable, Literal, Optional, Union
 import numpy as np
 import pandas as pd
 from lxml import html
-from selenium.common.exceptions import (
-    ElementClickInterceptedException,
-    NoSuchElementException,
-)
 from selenium.webdriver.common.by import By
 
+from ._cachestore import FileCacheStore
 from ._common import BaseSeleniumReader, make_game_id, standardize_colnames
-from ._config import DATA_DIR, NOCACHE, NOSTORE, TEAMNAME_REPLACEMENTS, logger
+from ._config import (
+    DATA_DIR,
+    NOCACHE,
+    NOSTORE,
+    SELENIUM_DRIVERS,
+    TEAMNAME_REPLACEMENTS,
+    logger,
+)
 
 WHOSCORED_DATADIR = DATA_DIR / "WhoScored"
 WHOSCORED_URL = "https://www.whoscored.com"
+# A match page stops changing this long after kick-off (then cached for good)
+MATCH_FINAL_AFTER = pd.Timedelta(hours=4)
 
 # Column schema with defaults for event DataFrames
 COLS_EVENTS = {
@@ -110,6 +115,9 @@ class WhoScored(BaseSeleniumReader):
         Path to Chrome executable.
     headless : bool, default: False
         Run Chrome in headless mode.
+    max_drivers : int
+        Browsers kept warm; match and fixture pages are fetched in parallel
+        across them (default: SOCCERDATA_SELENIUM_DRIVERS or 3).
     """
 
     def __init__(
@@ -122,6 +130,7 @@ class WhoScored(BaseSeleniumReader):
         data_dir: Path = WHOSCORED_DATADIR,
         path_to_browser: Optional[Path] = None,
         headless: bool = False,
+        max_drivers: int = SELENIUM_DRIVERS,
     ):
         """Initialize the WhoScored reader."""
         super().__init__(
@@ -132,10 +141,9 @@ class WhoScored(BaseSeleniumReader):
             data_dir=data_dir,
             path_to_browser=path_to_browser,
             headless=headless,
+            max_drivers=max_drivers,
         )
         self.seasons = seasons  # type: ignore
-        self.rate_limit = 5
-        self.max_delay = 5
         if not self.no_store:
             for subdir in ("seasons", "matches", "previews", "events"):
                 (self.data_dir / subdir).mkdir(parents=True, exist_ok=True)
@@ -228,7 +236,7 @@ class WhoScored(BaseSeleniumReader):
                 + f"/Seasons/{season['season_id']}"
             )
             filepath = self.data_dir / filemask.format(lkey, skey)
-            reader = self.get(url, filepath, var=None, no_cache=current_season and not force_cache)
+            reader = self.get(url, filepath, var=None, final=not current_season or force_cache)
             tree = html.parse(reader)
 
             # Default stage from the Fixtures link
@@ -314,12 +322,14 @@ class WhoScored(BaseSeleniumReader):
                 season_stage_url,
                 calendar_filepath,
                 var="wsCalendar",
-                no_cache=current_season and not force_cache,
+                final=not current_season or force_cache,
             )
             mask = json.load(calendar)["mask"]
 
             it = [(year, month) for year in mask for month in mask[year]]
-            for i, (year, month) in enumerate(it):
+
+            def fetch_month(page):
+                i, (year, month) = page
                 filepath = self.data_dir / filemask_schedule.format(lkey, skey, stage_id, month)
                 # Mask uses 0-indexed months; API uses 1-indexed
                 url = WHOSCORED_URL + f"/tournaments/{stage_id}/data/?d={year}{(int(month)+1):02d}"
@@ -342,9 +352,14 @@ class WhoScored(BaseSeleniumReader):
                         skey,
                     )
 
-                reader = self.get(
-                    url, filepath, var=None, no_cache=current_season and not force_cache
+                return self.get(
+                    url, filepath, var=None, final=not current_season or force_cache
                 )
+
+            # Month pages load in parallel across the pooled browsers
+            for reader in self._parallel(fetch_month, enumerate(it)):
+                if isinstance(reader, Exception):
+                    raise reader
                 data = json.load(reader)
                 for tournament in data["tournaments"]:
                     df_schedule = pd.DataFrame(tournament["matches"])
@@ -385,35 +400,39 @@ class WhoScored(BaseSeleniumReader):
         urlmask = WHOSCORED_URL + "/Matches/{}"
         url = urlmask.format(game_id)
         data = {}
-        self._driver.get(url)
-        # Extract league/season from breadcrumb (e.g. "Spain > La Liga - 2024/2025")
-        breadcrumb = self._driver.find_elements(
-            By.XPATH,
-            "//div[@id='breadcrumb-nav']/*[not(contains(@class, 'separator'))]",
-        )
-        country = breadcrumb[0].text
-        league, season = breadcrumb[1].text.split(" - ")
-        # Reverse-lookup WhoScored name -> internal league code
-        data["league"] = {v: k for k, v in self._all_leagues().items()}[f"{country} - {league}"]
-        data["season"] = self._season_code.parse(season)
-        match_header = self._driver.find_element(By.XPATH, "//div[@id='match-header']")
-        score_info = match_header.find_element(By.XPATH, ".//div[@class='teams-score-info']")
-        data["home_team"] = score_info.find_element(
-            By.XPATH, "./span[contains(@class,'home team')]"
-        ).text
-        data["result"] = score_info.find_element(
-            By.XPATH, "./span[contains(@class,'result')]"
-        ).text
-        data["away_team"] = score_info.find_element(
-            By.XPATH, "./span[contains(@class,'away team')]"
-        ).text
-        # Extract key-value pairs from info blocks (referee, stadium, attendance)
-        info_blocks = match_header.find_elements(By.XPATH, ".//div[@class='info-block cleared']")
-        for block in info_blocks:
-            for desc_list in block.find_elements(By.TAG_NAME, "dl"):
-                for desc_def in desc_list.find_elements(By.TAG_NAME, "dt"):
-                    desc_val = desc_def.find_element(By.XPATH, "./following-sibling::dd")
-                    data[desc_def.text] = desc_val.text
+        with self._pool.lease() as driver:
+            driver.get(url)
+            # Extract league/season from breadcrumb (e.g. "Spain > La Liga - 2024/2025")
+            breadcrumb = driver.find_elements(
+                By.XPATH,
+                "//div[@id='breadcrumb-nav']/*[not(contains(@class, 'separator'))]",
+            )
+            country = breadcrumb[0].text
+            league, season = breadcrumb[1].text.split(" - ")
+            # Reverse-lookup WhoScored name -> internal league code
+            league_codes = {v: k for k, v in self._all_leagues().items()}
+            data["league"] = league_codes[f"{country} - {league}"]
+            data["season"] = self._season_code.parse(season)
+            match_header = driver.find_element(By.XPATH, "//div[@id='match-header']")
+            score_info = match_header.find_element(By.XPATH, ".//div[@class='teams-score-info']")
+            data["home_team"] = score_info.find_element(
+                By.XPATH, "./span[contains(@class,'home team')]"
+            ).text
+            data["result"] = score_info.find_element(
+                By.XPATH, "./span[contains(@class,'result')]"
+            ).text
+            data["away_team"] = score_info.find_element(
+                By.XPATH, "./span[contains(@class,'away team')]"
+            ).text
+            # Extract key-value pairs from info blocks (referee, stadium, attendance)
+            info_blocks = match_header.find_elements(
+                By.XPATH, ".//div[@class='info-block cleared']"
+            )
+            for block in info_blocks:
+                for desc_list in block.find_elements(By.TAG_NAME, "dl"):
+                    for desc_def in desc_list.find_elements(By.TAG_NAME, "dt"):
+                        desc_val = desc_def.find_element(By.XPATH, "./following-sibling::dd")
+                        data[desc_def.text] = desc_val.text
 
         return data
 
@@ -461,7 +480,7 @@ class WhoScored(BaseSeleniumReader):
                 len(iterator),
                 game["game_id"],
             )
-            reader = self.get(url, filepath, var=None)
+            reader = self.get(url, filepath, var=None, final=_is_finished(game["date"]))
 
             tree = html.parse(reader)
             # div[2] = home team, div[3] = away team missing players
@@ -597,42 +616,55 @@ class WhoScored(BaseSeleniumReader):
         player_names = {}    # Accumulated player_id -> name mapping
         team_names = {}      # Accumulated team_id -> name mapping
 
-        for i, (_, game) in enumerate(iterator.iterrows()):
+        games = [game for _, game in iterator.iterrows()]
+
+        def fetch_game(page):
+            i, game = page
             url = urlmask.format(game["game_id"])
             logger.info(
                 "[%s/%s] Retrieving game with id=%s",
                 i + 1,
-                len(iterator),
+                len(games),
                 game["game_id"],
             )
             filepath = self.data_dir / filemask.format(
                 game["league"], game["season"], game["game_id"]
             )
+            # Event data is embedded in the matchCentreData JS variable
+            reader = self.get(
+                url,
+                filepath,
+                var="require.config.params['args'].matchCentreData",
+                no_cache=live,
+                final=not live and _is_finished(game["date"]),
+            )
+            reader_value = reader.read()
 
-            try:
-                # Event data is embedded in the matchCentreData JS variable
+            # "null" or empty means match data unavailable; retry fresh
+            if retry_missing and reader_value == b"null" or reader_value == b"":
                 reader = self.get(
                     url,
                     filepath,
                     var="require.config.params['args'].matchCentreData",
-                    no_cache=live,
+                    no_cache=True,
                 )
-                reader_value = reader.read()
-
-                # "null" or empty means match data unavailable; retry fresh
-                if retry_missing and reader_value == b"null" or reader_value == b"":
-                    reader = self.get(
-                        url,
-                        filepath,
-                        var="require.config.params['args'].matchCentreData",
-                        no_cache=True,
-                    )
-            except ConnectionError as e:
-                if on_error == "skip":
-                    logger.warning("Error while scraping game %s: %s", game["game_id"], e)
-                    continue
-                raise
+            return reader
+
+        # Match pages load in parallel across the pooled browsers
+        for game, reader in zip(games, self._parallel(fetch_game, enumerate(games))):
+            if isinstance(reader, ConnectionError) and on_error == "skip":
+                logger.warning("Error while scraping game %s: %s", game["game_id"], reader)
+                continue
+            if isinstance(reader, Exception):
+                raise reader
+            filepath = self.data_dir / filemask.format(
+                game["league"], game["season"], game["game_id"]
+            )
             reader.seek(0)
+            if output_fmt in ["loader", "spadl", "atomic-spadl"] and not filepath.exists():
+                # socceraction parsers read the JSON from disk, which the blob backend never writes
+                FileCacheStore().put(filepath, reader.read())
+                reader.seek(0)
             json_data = json.load(reader)
             if json_data is not None:
                 player_names.update(
@@ -726,13 +758,12 @@ class WhoScored(BaseSeleniumReader):
 
         return df
 
-    def _handle_banner(self) -> None:
-        """Dismiss the cookie consent banner if present."""
-        try:
-            time.sleep(2)
-            self._driver.find_element(By.XPATH, "//button[./span[text()='AGREE']]").click()
-            time.sleep(2)
-        except NoSuchElementException:
-            # No banner found; page may be blocked or layout changed
-            raise ElementClickInterceptedException()
-        
\ No newline at end of file
+
+def _is_finished(start) -> bool:
+    """True if a match that kicked off at start (UTC) is certainly over."""
+    if pd.isna(start):
+        return False
+    start = pd.Timestamp(start)
+    if start.tzinfo is None:
+        start = start.tz_localize("UTC")
+    return start + MATCH_FINAL_AFTER < pd.Timestamp.now(tz="UTC")
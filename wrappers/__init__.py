@@ -35,6 +35,7 @@ from .understat_data import (
     extract_data as understat_extract_data,
     extract_multiple as understat_extract_multiple,
     extract_shot_events as understat_extract_shot_events,
+    extract_league_players as understat_extract_league_players,
     export_to_csv as understat_export_to_csv,
     get_match_ids as understat_get_match_ids,
     search_player_id as understat_search_player_id,
@@ -43,6 +44,9 @@ from .understat_data import (
     get_player as understat_get_player,
     get_team as understat_get_team,
     get_players as understat_get_players,
+    get_league_players as understat_get_league_players,
+    match_players as understat_match_players,
+    PlayerMatcher as UnderstatPlayerMatcher,
     get_teams as understat_get_teams,
     get_shots as understat_get_shots,
     get_team_advanced as understat_get_team_advanced,
@@ -76,17 +80,22 @@ from .whoscored_data import (
 # Transfermarkt
 from .transfermarkt_data import (
     transfermarkt_get_player,
+    transfermarkt_prefetch_players,
     clear_cache as transfermarkt_clear_cache,
 )
 
 # ELO Ratings
 from .elo_data import (
     get_rankings as elo_get_rankings,
+    get_rankings_range as elo_get_rankings_range,
     get_latest_matches as elo_get_latest_matches,
     get_matches_for_year as elo_get_matches_for_year,
     get_matches_range as elo_get_matches_range,
     get_h2h as elo_get_h2h,
+    get_h2h_index as elo_get_h2h_index,
+    clear_h2h_cache as elo_clear_h2h_cache,
     get_team_rating as elo_get_team_rating,
+    H2HIndex as EloH2HIndex,
 )
 
 __all__ = [
@@ -107,6 +116,7 @@ __all__ = [
     "understat_extract_data",
     "understat_extract_multiple",
     "understat_extract_shot_events",
+    "understat_extract_league_players",
     "understat_export_to_csv",
     "understat_get_match_ids",
     "understat_search_player_id",
@@ -115,6 +125,9 @@ __all__ = [
     "understat_get_player",
     "understat_get_team",
     "understat_get_players",
+    "understat_get_league_players",
+    "understat_match_players",
+    "UnderstatPlayerMatcher",
     "understat_get_teams",
     "understat_get_shots",
     "understat_get_team_advanced",
@@ -142,14 +155,19 @@ __all__ = [
     "whoscored_get_missing_players",
     # Transfermarkt
     "transfermarkt_get_player",
+    "transfermarkt_prefetch_players",
     "transfermarkt_clear_cache",
     # ELO Ratings
     "elo_get_rankings",
+    "elo_get_rankings_range",
     "elo_get_latest_matches",
     "elo_get_matches_for_year",
     "elo_get_matches_range",
     "elo_get_h2h",
+    "elo_get_h2h_index",
+    "elo_clear_h2h_cache",
     "elo_get_team_rating",
+    "EloH2HIndex",
 ]
 
 
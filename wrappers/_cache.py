@@ -0,0 +1,113 @@
+"""In-process memo of parsed league tables shared by the wrappers.
+
+Per-entity lookups (one player/team per call) used to rebuild the scraper's
+whole league table every time. TABLE_CACHE keeps the parsed DataFrame keyed
+by (source, league, season, table) and reloads it as soon as one of the
+scraper cache entries behind it changes (see CacheStore.stamp()), or once it
+is older than the CachePolicy TTL of the resources it is parsed from.
+"""
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from scrappers._cachepolicy import CACHE_RULES
+from scrappers._cachestore import Stamp
+from scrappers._config import logger
+
+TABLE_CACHE_SIZE = 32
+# Wrapper tables are built from league-season payloads (see CACHE_POLICY)
+LEAGUE_TABLE_MAX_AGE = CACHE_RULES.named("league_season").max_age()
+
+
+class TableCache:
+    """Thread-safe, size-bounded LRU of parsed tables, invalidated by cache stamps.
+
+    Each entry remembers the stamp (fetch time + size) of the cache entries it
+    was parsed from; a lookup whose entries changed, or that has none, reloads.
+    A lookup given max_age also reloads an entry loaded longer ago than that,
+    so the scraper's get() re-applies the cache policy (refetching expired
+    payloads) instead of the memo serving them indefinitely.
+    Concurrent misses on the same key wait for a single load. Returned tables
+    are shared between callers and must be treated as read-only.
+
+    Args:
+        maxsize: Maximum number of tables kept (least recently used evicted).
+    """
+
+    def __init__(self, maxsize: int = TABLE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Stamp, Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Held only while a lookup uses it, so keys no longer requested drop out
+        self._key_locks: "weakref.WeakValueDictionary[Hashable, threading.Lock]" = (
+            weakref.WeakValueDictionary()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        stamp: Callable[[], Stamp],
+        max_age: Optional[timedelta] = None,
+    ) -> Any:
+        """Return the memoized table for key, loading it if missing or stale.
+
+        Args:
+            key: (source, league, season, table) tuple.
+            loader: Builds the table (typically a scraper read_* call).
+            stamp: Stamps the cache entries the table is parsed from.
+            max_age: Reload an entry loaded longer ago than this (None = only
+                on stamp changes).
+
+        Returns:
+            The cached or freshly loaded table.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            current = stamp()
+            with self._lock:
+                entry = self._entries.get(key)
+                if (
+                    entry is not None
+                    and current
+                    and entry[0] == current
+                    and (max_age is None or time.time() - entry[2] <= max_age.total_seconds())
+                ):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                self.misses += 1
+
+            value = loader()
+            # The loader may have (re)downloaded entries: stamp what it actually read
+            current = stamp()
+            with self._lock:
+                self._entries[key] = (current, value, time.time())
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    evicted, _ = self._entries.popitem(last=False)
+                    logger.debug("Table cache evicted %s", evicted)
+            return value
+
+    def clear(self, source: Optional[str] = None):
+        """Drop all entries, or only those whose key starts with source."""
+        with self._lock:
+            if source is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == source]:
+                    del self._entries[key]
+
+
+TABLE_CACHE = TableCache()
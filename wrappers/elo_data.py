@@ -4,8 +4,10 @@ Simplified API for national team ELO rankings, historical match results,
 and head-to-head records. Wraps scrappers.elo.EloRatings.
 """
 
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 from scrappers.elo import EloRatings
@@ -25,6 +27,20 @@ def get_rankings(year: Optional[int] = None) -> pd.DataFrame:
     return elo.read_rankings(year=year)
 
 
+def get_rankings_range(start_year: int, end_year: int) -> Dict[int, pd.DataFrame]:
+    """Fetch ELO rankings for every year in a range (concurrent downloads).
+
+    Args:
+        start_year: First year (inclusive).
+        end_year: Last year (inclusive).
+
+    Returns:
+        Dict mapping year -> rankings DataFrame (years without data omitted).
+    """
+    elo = EloRatings()
+    return elo.read_rankings_range(start_year, end_year)
+
+
 def get_latest_matches() -> pd.DataFrame:
     """Fetch recent international match results.
 
@@ -62,89 +78,224 @@ def get_matches_range(start_year: int, end_year: int) -> pd.DataFrame:
     return elo.read_matches_range(start_year, end_year)
 
 
+DateLike = Union[str, pd.Timestamp, None]
+
+
+class H2HIndex:
+    """Pre-aggregated head-to-head records for every team pair.
+
+    Built once from a match frame (one vectorized pass), keyed by the
+    unordered case-folded team pair. Each pair keeps its matches in date
+    order with cumulative wins/draws/goals, so a lookup is a dict probe
+    plus, for date-bounded queries, a binary search.
+
+    Args:
+        matches_df: Match results with team1, team2, team1_score,
+            team2_score and date columns (get_matches_range() format).
+    """
+
+    def __init__(self, matches_df: pd.DataFrame):
+        self._pairs: Dict[Tuple[str, str], Dict[str, np.ndarray]] = {}
+        if matches_df is None or matches_df.empty:
+            return
+
+        # Score cells the parser kept as text (e.g. "3-2 aet") are not countable
+        s1 = pd.to_numeric(matches_df["team1_score"], errors="coerce")
+        s2 = pd.to_numeric(matches_df["team2_score"], errors="coerce")
+        scored = s1.notna() & s2.notna()
+        if not scored.all():
+            logger.debug("H2H index: skipping %d matches without numeric scores", (~scored).sum())
+            matches_df = matches_df[scored]
+            s1, s2 = s1[scored], s2[scored]
+        s1 = s1.astype("int64").to_numpy()
+        s2 = s2.astype("int64").to_numpy()
+        t1 = matches_df["team1"].astype(str).str.casefold().to_numpy()
+        t2 = matches_df["team2"].astype(str).str.casefold().to_numpy()
+
+        if "date" in matches_df:
+            dates = matches_df["date"]
+        else:
+            dates = pd.Series(None, index=matches_df.index, dtype=object)
+        # Undated matches sort first: counted when no date bound is given, but
+        # never the "last" meeting (and dropped under a cutoff, see get())
+        ts = pd.to_datetime(dates, errors="coerce")
+        undated = ts.isna().to_numpy()
+        ts = ts.fillna(pd.Timestamp.min)
+
+        # Orient every match as (lo, hi) by team name
+        swap = t1 > t2
+        frame = pd.DataFrame({
+            "lo": np.where(swap, t2, t1),
+            "hi": np.where(swap, t1, t2),
+            "goals_lo": np.where(swap, s2, s1),
+            "goals_hi": np.where(swap, s1, s2),
+            "ts": ts.to_numpy(),
+            "date": dates.to_numpy(),
+            "undated": undated,
+        })
+        frame = frame.sort_values(["lo", "hi", "ts"], kind="mergesort")
+
+        for (lo, hi), g in frame.groupby(["lo", "hi"], sort=False):
+            goals_lo = g["goals_lo"].to_numpy()
+            goals_hi = g["goals_hi"].to_numpy()
+            self._pairs[(lo, hi)] = {
+                "ts": g["ts"].to_numpy(),
+                "date": g["date"].to_numpy(),
+                "goals_lo": goals_lo,
+                "goals_hi": goals_hi,
+                "cum_goals_lo": _cumsum0(goals_lo),
+                "cum_goals_hi": _cumsum0(goals_hi),
+                "cum_wins_lo": _cumsum0(goals_lo > goals_hi),
+                "cum_wins_hi": _cumsum0(goals_hi > goals_lo),
+                "n_undated": int(g["undated"].sum()),
+            }
+
+        logger.debug("H2H index: %d pairs from %d matches", len(self._pairs), len(frame))
+
+    @classmethod
+    def from_range(cls, start_year: int, end_year: int) -> "H2HIndex":
+        """Build an index from get_matches_range(start_year, end_year)."""
+        return cls(get_matches_range(start_year, end_year))
+
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+    def get(
+        self,
+        team_a: str,
+        team_b: str,
+        since: DateLike = None,
+        before: DateLike = None,
+    ) -> Dict:
+        """Head-to-head record from team_a's perspective.
+
+        Args:
+            team_a: First team name (case-insensitive).
+            team_b: Second team name (case-insensitive).
+            since: Only count matches on or after this date.
+            before: Only count matches strictly before this date (use the
+                fixture date for leak-free backtests).
+
+        Matches without a date are only counted when neither bound is given,
+        since they cannot be placed relative to a cutoff.
+
+        Returns:
+            Dict in the same format as get_h2h().
+        """
+        a, b = team_a.casefold(), team_b.casefold()
+        pair = self._pairs.get((a, b) if a <= b else (b, a))
+        if pair is None:
+            return _empty_h2h()
+
+        ts = pair["ts"]
+        start = 0 if since is None else int(np.searchsorted(ts, np.datetime64(pd.Timestamp(since)), "left"))
+        end = len(ts) if before is None else int(np.searchsorted(ts, np.datetime64(pd.Timestamp(before)), "left"))
+        if since is not None or before is not None:
+            start = max(start, pair["n_undated"])
+        n = end - start
+        if n <= 0:
+            return _empty_h2h()
+
+        a_is_lo = a <= b
+        side_a, side_b = ("lo", "hi") if a_is_lo else ("hi", "lo")
+
+        def total(key: str) -> int:
+            cum = pair[key]
+            return cum[end] - cum[start]
+
+        goals_a = int(total(f"cum_goals_{side_a}"))
+        goals_b = int(total(f"cum_goals_{side_b}"))
+        wins_a = int(total(f"cum_wins_{side_a}"))
+        wins_b = int(total(f"cum_wins_{side_b}"))
+
+        last_ga = pair[f"goals_{side_a}"][end - 1]
+        last_gb = pair[f"goals_{side_b}"][end - 1]
+        if last_ga > last_gb:
+            last_result = "W"
+        elif last_gb > last_ga:
+            last_result = "L"
+        else:
+            last_result = "D"
+
+        return {
+            "matches": n,
+            "wins_a": wins_a,
+            "wins_b": wins_b,
+            "draws": n - wins_a - wins_b,
+            "goals_a": goals_a,
+            "goals_b": goals_b,
+            "avg_goal_diff": (goals_a - goals_b) / n,
+            "win_pct_a": wins_a / n,
+            "last_result": last_result,
+            "last_date": pair["date"][end - 1],
+        }
+
+
+def get_h2h_index(
+    start_year: int = 2014,
+    end_year: Optional[int] = None,
+    refresh: bool = False,
+) -> H2HIndex:
+    """Head-to-head index over a year range, built once per range.
+
+    The index is kept for the life of the process, so matches played after
+    it was built are not seen. Pass refresh=True (or call clear_h2h_cache())
+    to rebuild it from freshly fetched results.
+
+    Args:
+        start_year: First year (inclusive).
+        end_year: Last year (inclusive, default: current year).
+        refresh: Drop every cached index and rebuild this one.
+
+    Returns:
+        H2HIndex shared by all callers asking for the same range.
+    """
+    if end_year is None:
+        from datetime import datetime
+        end_year = datetime.now().year
+    if refresh:
+        clear_h2h_cache()
+    return _cached_h2h_index(start_year, end_year)
+
+
+def clear_h2h_cache():
+    """Forget every cached H2HIndex (the next lookup rebuilds it)."""
+    _cached_h2h_index.cache_clear()
+
+
 def get_h2h(
     team_a: str,
     team_b: str,
     matches_df: Optional[pd.DataFrame] = None,
     start_year: int = 2014,
+    before: DateLike = None,
 ) -> Dict:
     """Compute head-to-head record between two national teams.
 
+    For many lookups build an H2HIndex (or use get_h2h_index()) once and
+    query it directly.
+
     Args:
         team_a: First team name (e.g. "Brazil").
         team_b: Second team name (e.g. "Argentina").
-        matches_df: Pre-loaded matches DataFrame. If None, fetches from start_year to now.
+        matches_df: Pre-loaded matches DataFrame. If None, uses the cached
+            index from start_year to now (see get_h2h_index() to refresh it).
         start_year: Start year if matches_df not provided.
+        before: Only count matches strictly before this date.
 
     Returns:
         Dict with h2h stats: matches, wins_a, wins_b, draws, goals_a, goals_b,
         avg_goal_diff, last_result, last_date.
     """
     if matches_df is None:
-        from datetime import datetime
-        current_year = datetime.now().year
-        matches_df = get_matches_range(start_year, current_year)
-
-    if matches_df.empty:
-        return _empty_h2h()
-
-    a_lower = team_a.lower()
-    b_lower = team_b.lower()
-
-    # Filter matches where both teams played
-    mask = (
-        (matches_df["team1"].str.lower() == a_lower) & (matches_df["team2"].str.lower() == b_lower)
-    ) | (
-        (matches_df["team1"].str.lower() == b_lower) & (matches_df["team2"].str.lower() == a_lower)
-    )
-    h2h = matches_df[mask].copy()
-
-    if h2h.empty:
-        return _empty_h2h()
-
-    wins_a, wins_b, draws = 0, 0, 0
-    goals_a, goals_b = 0, 0
-
-    for _, row in h2h.iterrows():
-        if row["team1"].lower() == a_lower:
-            ga, gb = row["team1_score"], row["team2_score"]
-        else:
-            ga, gb = row["team2_score"], row["team1_score"]
-        goals_a += ga
-        goals_b += gb
-        if ga > gb:
-            wins_a += 1
-        elif gb > ga:
-            wins_b += 1
-        else:
-            draws += 1
-
-    n = len(h2h)
-    last_row = h2h.iloc[0]  # Already sorted by date desc
-    if last_row["team1"].lower() == a_lower:
-        last_ga, last_gb = last_row["team1_score"], last_row["team2_score"]
+        index = get_h2h_index(start_year)
     else:
-        last_ga, last_gb = last_row["team2_score"], last_row["team1_score"]
-
-    if last_ga > last_gb:
-        last_result = "W"
-    elif last_gb > last_ga:
-        last_result = "L"
-    else:
-        last_result = "D"
-
-    return {
-        "matches": n,
-        "wins_a": wins_a,
-        "wins_b": wins_b,
-        "draws": draws,
-        "goals_a": goals_a,
-        "goals_b": goals_b,
-        "avg_goal_diff": (goals_a - goals_b) / n,
-        "win_pct_a": wins_a / n,
-        "last_result": last_result,
-        "last_date": last_row.get("date"),
-    }
+        # Only this pair's matches: indexing the whole frame costs a groupby per call
+        a, b = team_a.casefold(), team_b.casefold()
+        t1 = matches_df["team1"].astype(str).str.casefold()
+        t2 = matches_df["team2"].astype(str).str.casefold()
+        index = H2HIndex(matches_df[((t1 == a) & (t2 == b)) | ((t1 == b) & (t2 == a))])
+    return index.get(team_a, team_b, before=before)
 
 
 def get_team_rating(team_name: str, year: Optional[int] = None) -> Optional[Dict]:
@@ -182,3 +333,13 @@ def _empty_h2h() -> Dict:
         "last_result": None,
         "last_date": None,
     }
+
+
+@lru_cache(maxsize=8)
+def _cached_h2h_index(start_year: int, end_year: int) -> H2HIndex:
+    return H2HIndex.from_range(start_year, end_year)
+
+
+def _cumsum0(values: np.ndarray) -> np.ndarray:
+    """Cumulative sum with a leading 0 (prefix[k] = sum of first k values)."""
+    return np.concatenate([[0], np.cumsum(values)])
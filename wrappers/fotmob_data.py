@@ -23,6 +23,11 @@ except ImportError:
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from scrappers import FotMob
+from scrappers._cachestore import Stamp, get_cache_store
+from scrappers._config import logger
+from scrappers.fotmob import FOTMOB_DATADIR, _fotmob_league_id
+
+from ._cache import LEAGUE_TABLE_MAX_AGE, TABLE_CACHE
 
 warnings.filterwarnings('ignore', category=FutureWarning)
 
@@ -59,12 +64,57 @@ def _validate_inputs(entity_name: str, entity_type: str, league: str, season: st
 
 
 def _get_league_data(league: str, season: str) -> dict:
-    """Fetch all player and team stats for a league/season from the FotMob scraper."""
+    """Fetch all player and team stats for a league/season from the FotMob scraper.
+
+    Memoized in TABLE_CACHE until one of the season's stats_*.json entries changes
+    or the league-season cache TTL passes.
+    """
+    return TABLE_CACHE.get(
+        ("fotmob", league, season, "league_stats"),
+        lambda: _read_league_data(league, season),
+        lambda: _league_stats_stamp(league, season),
+        LEAGUE_TABLE_MAX_AGE,
+    )
+
+
+def _read_league_data(league: str, season: str) -> dict:
+    """Read and merge the per-stat JSON files into player and team tables."""
     fm = FotMob(leagues=[league], seasons=[season])
     data = fm.read_league_stats()
     return {"players": data["players"], "teams": data["teams"]}
 
 
+def _league_stats_stamp(league: str, season: str) -> Stamp:
+    """Stamp of the scraper cache entries a league-season's stats tables are built from."""
+    league_id = _fotmob_league_id(league)
+    if league_id is None:
+        return ()
+    season_id = _fotmob_season_id(league, season)
+    season_glob = "*" if season_id is None else season_id
+    return get_cache_store().stamp(FOTMOB_DATADIR, f"stats_{league_id}_{season_glob}_*.json")
+
+
+_FOTMOB_SEASON_IDS: Dict[tuple, int] = {}
+
+
+def _fotmob_season_id(league: str, season: str) -> Optional[int]:
+    """FotMob numeric season ID from the cached seasons map (remembered once resolved)."""
+    key = (league, season)
+    if key not in _FOTMOB_SEASON_IDS:
+        try:
+            fm = FotMob(leagues=[league], seasons=[season])
+            season_id = fm._resolve_season_id(
+                _fotmob_league_id(league), fm.seasons[0], force_cache=True
+            )
+        except Exception as e:
+            logger.debug("Could not resolve FotMob season %s %s: %s", league, season, e)
+            return None
+        if season_id is None:
+            return None
+        _FOTMOB_SEASON_IDS[key] = season_id
+    return _FOTMOB_SEASON_IDS[key]
+
+
 def _find_entity(df: pd.DataFrame, entity_name: str) -> Optional[pd.Series]:
     """Find entity row by name. Tries exact match first, then partial via name variations."""
     if df is None or df.empty:
@@ -171,7 +221,7 @@ def extract_multiple(
     if not entities:
         return pd.DataFrame()
 
-    # Pre-fetch once so all threads hit the scraper's file cache instead of the API
+    # Pre-fetch once so all threads share the memoized tables instead of the API
     _get_league_data(league, season)
 
     def extract_single(name: str) -> Optional[Dict]:
@@ -247,14 +297,11 @@ def export_to_csv(data: Union[Dict, pd.DataFrame], filename: str, include_timest
 
 
 def clear_cache():
-    """Delete all cached FotMob JSON files from the scraper's data directory."""
-    from scrappers._config import DATA_DIR
-    fotmob_dir = DATA_DIR / "FotMob"
+    """Delete all cached FotMob JSON payloads from the scraper's cache."""
+    TABLE_CACHE.clear("fotmob")
     try:
-        if fotmob_dir.exists():
-            for f in fotmob_dir.glob("*.json"):
-                f.unlink()
-            print("FotMob scraper cache cleared successfully")
+        get_cache_store().clear(FOTMOB_DATADIR, "*.json")
+        print("FotMob scraper cache cleared successfully")
     except Exception as e:
         print(f"Error clearing cache: {e}")
 
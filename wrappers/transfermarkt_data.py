@@ -4,7 +4,7 @@ Extracts player profiles (position, foot, market value, contract) with
 in-memory player ID caching to avoid repeated search requests.
 """
 
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from scrappers.transfermarkt import Transfermarkt
 from scrappers._config import logger
@@ -61,15 +61,7 @@ def transfermarkt_get_player(
             return None
 
     try:
-        # TM only has historical market values for past seasons;
-        # for current/future seasons, fetch the live value instead
-        use_current_value = False
-        if season:
-            try:
-                first_year = int(season.split('-')[0])
-                use_current_value = first_year >= 25
-            except (ValueError, IndexError):
-                logger.warning(f"Invalid season format: {season}, using historical value")
+        use_current_value = _use_current_value(season)
 
         if use_current_value:
             profile = tm.read_player_profile(player_id, season=None)
@@ -94,6 +86,66 @@ def transfermarkt_get_player(
         return None
 
 
+def transfermarkt_prefetch_players(
+    players: List[Tuple[str, Optional[int]]],
+    season: str,
+) -> int:
+    """Resolve player IDs and download their pages in bulk.
+
+    Search pages, profiles and (for past seasons) market value histories are
+    fetched concurrently through the shared Transfermarkt limiter, so later
+    transfermarkt_get_player() calls for these players are cache hits.
+
+    Args:
+        players: (player_name, birth_year) pairs.
+        season: Season in YY-YY format (e.g. '24-25').
+
+    Returns:
+        Number of players with a resolved Transfermarkt ID.
+    """
+    try:
+        tm = Transfermarkt()
+    except Exception as e:
+        logger.error(f"Error initializing Transfermarkt: {e}")
+        return 0
+
+    pending = [
+        (name, birth_year) for name, birth_year in players
+        if name and f"{name}_{birth_year}" not in _transfermarkt_player_cache
+    ]
+    tm.prefetch_searches([name for name, _ in pending])
+
+    for name, birth_year in pending:
+        try:
+            player_id = tm.search_player(name, birth_year)
+        except Exception as e:
+            logger.debug(f"Error searching player {name}: {e}")
+            continue
+        if player_id:
+            _transfermarkt_player_cache[f"{name}_{birth_year}"] = player_id
+
+    player_ids = [
+        _transfermarkt_player_cache[key]
+        for key in dict.fromkeys(f"{name}_{birth_year}" for name, birth_year in players)
+        if key in _transfermarkt_player_cache
+    ]
+    tm.prefetch_players(player_ids, market_history=not _use_current_value(season))
+    return len(player_ids)
+
+
+def _use_current_value(season: Optional[str]) -> bool:
+    """True if the season's market value is the live one (25-26 onwards)."""
+    # TM only has historical market values for past seasons;
+    # for current/future seasons, fetch the live value instead
+    if not season:
+        return False
+    try:
+        return int(season.split('-')[0]) >= 25
+    except (ValueError, IndexError):
+        logger.warning(f"Invalid season format: {season}, using historical value")
+        return False
+
+
 def clear_cache():
     """Clear the in-memory player ID cache."""
     _transfermarkt_player_cache.clear()
@@ -10,9 +10,11 @@ Usage:
     shots = understat_data.get_shots(26982, "ESP-La Liga", "24-25")
 """
 
-import time
+import re
+import unicodedata
 import warnings
-from typing import Dict, List, Optional, Union, Any
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Union, Any
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -28,10 +30,36 @@ except ImportError:
         return iterable
 
 from scrappers import Understat
-from scrappers._config import LEAGUE_DICT
+from scrappers._cachestore import Stamp, get_cache_store
+from scrappers._config import LEAGUE_DICT, logger
+from scrappers.understat import UNDERSTAT_DATADIR
+
+from ._cache import LEAGUE_TABLE_MAX_AGE, TABLE_CACHE
 
 warnings.filterwarnings('ignore', category=FutureWarning)
 
+# read_player_season_stats() column -> understat_ metric key
+PLAYER_METRICS_MAP = {
+    'player_id': 'understat_player_id',
+    'team_id': 'understat_team_id',
+    'position': 'understat_position',
+    'matches': 'understat_matches',
+    'minutes': 'understat_minutes',
+    'goals': 'understat_goals',
+    'xg': 'understat_xg',
+    'np_goals': 'understat_np_goals',
+    'np_xg': 'understat_np_xg',
+    'assists': 'understat_assists',
+    'xa': 'understat_xa',
+    'shots': 'understat_shots',
+    'key_passes': 'understat_key_passes',
+    'yellow_cards': 'understat_yellow_cards',
+    'red_cards': 'understat_red_cards',
+    'xg_chain': 'understat_xg_chain',
+    'xg_buildup': 'understat_xg_buildup',
+}
+
+
 def _validate_inputs(entity_name: str, entity_type: str, league: str, season: str) -> bool:
     """Validate entity name, type, league and season format (YY-YY)."""
     if not entity_name or not isinstance(entity_name, str) or entity_name.strip() == "":
@@ -65,17 +93,11 @@ def _validate_inputs(entity_name: str, entity_type: str, league: str, season: st
 
 
 def clear_cache():
-    """Delete all cached JSON files from the Understat scraper directory."""
-    from pathlib import Path
-    from scrappers._config import DATA_DIR
-    cache_dir = DATA_DIR / "Understat"
+    """Delete all cached JSON payloads from the Understat scraper cache."""
+    TABLE_CACHE.clear("understat")
     try:
-        if cache_dir.exists():
-            count = 0
-            for f in cache_dir.glob("*.json"):
-                f.unlink()
-                count += 1
-            print(f"Understat cache cleared ({count} files)")
+        count = get_cache_store().clear(UNDERSTAT_DATADIR, "*.json")
+        print(f"Understat cache cleared ({count} files)")
     except Exception as e:
         print(f"Error clearing cache: {e}")
 
@@ -106,10 +128,8 @@ def extract_data(
         return None
 
     try:
-        understat = Understat(leagues=[league], seasons=[season])
-
         if entity_type == 'player':
-            stats = understat.read_player_season_stats()
+            stats = _season_table(league, season, 'player_season_stats')
             entity_row = _find_entity(stats, entity_name, 'player', team_name=team_name)
 
             if entity_row is None:
@@ -125,7 +145,7 @@ def extract_data(
             understat_metrics = _extract_player_metrics(entity_row)
 
         else:
-            team_stats = understat.read_team_match_stats()
+            team_stats = _season_table(league, season, 'team_match_stats')
             team_matches = _find_team_matches(team_stats, entity_name)
 
             if team_matches is None or team_matches.empty:
@@ -163,7 +183,6 @@ def extract_multiple(
 
     def extract_single(name: str) -> Optional[Dict]:
         try:
-            time.sleep(1.0)
             return extract_data(name, entity_type, league, season)
         except Exception as e:
             if show_progress:
@@ -198,6 +217,207 @@ def extract_multiple(
     return _standardize_dataframe(df, entity_type)
 
 
+def extract_league_players(league: str, season: str) -> pd.DataFrame:
+    """Return all players of a league/season with understat_ metrics (one read).
+
+    One row per Understat player with official_player_name, team and the same
+    understat_ keys extract_data() returns for a player (derived stats and
+    per-90 rates included). Metrics extract_data() would omit are NaN.
+    """
+    stats = _season_table(league, season, 'player_season_stats')
+    if stats is None or stats.empty:
+        return pd.DataFrame()
+    return _league_player_metrics(stats)
+
+
+class PlayerMatcher:
+    """Resolve many player names against one league/season Understat table.
+
+    Indexes the table once by normalized name, name token and team, then
+    matches every name in a single pass: exact normalized name, then token
+    containment ("Vinicius Junior" ~ "Vinicius Jose Paixao de Oliveira
+    Junior"), then fuzzy similarity restricted to the player's team.
+    Multiple candidates are narrowed down by team.
+
+    Args:
+        league_players: extract_league_players() output (official_player_name,
+            team and understat_ columns).
+    """
+
+    def __init__(self, league_players: pd.DataFrame):
+        self.players = league_players.reset_index(drop=True)
+        names = self.players['official_player_name'] if not self.players.empty else pd.Series(dtype=object)
+        teams = self.players['team'] if not self.players.empty else pd.Series(dtype=object)
+        self._names = [_normalize_name(n) for n in names]
+        self._tokens = [frozenset(n.split()) for n in self._names]
+        self._teams = [_normalize_name(t) for t in teams]
+
+        self._by_name: Dict[str, List[int]] = {}
+        self._by_token: Dict[str, List[int]] = {}
+        self._by_team: Dict[str, List[int]] = {}
+        for i, (name, tokens, team) in enumerate(zip(self._names, self._tokens, self._teams)):
+            self._by_name.setdefault(name, []).append(i)
+            for token in tokens:
+                self._by_token.setdefault(token, []).append(i)
+            self._by_team.setdefault(team, []).append(i)
+        self._team_cache: Dict[str, Optional[str]] = {}
+
+    @classmethod
+    def from_league(cls, league: str, season: str) -> "PlayerMatcher":
+        """Build a matcher from extract_league_players(league, season)."""
+        return cls(extract_league_players(league, season))
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def match(
+        self,
+        names: Iterable[str],
+        teams: Optional[Iterable[Optional[str]]] = None,
+        min_score: float = 0.85,
+    ) -> pd.DataFrame:
+        """Match names (with optional team names) to Understat rows.
+
+        Args:
+            names: Player names to resolve (e.g. FotMob names).
+            teams: Team of each player, same length as names (any source's naming).
+            min_score: Minimum SequenceMatcher ratio for fuzzy matches.
+
+        Returns:
+            DataFrame with one row per input name: understat_row (position in
+            self.players, -1 if unmatched), official_player_name,
+            understat_player_id, understat_team, match_type ('exact', 'token',
+            'fuzzy' or None) and match_score.
+        """
+        names = list(names)
+        teams = [None] * len(names) if teams is None else list(teams)
+        keys = [_normalize_name(n) for n in names]
+        team_keys = [self._resolve_team(t) for t in teams]
+
+        rows = np.full(len(names), -1, dtype=int)
+        match_type = np.full(len(names), None, dtype=object)
+        score = np.zeros(len(names))
+
+        # Tier 1: exact normalized name
+        for i, (key, team) in enumerate(zip(keys, team_keys)):
+            candidates = self._by_name.get(key)
+            if candidates:
+                rows[i] = self._pick(candidates, team)
+                match_type[i], score[i] = 'exact', 1.0
+
+        # Rows already taken are not offered to later tiers
+        claimed = set(rows[rows >= 0].tolist())
+
+        # Tier 2: one name's tokens contained in the other's
+        for i in np.flatnonzero(rows < 0):
+            tokens = frozenset(keys[i].split())
+            if not tokens:
+                continue
+            candidates = {j for t in tokens for j in self._by_token.get(t, [])} - claimed
+            candidates = [j for j in sorted(candidates)
+                          if tokens <= self._tokens[j] or self._tokens[j] <= tokens]
+            candidates = self._narrow(candidates, team_keys[i])
+            if len(candidates) == 1:
+                j = candidates[0]
+                rows[i] = j
+                match_type[i] = 'token'
+                score[i] = len(tokens & self._tokens[j]) / len(tokens | self._tokens[j])
+                claimed.add(j)
+
+        # Tier 3: fuzzy within the team (whole league when the team is unknown)
+        for i in np.flatnonzero(rows < 0):
+            if not keys[i]:
+                continue
+            team = team_keys[i]
+            pool = self._by_team.get(team, []) if team is not None else range(len(self._names))
+            best, best_score = -1, 0.0
+            for j in pool:
+                if j in claimed:
+                    continue
+                ratio = SequenceMatcher(None, keys[i], self._names[j]).ratio()
+                if ratio > best_score:
+                    best, best_score = j, ratio
+            if best >= 0 and best_score >= min_score:
+                rows[i] = best
+                match_type[i], score[i] = 'fuzzy', best_score
+                claimed.add(best)
+
+        matched = rows >= 0
+        result = pd.DataFrame({
+            'understat_row': rows,
+            'official_player_name': None,
+            'understat_player_id': None,
+            'understat_team': None,
+            'match_type': pd.Series(match_type, dtype=object),
+            'match_score': score,
+        }, index=range(len(names))).astype({
+            'official_player_name': object, 'understat_player_id': object, 'understat_team': object,
+        })
+        if matched.any():
+            picked = self.players.iloc[rows[matched]]
+            result.loc[matched, 'official_player_name'] = picked['official_player_name'].to_numpy()
+            result.loc[matched, 'understat_team'] = picked['team'].to_numpy()
+            if 'understat_player_id' in picked:
+                result.loc[matched, 'understat_player_id'] = picked['understat_player_id'].to_numpy()
+        return result
+
+    def _pick(self, candidates: List[int], team: Optional[str]) -> int:
+        """First candidate, preferring one from the player's team."""
+        narrowed = self._narrow(candidates, team)
+        return narrowed[0] if narrowed else candidates[0]
+
+    def _narrow(self, candidates: List[int], team: Optional[str]) -> List[int]:
+        """Keep candidates from the player's team when that leaves any."""
+        if team is None or len(candidates) <= 1:
+            return candidates
+        same_team = [j for j in candidates if self._teams[j] == team]
+        return same_team or candidates
+
+    def _resolve_team(self, team_name: Optional[str]) -> Optional[str]:
+        """Map a team name from any source to the normalized Understat team."""
+        if team_name is None or (isinstance(team_name, float) and np.isnan(team_name)):
+            return None
+        if team_name in self._team_cache:
+            return self._team_cache[team_name]
+
+        resolved = None
+        variations = [_normalize_name(v) for v in _generate_name_variations(str(team_name))]
+        for v in variations:
+            if v in self._by_team:
+                resolved = v
+                break
+        if resolved is None and variations[0]:
+            key = variations[0]
+            contained = [t for t in self._by_team if t and (key in t or t in key)]
+            if len(contained) == 1:
+                resolved = contained[0]
+            else:
+                pool = contained or list(self._by_team)
+                ratios = {t: SequenceMatcher(None, key, t).ratio() for t in pool if t}
+                if ratios:
+                    best = max(ratios, key=ratios.get)
+                    if ratios[best] >= 0.6:
+                        resolved = best
+
+        self._team_cache[team_name] = resolved
+        return resolved
+
+
+def match_players(
+    names: Iterable[str],
+    league: str,
+    season: str,
+    teams: Optional[Iterable[Optional[str]]] = None,
+    min_score: float = 0.85,
+) -> pd.DataFrame:
+    """Resolve a whole list of player names to Understat in one pass.
+
+    Reads the league/season table once (see PlayerMatcher.match for the
+    returned mapping columns).
+    """
+    return PlayerMatcher.from_league(league, season).match(names, teams, min_score=min_score)
+
+
 def extract_shot_events(
     match_id: int,
     league: str,
@@ -240,6 +460,59 @@ def extract_shot_events(
         return pd.DataFrame()
 
 
+def _season_table(league: str, season: str, table: str) -> pd.DataFrame:
+    """Understat read_<table>() for a league/season, memoized in TABLE_CACHE.
+
+    Reloaded when the season's league JSON (or, for team_advanced_stats, the
+    per-team advanced JSON) changes in the scraper cache, or once the
+    league-season cache TTL passes. Treat the result as read-only.
+    """
+    def load() -> pd.DataFrame:
+        understat = Understat(leagues=[league], seasons=[season])
+        return getattr(understat, f"read_{table}")()
+
+    return TABLE_CACHE.get(
+        ("understat", league, season, table),
+        load,
+        lambda: _season_stamp(league, season, table),
+        LEAGUE_TABLE_MAX_AGE,
+    )
+
+
+def _season_stamp(league: str, season: str, table: str) -> Stamp:
+    """Stamp of the scraper cache entries a season table is parsed from (() if unparseable)."""
+    season = str(season)
+    first = season.split('-')[0]
+    # "24-25" / "2024-2025" -> 24, "2425" -> 24
+    yy = first[:2] if '-' not in season and len(first) == 4 else first[-2:]
+    try:
+        season_id = 2000 + int(yy)
+    except ValueError:
+        return ()
+    league_id = _understat_league_id(league)
+    league_glob = "*" if league_id is None else league_id
+    store = get_cache_store()
+    stamp = store.stamp(UNDERSTAT_DATADIR, f"league_{league_glob}_season_{season_id}.json")
+    if table == 'team_advanced_stats':
+        stamp += store.stamp(UNDERSTAT_DATADIR, f"team_*_{season_id}_advanced.json")
+    return stamp
+
+
+_UNDERSTAT_LEAGUE_IDS: Dict[str, int] = {}
+
+
+def _understat_league_id(league: str) -> Optional[int]:
+    """Understat numeric league ID from the cached leagues list (remembered once resolved)."""
+    if league not in _UNDERSTAT_LEAGUE_IDS:
+        try:
+            leagues = Understat(leagues=[league]).read_leagues()
+            _UNDERSTAT_LEAGUE_IDS[league] = int(leagues.loc[league, "league_id"])
+        except Exception as e:
+            logger.debug("Could not resolve Understat league %s: %s", league, e)
+            return None
+    return _UNDERSTAT_LEAGUE_IDS[league]
+
+
 def _find_entity(stats: pd.DataFrame, entity_name: str, entity_type: str,
                  team_name: Optional[str] = None) -> Optional[pd.DataFrame]:
     """Find a player/team row by name with fuzzy matching and team disambiguation."""
@@ -332,30 +605,21 @@ def _generate_name_variations(name: str) -> List[str]:
     return list(dict.fromkeys(variations))
 
 
+def _normalize_name(name: Any) -> str:
+    """Lowercase, strip accents and punctuation, collapse whitespace."""
+    if name is None or (isinstance(name, float) and np.isnan(name)):
+        return ""
+    text = unicodedata.normalize('NFKD', str(name).lower())
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    text = text.replace('ø', 'o').replace('ß', 'ss').replace('ł', 'l').replace('đ', 'd')
+    text = re.sub(r"[^\w\s]", ' ', text)
+    return ' '.join(text.split())
+
+
 def _extract_player_metrics(player_row: pd.DataFrame) -> Dict:
     """Extract raw metrics, compute derived stats (npxG+xA), and per-90 rates."""
     data = {}
-    metrics_map = {
-        'player_id': 'understat_player_id',
-        'team_id': 'understat_team_id',
-        'position': 'understat_position',
-        'matches': 'understat_matches',
-        'minutes': 'understat_minutes',
-        'goals': 'understat_goals',
-        'xg': 'understat_xg',
-        'np_goals': 'understat_np_goals',
-        'np_xg': 'understat_np_xg',
-        'assists': 'understat_assists',
-        'xa': 'understat_xa',
-        'shots': 'understat_shots',
-        'key_passes': 'understat_key_passes',
-        'yellow_cards': 'understat_yellow_cards',
-        'red_cards': 'understat_red_cards',
-        'xg_chain': 'understat_xg_chain',
-        'xg_buildup': 'understat_xg_buildup',
-    }
-
-    for col, key in metrics_map.items():
+    for col, key in PLAYER_METRICS_MAP.items():
         if col in player_row.columns:
             value = player_row.iloc[0][col]
             data[key] = value if pd.notna(value) else None
@@ -383,6 +647,39 @@ def _extract_player_metrics(player_row: pd.DataFrame) -> Dict:
     return data
 
 
+def _league_player_metrics(stats: pd.DataFrame) -> pd.DataFrame:
+    """Vectorized _extract_player_metrics() over a whole read_player_season_stats() frame."""
+    df = stats.reset_index()
+    out = pd.DataFrame({
+        'official_player_name': df['player'].astype(object),
+        'team': df['team'].astype(object),
+    })
+    for col, key in PLAYER_METRICS_MAP.items():
+        if col in df.columns:
+            out[key] = df[col].astype(object).where(df[col].notna(), None)
+
+    def num(key: str) -> pd.Series:
+        if key not in out.columns:
+            return pd.Series(0.0, index=out.index)
+        return pd.to_numeric(out[key], errors='coerce').fillna(0).astype(float)
+
+    np_xg, xa, xg_chain = num('understat_np_xg'), num('understat_xa'), num('understat_xg_chain')
+    out['understat_npxg_plus_xa'] = (np_xg + xa).where((np_xg != 0) | (xa != 0))
+    out['understat_buildup_involvement_pct'] = (xg_chain / np_xg.where(np_xg > 0) * 100).where(xg_chain != 0)
+
+    minutes = num('understat_minutes')
+    p90 = 90 / minutes.where(minutes > 0)
+    out['understat_xg_per90'] = num('understat_xg') * p90
+    out['understat_xa_per90'] = xa * p90
+    out['understat_npxg_per90'] = np_xg * p90
+    out['understat_npxg_plus_xa_per90'] = (np_xg + xa) * p90
+    out['understat_xg_chain_per90'] = xg_chain * p90
+    out['understat_xg_buildup_per90'] = num('understat_xg_buildup') * p90
+    out['understat_key_passes_per90'] = num('understat_key_passes') * p90
+    out['understat_shots_per90'] = num('understat_shots') * p90
+    return out
+
+
 def _calculate_team_metrics(team_matches: pd.DataFrame, team_name: str) -> Dict:
     """Aggregate team metrics across all matches, resolving home/away sides.
 
@@ -661,6 +958,10 @@ def get_teams(teams: List[str], league: str, season: str,
     return extract_multiple(teams, 'team', league, season,
                             max_workers=max_workers, show_progress=show_progress)
 
+def get_league_players(league: str, season: str) -> pd.DataFrame:
+    """Get understat_ metrics for every player in a league/season. Returns DataFrame."""
+    return extract_league_players(league, season)
+
 def get_shots(match_id: int, league: str, season: str,
               player_filter: Optional[str] = None) -> pd.DataFrame:
     """Get shot events for a match, optionally filtered by player."""
@@ -674,8 +975,7 @@ def get_team_advanced(team_name: str, league: str, season: str) -> Optional[Dict
     attackSpeed, result. All keys prefixed with understat_adv_.
     """
     try:
-        understat = Understat(leagues=[league], seasons=[season])
-        adv_df = understat.read_team_advanced_stats()
+        adv_df = _season_table(league, season, 'team_advanced_stats')
 
         if adv_df is None or adv_df.empty:
             return None
@@ -709,7 +1009,7 @@ def get_player_shots(player_name: str, league: str, season: str) -> pd.DataFrame
     try:
         understat = Understat(leagues=[league], seasons=[season])
 
-        stats = understat.read_player_season_stats()
+        stats = _season_table(league, season, 'player_season_stats')
         if stats is None or stats.empty:
             return pd.DataFrame()
 